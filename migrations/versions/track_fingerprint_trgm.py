@@ -0,0 +1,29 @@
+"""track fingerprint trigram index
+
+Revision ID: 3b9e7d41a2c6
+Revises: f28cdce8d9f3
+Create Date: 2026-10-17 09:12:44.306518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e7d41a2c6'
+down_revision: Union[str, Sequence[str], None] = 'f28cdce8d9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_museflow_track_fingerprint_trgm', 'museflow_track', ['fingerprint'], unique=False, postgresql_using='gin', postgresql_ops={'fingerprint': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The extension is left installed: it is harmless, and may be used outside of the project.
+    op.drop_index('ix_museflow_track_fingerprint_trgm', table_name='museflow_track', postgresql_using='gin')
@@ -0,0 +1,88 @@
+"""track provider link lookup table
+
+Revision ID: fbf436a5ef5d
+Revises: 8c1f4b2d6e7a
+Create Date: 2026-10-17 14:03:27.518342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'fbf436a5ef5d'
+down_revision: Union[str, Sequence[str], None] = '8c1f4b2d6e7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('museflow_track_provider_link',
+    sa.Column('track_id', sa.UUID(), nullable=False),
+    sa.Column('provider', postgresql.ENUM('SPOTIFY', name='musicprovider', create_type=False), nullable=False),
+    sa.Column('provider_id', sa.String(length=512), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['track_id'], ['museflow_track.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['museflow_user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('track_id', 'provider', 'provider_id')
+    )
+    op.create_index('ix_museflow_track_provider_link_lookup', 'museflow_track_provider_link', ['user_id', 'provider_id', 'provider'], unique=False)
+
+    # Keep the table in sync with museflow_track.provider_links (see TRACK_PROVIDER_LINK_SYNC_DDL)
+    op.execute("""
+        CREATE FUNCTION museflow_track_provider_link_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO museflow_track_provider_link (track_id, provider, provider_id, user_id)
+            SELECT DISTINCT t.id, upper(elem->>'provider')::musicprovider, elem->>'provider_id', t.user_id
+            FROM new_tracks AS t, jsonb_array_elements(t.provider_links) AS elem;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE FUNCTION museflow_track_provider_link_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM museflow_track_provider_link AS l
+            USING new_tracks AS t JOIN old_tracks AS o ON o.id = t.id
+            WHERE l.track_id = t.id AND t.provider_links IS DISTINCT FROM o.provider_links;
+
+            INSERT INTO museflow_track_provider_link (track_id, provider, provider_id, user_id)
+            SELECT DISTINCT t.id, upper(elem->>'provider')::musicprovider, elem->>'provider_id', t.user_id
+            FROM new_tracks AS t JOIN old_tracks AS o ON o.id = t.id, jsonb_array_elements(t.provider_links) AS elem
+            WHERE t.provider_links IS DISTINCT FROM o.provider_links;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER museflow_track_provider_link_insert
+        AFTER INSERT ON museflow_track
+        REFERENCING NEW TABLE AS new_tracks
+        FOR EACH STATEMENT EXECUTE FUNCTION museflow_track_provider_link_insert()
+    """)
+    op.execute("""
+        CREATE TRIGGER museflow_track_provider_link_update
+        AFTER UPDATE ON museflow_track
+        REFERENCING OLD TABLE AS old_tracks NEW TABLE AS new_tracks
+        FOR EACH STATEMENT EXECUTE FUNCTION museflow_track_provider_link_update()
+    """)
+
+    # Backfill the links of the existing tracks
+    op.execute("""
+        INSERT INTO museflow_track_provider_link (track_id, provider, provider_id, user_id)
+        SELECT DISTINCT t.id, upper(elem->>'provider')::musicprovider, elem->>'provider_id', t.user_id
+        FROM museflow_track AS t, jsonb_array_elements(t.provider_links) AS elem
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS museflow_track_provider_link_update ON museflow_track")
+    op.execute("DROP TRIGGER IF EXISTS museflow_track_provider_link_insert ON museflow_track")
+    op.execute("DROP FUNCTION IF EXISTS museflow_track_provider_link_update()")
+    op.execute("DROP FUNCTION IF EXISTS museflow_track_provider_link_insert()")
+    op.drop_index('ix_museflow_track_provider_link_lookup', table_name='museflow_track_provider_link')
+    op.drop_table('museflow_track_provider_link')
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import timedelta
 
 from museflow.domain.enums import DiscoveryFocus
 from museflow.domain.enums import GenreTag
@@ -17,12 +18,15 @@ class DiscoverTasteConfigInput:
         custom_instructions: Optional freeform instructions for the advisor agent.
         advisor_limit: Number of recommended tracks to request from the advisor.
         reconciler_limit: Maximum number of search candidates per suggestion.
+        reconciler_concurrency: Maximum number of provider searches in flight, for reconciliation and queries alike.
         score_band_width: Width of advisor score bands for tiebreaking by reconciler confidence.
         playlist_limit: Target number of tracks in the generated playlist.
         max_attempts: Maximum number of advisor calls before stopping.
         max_tracks_per_artist: Maximum tracks per artist in the final playlist.
         liked_tracks_score_threshold: Minimum user score for a track to be sent to the advisor as a positive example.
         liked_tracks_limit: Maximum number of liked tracks to send (top-scored first).
+        resolution_ttl: How long a suggestion reconciled with a track is remembered across discovery sessions.
+        resolution_negative_ttl: How long a suggestion not reconciled is remembered across discovery sessions.
         dry_run: If True, skip playlist creation.
     """
 
@@ -34,6 +38,7 @@ class DiscoverTasteConfigInput:
 
     advisor_limit: int = 10
     reconciler_limit: int = 10
+    reconciler_concurrency: int = 5
     playlist_limit: int = 10
 
     max_attempts: int = 5
@@ -44,4 +49,7 @@ class DiscoverTasteConfigInput:
     liked_tracks_score_threshold: int = 7
     liked_tracks_limit: int = 200
 
+    resolution_ttl: timedelta = timedelta(days=30)
+    resolution_negative_ttl: timedelta = timedelta(days=1)
+
     dry_run: bool = False
@@ -7,7 +7,8 @@ from pathlib import Path
 class StreamingHistoryImportConfigInput:
     directory: Path
     min_ms_played: int = 30_000
-    batch_size: int = 20
+    batch_size: int = 5_000
+    jobs: int = 1
     purge: bool = False
 
 
@@ -20,9 +21,39 @@ class StreamingHistoryEntry:
     played_at: datetime
 
 
+@dataclass(kw_only=True, slots=True)
+class StreamingHistoryTrackAggregate:
+    """Play summary of a single track fingerprint.
+
+    Mutable on purpose: aggregating hundreds of thousands of plays must not allocate a new object per play.
+    The metadata (name, artist, album, provider_id) is the one of the first entry seen for the fingerprint.
+    """
+
+    name: str
+    artist: str
+    album_name: str | None
+    provider_id: str
+    played_at_first: datetime
+    played_at_last: datetime
+    played_count: int = 1
+
+
 @dataclass(frozen=True, kw_only=True)
 class StreamingHistoryFileStats:
     items_read: int = 0
     items_skipped_no_timestamp: int = 0
     items_skipped_short_play: int = 0
     items_skipped_no_track_id: int = 0
+    items_skipped_already_imported: int = 0
+
+    # Time range of the valid plays of the file, None if it has none.
+    played_at_first: datetime | None = None
+    played_at_last: datetime | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class StreamingHistoryFileInfo:
+    name: str
+    size: int
+    modified_at: datetime
+    content_hash: str
@@ -0,0 +1,60 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date
+
+from museflow.domain.enums import EnrichField
+from museflow.domain.enums import GenreTag
+from museflow.domain.enums import MoodTag
+from museflow.domain.enums import MusicProvider
+from museflow.domain.enums import PlaylistType
+from museflow.domain.enums import TrackSource
+from museflow.domain.types import LocaleCode
+
+
+@dataclass(frozen=True, kw_only=True)
+class TrackFilter:
+    """Criteria the tracks of a user must all match to be selected. Unset criteria select every track.
+
+    Attributes:
+        provider: A provider to filter on.
+        provider_ids: Only the tracks whose provider_id is in this list.
+        min_score: Only the tracks with score >= min_score.
+        max_score: Only the tracks with score <= max_score.
+        source: Only the tracks whose source bit includes this flag.
+        unrated_only: When True, only the tracks with no score.
+        exclude_skipped: When True, the tracks whose score_skipped is True are omitted.
+        score_skipped_only: When True, only the tracks whose score_skipped is True.
+        artist_name: Only the tracks whose primary artist (first in the artists list) matches this name
+                     (case-insensitive).
+        played_first_min: Only the tracks first played on or after this date.
+        played_first_max: Only the tracks first played on or before this date.
+        played_last_min: Only the tracks last played on or after this date.
+        played_last_max: Only the tracks last played on or before this date.
+        exclude_ids: The tracks whose id is in this list are excluded.
+        exclude_in_playlist_type: The tracks already placed in a playlist of this type (e.g. history playlists)
+                                  are excluded.
+        missing_fields: Only the tracks missing at least one of the given enrichment fields.
+        genres: Only the tracks whose genres array overlaps (OR) with any listed tag.
+        moods: Only the tracks whose moods array overlaps (OR) with any listed tag.
+        locales: Only the tracks whose locale is in this list (OR).
+    """
+
+    provider: MusicProvider | None = None
+    provider_ids: list[str] | None = None
+    min_score: int | None = None
+    max_score: int | None = None
+    source: TrackSource | None = None
+    unrated_only: bool = False
+    exclude_skipped: bool = False
+    score_skipped_only: bool = False
+    artist_name: str | None = None
+    played_first_min: date | None = None
+    played_first_max: date | None = None
+    played_last_min: date | None = None
+    played_last_max: date | None = None
+    exclude_ids: list[uuid.UUID] | None = None
+    exclude_in_playlist_type: PlaylistType | None = None
+    missing_fields: frozenset[EnrichField] | None = None
+    genres: list[GenreTag] | None = None
+    moods: list[MoodTag] | None = None
+    locales: list[LocaleCode] | None = None
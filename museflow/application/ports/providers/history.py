@@ -1,15 +1,79 @@
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
+from datetime import datetime
 from pathlib import Path
 
 from museflow.application.inputs.history import StreamingHistoryEntry
+from museflow.application.inputs.history import StreamingHistoryFileInfo
 from museflow.application.inputs.history import StreamingHistoryFileStats
+from museflow.application.inputs.history import StreamingHistoryTrackAggregate
+
+type FileAggregates = tuple[dict[str, StreamingHistoryTrackAggregate], StreamingHistoryFileStats]
 
 
 class StreamingHistoryPort(ABC):
     @abstractmethod
-    async def parse_file(
+    def iter_entries(
         self,
         path: Path,
         min_ms_played: int,
-    ) -> tuple[list[StreamingHistoryEntry], StreamingHistoryFileStats]: ...
+    ) -> Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats]:
+        """Lazily yields the play events of a file, one at a time, so a file is never held in memory.
+
+        Filtered-out items are only counted: the stats are the generator return value,
+        available once it is exhausted (see `StreamingHistoryAggregator.consume`).
+
+        Raises:
+            StreamingHistoryInvalidFormat: While iterating, if the file cannot be parsed.
+        """
+        ...
+
+    @abstractmethod
+    def aggregate_files(
+        self,
+        paths: list[Path],
+        min_ms_played: int,
+        jobs: int = 1,
+        imported_ranges: list[tuple[datetime, datetime]] | None = None,
+    ) -> AsyncGenerator[FileAggregates]:
+        """Parses each file and reduces its play events to one aggregate per track fingerprint.
+
+        Results are yielded as soon as they are available, while the next files are still being
+        parsed. Parsing does not run more than `jobs` files ahead of the consumer.
+
+        Args:
+            jobs: Number of worker processes the files are fanned out to. With 1, files are parsed
+                  one after the other in a background thread.
+            imported_ranges: Play time ranges already imported by a previous run. Plays within
+                  them are counted as skipped instead of being aggregated again.
+
+        Yields:
+            One (aggregates keyed by fingerprint, stats) pair per path, in the same order as `paths`.
+
+        Raises:
+            StreamingHistoryInvalidFormat: If a file cannot be parsed.
+        """
+        ...
+
+    @abstractmethod
+    async def list_files(self, path: Path) -> list[Path]:
+        """Returns the JSON files of a directory, or of a ZIP export archive, sorted by path.
+
+        The members of an archive are addressed as `<archive>/<member>` paths: they are read straight
+        from the archive by the other methods, without being extracted on disk.
+
+        Raises:
+            StreamingHistoryDirectoryNotFound: If the path is neither a directory nor a ZIP archive.
+        """
+        ...
+
+    @abstractmethod
+    async def describe_files(self, paths: list[Path]) -> list[StreamingHistoryFileInfo]:
+        """Returns the size, modification time and content hash of each file, in the same order as `paths`.
+
+        The name of a file is its path relative to the listed directory or archive, which identifies it in the
+        import manifest.
+        """
+        ...
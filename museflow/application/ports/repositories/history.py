@@ -0,0 +1,23 @@
+import uuid
+from abc import ABC
+from abc import abstractmethod
+
+from museflow.domain.entities.history import HistoryManifestEntry
+from museflow.domain.enums import MusicProvider
+
+
+class HistoryManifestRepository(ABC):
+    """Port for the manifest of streaming history files already imported by a user."""
+
+    @abstractmethod
+    async def get_list(self, user_id: uuid.UUID, provider: MusicProvider) -> list[HistoryManifestEntry]: ...
+
+    @abstractmethod
+    async def bulk_upsert(self, entries: list[HistoryManifestEntry]) -> None:
+        """Inserts or replaces entries, identified by (user_id, provider, file_name)."""
+        ...
+
+    @abstractmethod
+    async def purge(self, user_id: uuid.UUID, provider: MusicProvider) -> int:
+        """Deletes all manifest entries of the user for the provider. Returns the number of deleted rows."""
+        ...
@@ -0,0 +1,39 @@
+import uuid
+from abc import ABC
+from abc import abstractmethod
+from datetime import timedelta
+
+from museflow.domain.enums import MusicProvider
+from museflow.domain.value_objects.track import TrackResolution
+
+
+class TrackResolutionRepository(ABC):
+    """Port for the resolutions of the suggested tracks, shared by all the users and discovery sessions."""
+
+    @abstractmethod
+    async def get_many(
+        self,
+        user_id: uuid.UUID,
+        keys: list[str],
+        provider: MusicProvider,
+        ttl: timedelta,
+        negative_ttl: timedelta,
+    ) -> dict[str, TrackResolution]:
+        """Retrieves the resolutions of the given suggested tracks which have not expired yet.
+
+        Args:
+            user_id: The user the resolved tracks are built for, as new tracks.
+            keys: The fingerprints of the suggested tracks.
+            provider: The music provider the suggestions were resolved with.
+            ttl: How long the resolution of a reconciled suggestion is kept.
+            negative_ttl: How long the resolution of a suggestion which was not reconciled is kept.
+
+        Returns:
+            The resolutions found, keyed by fingerprint.
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_upsert(self, resolutions: list[TrackResolution], provider: MusicProvider) -> None:
+        """Inserts or replaces resolutions, identified by (provider, key). When several share a key, the last one wins."""
+        ...
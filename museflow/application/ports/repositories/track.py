@@ -1,17 +1,23 @@
 import uuid
 from abc import ABC
 from abc import abstractmethod
-from datetime import date
+from collections.abc import AsyncGenerator
+from typing import Any
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.entities.track import Track
+from museflow.domain.enums import ArtistOrderBy
 from museflow.domain.enums import EnrichField
-from museflow.domain.enums import GenreTag
-from museflow.domain.enums import MoodTag
 from museflow.domain.enums import MusicProvider
+from museflow.domain.enums import TagOrderBy
+from museflow.domain.enums import TrackField
 from museflow.domain.enums import TrackSource
-from museflow.domain.types import LocaleCode
 from museflow.domain.types import TrackOrdering
+from museflow.domain.types import TrackRow
+from museflow.domain.value_objects.track import ArtistAggregate
+from museflow.domain.value_objects.track import TagAggregate
 from museflow.domain.value_objects.track import TrackKnowIdentifiers
+from museflow.domain.value_objects.track import TrackPatchResult
 
 
 class TrackRepository(ABC):
@@ -21,24 +27,7 @@ class TrackRepository(ABC):
     async def get_list(
         self,
         user_id: uuid.UUID,
-        provider: MusicProvider | None = None,
-        provider_ids: list[str] | None = None,
-        min_score: int | None = None,
-        max_score: int | None = None,
-        source: TrackSource | None = None,
-        unrated_only: bool = False,
-        exclude_skipped: bool = False,
-        score_skipped_only: bool = False,
-        artist_name: str | None = None,
-        played_first_min: date | None = None,
-        played_first_max: date | None = None,
-        played_last_min: date | None = None,
-        played_last_max: date | None = None,
-        exclude_ids: list[uuid.UUID] | None = None,
-        missing_fields: frozenset[EnrichField] | None = None,
-        genres: list[GenreTag] | None = None,
-        moods: list[MoodTag] | None = None,
-        locales: list[LocaleCode] | None = None,
+        track_filter: TrackFilter | None = None,
         order: TrackOrdering | None = None,
         offset: int | None = None,
         limit: int | None = None,
@@ -47,39 +36,139 @@ class TrackRepository(ABC):
 
         Args:
             user_id: The ID of the user whose tracks are to be retrieved.
-            provider: A provider to filter on.
-            provider_ids: Filter to only return tracks whose provider_id is in this list.
+            track_filter: The criteria the tracks must match, all the tracks of the user if omitted.
             order: Ordered list of (column, direction) tuples. Defaults to [(CREATED_AT, ASC)].
-                   Use RANDOM as the sole entry for random ordering. Nullable columns
-                   always sort NULLs last regardless of direction. Ignored when min_score is set
-                   and order is not explicitly provided (falls back to score descending).
+                   Use RANDOM as the sole entry for random ordering: with a limit and no offset,
+                   the tracks are then sampled without sorting them all, each one being the first
+                   track at or after a random point of their random keys. The sample is therefore
+                   not exactly uniform: a track following a wide gap between keys is picked more
+                   often. Under a selective filter, each pick may also scan many non-matching
+                   tracks before finding one. Nullable columns
+                   always sort NULLs last regardless of direction. Ignored when the filter has a
+                   min_score and order is not explicitly provided (falls back to score descending,
+                   so the highest-rated tracks come first when limit is applied).
             offset: The number of tracks to skip before starting to collect the result set.
             limit: The maximum number of tracks to return.
-            min_score: When set, only tracks with score >= min_score are returned. If order is
-                       not explicitly provided, results are ordered by score descending so the
-                       highest-rated tracks come first when limit is applied.
-            max_score: When set, only tracks with score <= max_score are returned.
-            source: When set, only tracks whose source bit includes this flag are returned.
-            unrated_only: When True, only tracks with no score are returned.
-            exclude_skipped: When True, tracks whose score_skipped is True are omitted.
-            score_skipped_only: When True, only tracks whose score_skipped is True are returned.
-            artist_name: When set, only tracks whose primary artist (first in the artists list)
-                         matches this name (case-insensitive) are returned.
-            played_first_min: When set, only tracks first played on or after this date are returned.
-            played_first_max: When set, only tracks first played on or before this date are returned.
-            played_last_min: When set, only tracks last played on or after this date are returned.
-            played_last_max: When set, only tracks last played on or before this date are returned.
-            exclude_ids: When set, tracks whose id is in this list are excluded.
-            missing_fields: When set, only tracks missing at least one of the given enrichment fields are returned.
-            genres: When set, only tracks whose genres array overlaps (OR) with any listed tag are returned.
-            moods: When set, only tracks whose moods array overlaps (OR) with any listed tag are returned.
-            locales: When set, only tracks whose locale is in this list (OR) are returned.
 
         Returns:
             A list of `Track` entities.
         """
         ...
 
+    @abstractmethod
+    async def get_rows(
+        self,
+        fields: list[TrackField],
+        user_id: uuid.UUID,
+        track_filter: TrackFilter | None = None,
+        order: TrackOrdering | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> list[TrackRow]:
+        """Same as :meth:`get_list`, but only the given fields are selected.
+
+        The rows are lightweight dicts built straight from the selected columns, without building
+        `Track` entities: their keys are the given fields. Enumerated columns are returned as raw
+        values (e.g. ``genres`` as strings).
+
+        Args:
+            fields: The track fields to select.
+
+            See :meth:`get_list` for the filter, ordering and pagination.
+
+        Returns:
+            A list of `TrackRow` dicts.
+        """
+        ...
+
+    @abstractmethod
+    def iter_rows(
+        self,
+        fields: list[TrackField],
+        user_id: uuid.UUID,
+        track_filter: TrackFilter | None = None,
+        chunk_size: int = 1_000,
+    ) -> AsyncGenerator[list[TrackRow]]:
+        """Iterates over the rows of :meth:`get_rows` of all the tracks of a user matching the filter, chunk by chunk.
+
+        Unlike :meth:`get_rows`, the rows are never all loaded at once: each chunk is fetched
+        on demand, in creation order, so whole-library scans run in constant memory.
+
+        Args:
+            fields: The track fields to select.
+            user_id: The ID of the user whose tracks are to be retrieved.
+            track_filter: The criteria the tracks must match, all the tracks of the user if omitted.
+            chunk_size: The maximum number of rows per chunk.
+
+        Yields:
+            Lists of at most `chunk_size` `TrackRow` dicts.
+        """
+        ...
+
+    @abstractmethod
+    async def aggregate_by_artist(
+        self,
+        user_id: uuid.UUID,
+        source: TrackSource | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        confidence: int = 0,
+        max_tracks: int | None = None,
+        min_rate_avg: float | None = None,
+        order_by: ArtistOrderBy = ArtistOrderBy.OVERALL,
+        limit: int | None = None,
+    ) -> list[ArtistAggregate]:
+        """Aggregates the tracks of a user by primary artist.
+
+        The ratings of an artist are averaged, then smoothed toward the mean of all the ratings (Bayesian
+        average): artists with fewer rated tracks than `confidence` are pulled toward the mean. The overall
+        score blends breadth (tracks), depth (plays) and the smoothed quality relative to the mean.
+
+        Args:
+            user_id: The ID of the user whose tracks are aggregated.
+            source: A track source to filter on.
+            min_score: Only the ratings greater than or equal to this score are counted as rated.
+            max_score: Only the ratings less than or equal to this score are counted as rated.
+            confidence: The Bayesian confidence constant of the quality score.
+            max_tracks: Only keep the artists with at most this number of tracks.
+            min_rate_avg: Only keep the artists whose average rating is at least this value.
+            order_by: The ranking of the artists, best first (ties are sorted by artist name).
+            limit: The maximum number of artists to return.
+
+        Returns:
+            A list of ArtistAggregate value objects.
+        """
+        ...
+
+    @abstractmethod
+    async def aggregate_by_tag(
+        self,
+        user_id: uuid.UUID,
+        field: EnrichField,
+        source: TrackSource | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        order_by: TagOrderBy = TagOrderBy.TRACK_COUNT,
+        limit: int | None = None,
+    ) -> list[TagAggregate]:
+        """Aggregates the tracks of a user by tag: each genre, mood or locale of the tracks.
+
+        A track with several genres (or moods) is counted once for each of them. Tracks without tag are ignored.
+
+        Args:
+            user_id: The ID of the user whose tracks are aggregated.
+            field: The tag field to aggregate on.
+            source: A track source to filter on.
+            min_score: Only the ratings greater than or equal to this score are counted as rated.
+            max_score: Only the ratings less than or equal to this score are counted as rated.
+            order_by: The ranking of the tags, best first (ties are sorted by tag).
+            limit: The maximum number of tags to return.
+
+        Returns:
+            A list of TagAggregate value objects.
+        """
+        ...
+
     @abstractmethod
     async def get_known_identifiers(self, user_id: uuid.UUID, fingerprints: list[str]) -> TrackKnowIdentifiers:
         """
@@ -95,34 +184,84 @@ class TrackRepository(ABC):
         ...
 
     @abstractmethod
-    async def bulk_upsert(self, tracks: list[Track], batch_size: int) -> tuple[list[uuid.UUID], int]:
+    async def search_catalog(
+        self,
+        user_id: uuid.UUID,
+        fingerprints: list[str],
+        provider: MusicProvider,
+        limit: int,
+    ) -> list[list[Track]]:
+        """Looks up the local catalog for the tracks closest to each of the given fingerprints.
+
+        The catalog is made of the tracks of all the users linked to the provider, matched by
+        trigram similarity of their fingerprint, i.e. of their normalized name and primary artist.
+        It resolves known tracks without searching the provider.
+
+        Args:
+            user_id: The user the candidate tracks are built for.
+            fingerprints: The fingerprints to look up.
+            provider: Only the tracks linked to this provider are candidates.
+            limit: The maximum number of candidates per fingerprint, most similar first.
+
+        Returns:
+            The candidate tracks of each fingerprint, in the same order. Candidates are new tracks
+            of the user, only carrying the name, artists, album and links to the provider.
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_ingest(
+        self,
+        tracks: list[Track],
+        increment_played_count: bool = False,
+        commit: bool = True,
+    ) -> tuple[dict[str, uuid.UUID], int]:
         """Performs a bulk "upsert" (insert or update) of track records.
 
-        This method efficiently handles large batches of tracks, inserting new ones
-        and updating existing ones based on a unique constraint (e.g., user ID + provider ID).
+        All the tracks are streamed to the database at once and merged in a single statement,
+        inserting new ones and updating existing ones based on a unique constraint (user ID + fingerprint).
+        Tracks must have distinct fingerprints.
 
         Args:
-            tracks: A list of `Track` entities to upsert.
-            batch_size: The number of records to process in each batch.
+            tracks: The tracks to upsert.
+            increment_played_count: If True, the `played_count` of existing tracks is increased
+                by the given one instead of being replaced, for incremental history imports.
+            commit: Whether to commit the transaction. Without commit, the writes are committed along with the next
+                    write of the unit of work which does (e.g. the history import manifest).
 
         Returns:
-            A tuple containing a list of the UUIDs of the upserted tracks and the
-            total number of created rows.
+            A tuple containing the UUIDs of the upserted tracks keyed by their fingerprint,
+            and the total number of created rows.
 
         Note:
             Some fields might be intentionally excluded from the ON CONFLICT DO UPDATE clause
             to protect enrichment data and user decisions from being overwritten by re-imports.
-            Use :meth:`bulk_update` to write those fields explicitly.
+            Use :meth:`bulk_patch` to write those fields explicitly.
         """
         ...
 
     @abstractmethod
-    async def bulk_update(self, tracks: list[Track], fields: frozenset[EnrichField]) -> None:
-        """Updates specific enrichment fields for a batch of existing tracks.
+    async def bulk_patch(
+        self,
+        user_id: uuid.UUID,
+        rows: list[dict[TrackField, Any]],
+        fields: frozenset[TrackField],
+        key: TrackField = TrackField.ID,
+    ) -> TrackPatchResult:
+        """Writes some fields of a batch of existing tracks, without loading them.
+
+        Each chunk of rows is applied by a single statement. When several rows share the same key,
+        the last one wins.
 
         Args:
-            tracks: Track entities carrying the new field values (identified by ``id``).
-            fields: Enrichment fields to write. Only these fields are updated; all others are left untouched.
+            user_id: Only the tracks of this user are patched.
+            rows: The key and the new values of the fields to write, for each track.
+            fields: Fields to write, among score, score_skipped, genres, moods and locale.
+                All the other fields are left untouched.
+            key: Field identifying the tracks, either ``TrackField.ID`` or ``TrackField.FINGERPRINT``.
+
+        Returns:
+            The keys which matched a track of the user and the ones which did not.
         """
         ...
 
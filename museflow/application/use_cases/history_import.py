@@ -1,27 +1,37 @@
+import asyncio
 import logging
+from contextlib import aclosing
 from dataclasses import dataclass
-from datetime import datetime
 
-from museflow.application.inputs.history import StreamingHistoryEntry
+from museflow.application.inputs.history import StreamingHistoryFileInfo
+from museflow.application.inputs.history import StreamingHistoryFileStats
 from museflow.application.inputs.history import StreamingHistoryImportConfigInput
+from museflow.application.inputs.history import StreamingHistoryTrackAggregate
+from museflow.application.ports.providers.history import FileAggregates
 from museflow.application.ports.providers.history import StreamingHistoryPort
+from museflow.application.ports.repositories.history import HistoryManifestRepository
 from museflow.application.ports.repositories.track import TrackRepository
+from museflow.application.utils.history import StreamingHistoryAggregator
+from museflow.domain.entities.history import HistoryManifestEntry
 from museflow.domain.entities.track import ProviderLink
 from museflow.domain.entities.track import Track
 from museflow.domain.entities.user import User
 from museflow.domain.enums import MusicProvider
 from museflow.domain.exceptions import StreamingHistoryDirectoryNotFound
-from museflow.domain.utils.text import generate_fingerprint
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True, kw_only=True)
 class ImportStreamingHistoryReport:
+    files_read: int = 0
+    files_skipped_unchanged: int = 0
+
     items_read: int = 0
     items_skipped_no_timestamp: int = 0
     items_skipped_short_play: int = 0
     items_skipped_no_track_id: int = 0
+    items_skipped_already_imported: int = 0
 
     unique_track_ids: int = 0
 
@@ -37,13 +47,25 @@ class ImportStreamingHistoryUseCase:
     """
     Import a user's Spotify streaming history from exported JSON files.
 
-    Parses all JSON files in the given directory, filters entries by minimum
-    playback duration, deduplicates track IDs, and bulk-upserts them into
-    the repository directly from file metadata — no external API calls.
+    Parses all JSON files in the given directory, or in the export ZIP archive without
+    extracting it, filters entries by minimum playback duration, deduplicates track IDs,
+    and bulk-upserts them into the repository directly from file metadata — no external API calls.
+
+    Imported files are recorded in a manifest: on the next run, unchanged files are
+    skipped and only the plays of new or changed files that were not imported yet are
+    added to the existing play counts.
     """
 
-    def __init__(self, track_repository: TrackRepository, streaming_history: StreamingHistoryPort) -> None:
+    _PIPELINE_QUEUE_SIZE: int = 2
+
+    def __init__(
+        self,
+        track_repository: TrackRepository,
+        history_manifest_repository: HistoryManifestRepository,
+        streaming_history: StreamingHistoryPort,
+    ) -> None:
         self._track_repository = track_repository
+        self._history_manifest_repository = history_manifest_repository
         self._streaming_history = streaming_history
 
     async def import_history(
@@ -51,12 +73,12 @@ class ImportStreamingHistoryUseCase:
         user: User,
         config: StreamingHistoryImportConfigInput,
     ) -> ImportStreamingHistoryReport:
-        # Validate directory
-        if not config.directory.exists() or not config.directory.is_dir():
+        # Validate directory or ZIP archive
+        if not config.directory.exists():
             raise StreamingHistoryDirectoryNotFound(f"Directory not found: {config.directory}")
 
         # Validate files
-        json_files = sorted(config.directory.glob("*.json"))
+        json_files = await self._streaming_history.list_files(config.directory)
         if not json_files:
             raise StreamingHistoryDirectoryNotFound(f"No JSON files found in: {config.directory}")
 
@@ -67,104 +89,176 @@ class ImportStreamingHistoryUseCase:
                 user_id=user.id,
                 provider=MusicProvider.SPOTIFY,
             )
+            await self._history_manifest_repository.purge(user_id=user.id, provider=MusicProvider.SPOTIFY)
             logger.info("History tracks purged.\n")
 
-        # Collect all play events per track across all files, keyed by fingerprint.
-        # When two provider_ids resolve to the same fingerprint, their play times are merged.
-        # The first entry seen for a given fingerprint is kept as representative metadata.
-        track_metadata: dict[str, StreamingHistoryEntry] = {}  # fingerprint → representative entry
-        track_play_times: dict[str, list[datetime]] = {}  # fingerprint → all played_at timestamps
-        items_read = items_skipped_no_timestamp = items_skipped_short_play = items_skipped_no_track_id = 0
-
-        for path in json_files:
-            entries, stats = await self._streaming_history.parse_file(path=path, min_ms_played=config.min_ms_played)
-
-            for entry in entries:
-                fp = generate_fingerprint(name=entry.name, artist_names=[entry.artist])
-                if fp not in track_metadata:
-                    track_metadata[fp] = entry
-                    track_play_times[fp] = []
-                track_play_times[fp].append(entry.played_at)
-
-            items_read += stats.items_read
-            items_skipped_no_timestamp += stats.items_skipped_no_timestamp
-            items_skipped_short_play += stats.items_skipped_short_play
-            items_skipped_no_track_id += stats.items_skipped_no_track_id
-
-        unique_fingerprints = set(track_metadata.keys())
-        logger.info(f"Collected {len(unique_fingerprints)} unique fingerprints.")
-
-        # Filter already-known fingerprints
-        known_fingerprints: frozenset[str] = frozenset()
-        if unique_fingerprints:
-            known_identifiers = await self._track_repository.get_known_identifiers(
+        # Skip the files already imported with the same content
+        manifest = {
+            entry.file_name: entry
+            for entry in await self._history_manifest_repository.get_list(
                 user_id=user.id,
-                fingerprints=list(unique_fingerprints),
+                provider=MusicProvider.SPOTIFY,
             )
-            known_fingerprints = known_identifiers.fingerprints
-        unknown_fingerprints = unique_fingerprints - known_fingerprints
-        logger.info(f"Collected {len(unknown_fingerprints)} unknown fingerprints.")
-
-        # Refresh play data for already-known tracks (upsert uses GREATEST/LEAST — safe to re-run)
-        tracks_played_at_updated = 0
-        if known_fingerprints:
-            updated_tracks = [
-                Track(
-                    user_id=user.id,
-                    provider_links=[
-                        ProviderLink(provider=MusicProvider.SPOTIFY, provider_id=track_metadata[fp].provider_id)
-                    ],
-                    name=track_metadata[fp].name,
-                    artists=[track_metadata[fp].artist],
-                    album_name=track_metadata[fp].album_name,
-                    played_at_last=max(track_play_times[fp]),
-                    played_at_first=min(track_play_times[fp]),
-                    played_count=len(track_play_times[fp]),
-                )
-                for fp in known_fingerprints
-            ]
-            await self._track_repository.bulk_upsert(tracks=updated_tracks, batch_size=config.batch_size)
-            tracks_played_at_updated = len(updated_tracks)
-            logger.info(f"Refreshed play data for {tracks_played_at_updated} already-known tracks.")
-
-        # Build Track entities for new tracks and upsert in batches
-        logger.info(f"\nUpserting {len(unknown_fingerprints)} new tracks from file metadata.")
+        }
+        # Matched on the content only: the same file is not imported again whether it is read from the export archive
+        # or from a directory (where it is not keyed by the same path).
+        imported_hashes = {entry.content_hash for entry in manifest.values()}
+        files_info = await self._streaming_history.describe_files(json_files)
+        changed_files = [
+            (path, info)
+            for path, info in zip(json_files, files_info, strict=True)
+            if info.content_hash not in imported_hashes
+        ]
+        files_skipped_unchanged = len(json_files) - len(changed_files)
+        logger.info(f"Skipped {files_skipped_unchanged} unchanged files.")
+
+        # Without manifest, the play counts are computed from scratch and replace the stored ones.
+        # Otherwise, only the plays out of the already imported ranges are added to them.
+        incremental = bool(manifest)
+        imported_ranges = [
+            (entry.played_at_first, entry.played_at_last)
+            for entry in manifest.values()
+            if entry.played_at_first is not None and entry.played_at_last is not None
+        ]
+
+        # Aggregate play events per track across all files, keyed by fingerprint.
+        # Files are parsed (possibly in parallel worker processes) into per-file aggregates,
+        # then merged in file order so the first entry seen stays the representative metadata.
+        aggregator = StreamingHistoryAggregator()
+        files_stats: list[StreamingHistoryFileStats] = []
+        known_fingerprints: set[str] = set()
         tracks_created = 0
-        unknown_fps = list(unknown_fingerprints)
-
-        for offset in range(0, len(unknown_fps), config.batch_size):
-            chunk_fps = unknown_fps[offset : offset + config.batch_size]
-            chunk_tracks = [
-                Track(
-                    user_id=user.id,
-                    provider_links=[
-                        ProviderLink(provider=MusicProvider.SPOTIFY, provider_id=track_metadata[fp].provider_id)
-                    ],
-                    name=track_metadata[fp].name,
-                    artists=[track_metadata[fp].artist],
-                    album_name=track_metadata[fp].album_name,
-                    played_at_last=max(track_play_times[fp]),
-                    played_at_first=min(track_play_times[fp]),
-                    played_count=len(track_play_times[fp]),
+
+        # Pipeline: the next files are parsed while the tracks of the previous ones are written.
+        # The bounded queue provides the backpressure: parsing pauses when the database lags behind.
+        # Lookups and upserts share the same DB session, hence run in the same (write) stage.
+        queue: asyncio.Queue[FileAggregates | None] = asyncio.Queue(maxsize=self._PIPELINE_QUEUE_SIZE)
+
+        async def parse_stage() -> None:
+            async with aclosing(
+                self._streaming_history.aggregate_files(
+                    paths=[path for path, _ in changed_files],
+                    min_ms_played=config.min_ms_played,
+                    jobs=config.jobs,
+                    imported_ranges=imported_ranges,
                 )
-                for fp in chunk_fps
-            ]
-            _, created = await self._track_repository.bulk_upsert(
-                tracks=chunk_tracks,
-                batch_size=config.batch_size,
-            )
-            tracks_created += created
-            logger.info(f"... upserted {min(offset + config.batch_size, len(unknown_fps))} / {len(unknown_fps)}...")
+            ) as files_results:
+                async for file_result in files_results:
+                    await queue.put(file_result)
+            await queue.put(None)
+
+        async def write_stage() -> None:
+            nonlocal tracks_created
+
+            while (file_result := await queue.get()) is not None:
+                aggregates, stats = file_result
+                _, info = changed_files[len(files_stats)]
+                files_stats.append(stats)
+
+                # Only fingerprints not seen in a previous file of this run have to be looked up.
+                new_fingerprints = [fp for fp in aggregates if fp not in aggregator.aggregates]
+                aggregator.merge(aggregates)
+                if new_fingerprints:
+                    known_identifiers = await self._track_repository.get_known_identifiers(
+                        user_id=user.id,
+                        fingerprints=new_fingerprints,
+                    )
+                    known_fingerprints.update(known_identifiers.fingerprints)
+
+                # Tracks are written with the running totals of the run, so the last write of a track
+                # holds its final values. In incremental mode, only the file plays are added up instead.
+                tracks = [
+                    self._build_track(
+                        user=user,
+                        fingerprint=fp,
+                        aggregate=aggregator.aggregates[fp],
+                        played_count=aggregate.played_count if incremental else None,
+                    )
+                    for fp, aggregate in aggregates.items()
+                ]
+                for offset in range(0, len(tracks), config.batch_size):
+                    _, created = await self._track_repository.bulk_ingest(
+                        tracks=tracks[offset : offset + config.batch_size],
+                        increment_played_count=incremental,
+                        commit=False,
+                    )
+                    tracks_created += created
+
+                # The file plays are committed along with its manifest entry: a run interrupted midway can be
+                # resumed without adding the plays of the files already imported twice.
+                await self._history_manifest_repository.bulk_upsert(
+                    [self._build_manifest_entry(user=user, info=info, stats=stats, previous=manifest.get(info.name))]
+                )
+
+                logger.info(f"... imported {len(files_stats)} / {len(changed_files)} files...")
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(parse_stage())
+                task_group.create_task(write_stage())
+        except ExceptionGroup as group:
+            # Only the failing stage error matters, the other one has just been cancelled.
+            raise group.exceptions[0] from None
+
+        logger.info(
+            f"Collected {len(aggregator.aggregates)} unique fingerprints, {len(known_fingerprints)} already known."
+        )
 
         return ImportStreamingHistoryReport(
-            items_read=items_read,
-            items_skipped_no_timestamp=items_skipped_no_timestamp,
-            items_skipped_short_play=items_skipped_short_play,
-            items_skipped_no_track_id=items_skipped_no_track_id,
-            unique_track_ids=len(unique_fingerprints),
+            files_read=len(changed_files),
+            files_skipped_unchanged=files_skipped_unchanged,
+            items_read=sum(stats.items_read for stats in files_stats),
+            items_skipped_no_timestamp=sum(stats.items_skipped_no_timestamp for stats in files_stats),
+            items_skipped_short_play=sum(stats.items_skipped_short_play for stats in files_stats),
+            items_skipped_no_track_id=sum(stats.items_skipped_no_track_id for stats in files_stats),
+            items_skipped_already_imported=sum(stats.items_skipped_already_imported for stats in files_stats),
+            unique_track_ids=len(aggregator.aggregates),
             tracks_already_known=len(known_fingerprints),
-            tracks_played_at_updated=tracks_played_at_updated,
-            plays_total=sum(len(v) for v in track_play_times.values()),
+            tracks_played_at_updated=len(known_fingerprints),
+            plays_total=aggregator.plays_total,
             tracks_created=tracks_created,
             tracks_purged=tracks_purged,
         )
+
+    @staticmethod
+    def _build_track(
+        user: User,
+        fingerprint: str,
+        aggregate: StreamingHistoryTrackAggregate,
+        played_count: int | None = None,
+    ) -> Track:
+        return Track(
+            user_id=user.id,
+            provider_links=[ProviderLink(provider=MusicProvider.SPOTIFY, provider_id=aggregate.provider_id)],
+            name=aggregate.name,
+            artists=[aggregate.artist],
+            album_name=aggregate.album_name,
+            fingerprint=fingerprint,
+            played_at_last=aggregate.played_at_last,
+            played_at_first=aggregate.played_at_first,
+            played_count=aggregate.played_count if played_count is None else played_count,
+        )
+
+    @staticmethod
+    def _build_manifest_entry(
+        user: User,
+        info: StreamingHistoryFileInfo,
+        stats: StreamingHistoryFileStats,
+        previous: HistoryManifestEntry | None,
+    ) -> HistoryManifestEntry:
+        # A changed file keeps covering the range imported from its previous version.
+        played_at_firsts = [stats.played_at_first, previous.played_at_first if previous else None]
+        played_at_lasts = [stats.played_at_last, previous.played_at_last if previous else None]
+        played_at_first = min((dt for dt in played_at_firsts if dt is not None), default=None)
+        played_at_last = max((dt for dt in played_at_lasts if dt is not None), default=None)
+
+        return HistoryManifestEntry(
+            user_id=user.id,
+            provider=MusicProvider.SPOTIFY,
+            file_name=info.name,
+            content_hash=info.content_hash,
+            size=info.size,
+            modified_at=info.modified_at,
+            played_at_first=played_at_first,
+            played_at_last=played_at_last,
+        )
@@ -4,6 +4,7 @@ from datetime import UTC
 from datetime import datetime
 
 from museflow.application.inputs.playlist import PlaylistHistoryConfigInput
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.providers.library import ProviderLibraryPort
 from museflow.application.ports.repositories.playlist import PlaylistRepository
 from museflow.application.ports.repositories.track import TrackRepository
@@ -31,24 +32,22 @@ async def playlist_history(
     playlist_repository: PlaylistRepository,
     provider_library: ProviderLibraryPort,
 ) -> PlaylistHistoryResult:
-    exclude_ids = None
-    if not config.allow_duplicate:
-        exclude_ids = list(await playlist_repository.get_track_ids(user.id, type=PlaylistType.HISTORY))
-
     tracks = await track_repository.get_list(
         user_id=user.id,
-        source=TrackSource.HISTORY,
-        min_score=config.score_min,
-        max_score=config.score_max,
-        artist_name=config.artist_name,
-        genres=config.genres or None,
-        moods=config.moods or None,
-        locales=config.locales or None,
-        played_first_min=config.played_first_min,
-        played_first_max=config.played_first_max,
-        played_last_min=config.played_last_min,
-        played_last_max=config.played_last_max,
-        exclude_ids=exclude_ids,
+        track_filter=TrackFilter(
+            source=TrackSource.HISTORY,
+            min_score=config.score_min,
+            max_score=config.score_max,
+            artist_name=config.artist_name,
+            genres=config.genres or None,
+            moods=config.moods or None,
+            locales=config.locales or None,
+            played_first_min=config.played_first_min,
+            played_first_max=config.played_first_max,
+            played_last_min=config.played_last_min,
+            played_last_max=config.played_last_max,
+            exclude_in_playlist_type=PlaylistType.HISTORY if not config.allow_duplicate else None,
+        ),
         order=[(TrackOrderBy(config.sort_by.value), SortOrder.DESC)],
         limit=config.limit,
     )
@@ -66,8 +65,11 @@ async def playlist_history(
                 return float(max(scores)) if scores else -1.0
             return float(max(t.played_count for t in group_tracks))
 
-        sorted_groups = sorted(groups.values(), key=artist_sort_key, reverse=True)
-        tracks = [track for group in sorted_groups for track in group]
+        artist_groups = list(groups.values())
+        # Random groups keep the order of their first track
+        if config.sort_by != PlaylistHistoryOrderBy.RANDOM:
+            artist_groups.sort(key=artist_sort_key, reverse=True)
+        tracks = [track for group in artist_groups for track in group]
 
     if config.dry_run:
         return PlaylistHistoryResult(playlist=None, tracks=tracks)
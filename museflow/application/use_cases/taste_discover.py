@@ -6,16 +6,18 @@ from datetime import UTC
 from datetime import datetime
 
 from museflow.application.inputs.discovery import DiscoverTasteConfigInput
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.advisors.agent import AdvisorPort
 from museflow.application.ports.providers.library import ProviderLibraryPort
 from museflow.application.ports.repositories.blacklist import BlacklistRepository
 from museflow.application.ports.repositories.playlist import PlaylistRepository
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
 from museflow.application.ports.repositories.taste import TasteProfileRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.application.utils.discovery import TrackScored
 from museflow.application.utils.discovery import apply_artist_cap
 from museflow.application.utils.discovery import filter_known_tracks
-from museflow.application.utils.discovery import reconcile_tracks
+from museflow.application.utils.discovery import reconcile_and_search_tracks
 from museflow.domain.entities.playlist import Playlist
 from museflow.domain.entities.taste import TasteProfileStatus
 from museflow.domain.entities.track import Track
@@ -58,6 +60,7 @@ class DiscoverTasteUseCase:
     def __init__(
         self,
         track_repository: TrackRepository,
+        track_resolution_repository: TrackResolutionRepository,
         taste_profile_repository: TasteProfileRepository,
         blacklist_repository: BlacklistRepository,
         playlist_repository: PlaylistRepository,
@@ -67,6 +70,7 @@ class DiscoverTasteUseCase:
         profiler: TasteProfiler,
     ) -> None:
         self._track_repository = track_repository
+        self._track_resolution_repository = track_resolution_repository
         self._taste_profile_repository = taste_profile_repository
         self._blacklist_repository = blacklist_repository
         self._playlist_repository = playlist_repository
@@ -115,7 +119,7 @@ class DiscoverTasteUseCase:
 
         liked_tracks = await self._track_repository.get_list(
             user_id=user.id,
-            min_score=config.liked_tracks_score_threshold,
+            track_filter=TrackFilter(min_score=config.liked_tracks_score_threshold),
             limit=config.liked_tracks_limit,
         )
 
@@ -146,19 +150,23 @@ class DiscoverTasteUseCase:
                 extra={"strategy_label": strategy.strategy_label},
             )
 
-            # Reconcile recommended tracks
-            logger.debug("--- Reconciliation ---")
-            tracks_reconciled = await reconcile_tracks(
+            # Reconcile recommended tracks and search tracks from strategy's queries, at the same time
+            logger.debug("--- Reconciliation and search queries provider ---")
+            tracks_reconciled, tracks_searched = await reconcile_and_search_tracks(
+                user=user,
                 tracks_suggested=strategy.recommended_tracks,
+                search_queries=strategy.search_queries,
                 limit=config.reconciler_limit,
+                provider=MusicProvider.SPOTIFY,
                 provider_library=self._provider_library,
+                track_repository=self._track_repository,
+                track_resolution_repository=self._track_resolution_repository,
                 reconciler=self._reconciler,
+                ttl=config.resolution_ttl,
+                negative_ttl=config.resolution_negative_ttl,
+                concurrency=config.reconciler_concurrency,
             )
             logger.info(f"Reconciled recommended tracks: {len(tracks_reconciled)}")
-
-            # Search tracks from strategy's queries
-            logger.debug("--- Search queries provider ---")
-            tracks_searched = await self._search_query_tracks(search_queries=strategy.search_queries)
             logger.info(f"Tracks from search queries: {len(tracks_searched)}")
 
             # Merge and intra-attempt dedup
@@ -239,18 +247,12 @@ class DiscoverTasteUseCase:
             replace(t, source=TrackSource.DISCOVERY, played_count=0, played_at_first=None, played_at_last=None)
             for t in tracks
         ]
-        await self._track_repository.bulk_upsert(discovery_tracks, batch_size=100)
+        track_ids, _ = await self._track_repository.bulk_ingest(discovery_tracks)
 
-        # Fetch back to get the actual DB UUIDs (needed for the join table FK)
-        discovery_spotify_ids = [
-            pid for t in discovery_tracks if (pid := t.get_provider_id(MusicProvider.SPOTIFY)) is not None
+        # Carry the actual DB UUIDs (needed for the join table FK), existing tracks keep theirs
+        tracks_with_ids = [
+            replace(t, id=track_ids[t.fingerprint]) for t in discovery_tracks if t.fingerprint in track_ids
         ]
-        tracks_db = await self._track_repository.get_list(
-            user_id=user.id,
-            provider_ids=discovery_spotify_ids,
-        )
-        tracks_db_by_pid = {pid: t for t in tracks_db if (pid := t.get_provider_id(MusicProvider.SPOTIFY)) is not None}
-        tracks_with_ids = [tracks_db_by_pid[pid] for pid in discovery_spotify_ids if pid in tracks_db_by_pid]
 
         playlist = await self._provider_library.create_playlist(
             name=f"[MF] - {strategy.suggested_playlist_name} - {datetime.now(UTC).isoformat(timespec='seconds')}",
@@ -283,22 +285,6 @@ class DiscoverTasteUseCase:
             return True
         return bool({normalize_text(a) for a in track.artists} & blacklist.artist_fingerprints)
 
-    async def _search_query_tracks(self, search_queries: list[str]) -> list[TrackScored]:
-        tracks_scored: list[TrackScored] = []
-
-        for query in search_queries:
-            results = await self._provider_library.search_tracks(
-                track=query,
-                artists=[],
-                page_size=5,
-                log_enabled=False,
-            )
-            tracks_scored.extend(
-                TrackScored(track=track, advisor_score=0.8, reconciler_score=1.0) for track in results
-            )
-
-        return tracks_scored
-
     @staticmethod
     def _dedup_by_identity(tracks_scored: list[TrackScored]) -> list[TrackScored]:
         deduplicated: list[TrackScored] = []
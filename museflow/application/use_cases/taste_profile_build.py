@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import cast
 
 from museflow.application.inputs.taste import BuildTasteProfileConfigInput
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.profilers.taste import TasteProfilerPort
 from museflow.application.ports.repositories.taste import TasteProfileRepository
 from museflow.application.ports.repositories.track import TrackRepository
@@ -37,7 +38,7 @@ class BuildTasteProfileUseCase:
         # Select the most-listened tracks as seeds (best signal quality)
         tracks = await self._track_repository.get_list(
             user_id=user.id,
-            min_score=0 if config.rated_only else None,
+            track_filter=TrackFilter(min_score=0 if config.rated_only else None),
             order=[(TrackOrderBy.PLAYED_COUNT, SortOrder.DESC)],
             limit=config.track_limit,
         )
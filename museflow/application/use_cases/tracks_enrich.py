@@ -1,15 +1,22 @@
-import dataclasses
 import logging
 from dataclasses import dataclass
 
 from museflow.application.inputs.enrich import EnrichTracksConfigInput
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.enrichers.track import TrackEnricherPort
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.domain.entities.user import User
 from museflow.domain.enums import EnrichField
+from museflow.domain.enums import TrackField
 
 logger = logging.getLogger(__name__)
 
+_ENRICH_FIELD_TO_TRACK_FIELD: dict[EnrichField, TrackField] = {
+    EnrichField.GENRE: TrackField.GENRES,
+    EnrichField.MOOD: TrackField.MOODS,
+    EnrichField.LOCALE: TrackField.LOCALE,
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class EnrichTracksReport:
@@ -27,13 +34,14 @@ async def tracks_enrich(
 
     tracks = await track_repository.get_list(
         user_id=user.id,
-        missing_fields=missing_fields,
+        track_filter=TrackFilter(missing_fields=missing_fields),
         limit=config.limit,
     )
 
     if not tracks:
         return EnrichTracksReport(enriched_count=0, error_count=0)
 
+    fields = frozenset(_ENRICH_FIELD_TO_TRACK_FIELD[field] for field in config.fields)
     batches = [tracks[i : i + config.batch_size] for i in range(0, len(tracks), config.batch_size)]
     total_batches = len(batches)
     enriched_count = 0
@@ -49,23 +57,20 @@ async def tracks_enrich(
             error_count += 1
             continue
 
-        enrichment_by_id = {e.track_id: e for e in enrichments}
-        enriched_tracks = []
-        for track in batch:
-            if track.id in enrichment_by_id:
-                e = enrichment_by_id[track.id]
-                enriched = track
-
-                if EnrichField.GENRE in config.fields:
-                    enriched = dataclasses.replace(enriched, genres=e.genres)
-                if EnrichField.MOOD in config.fields:
-                    enriched = dataclasses.replace(enriched, moods=e.moods)
-                if EnrichField.LOCALE in config.fields:
-                    enriched = dataclasses.replace(enriched, locale=e.locale)
-
-                enriched_tracks.append(enriched)
+        # Only the enriched fields are written back, without touching the other ones.
+        batch_ids = {track.id for track in batch}
+        rows = [
+            {
+                TrackField.ID: e.track_id,
+                TrackField.GENRES: e.genres,
+                TrackField.MOODS: e.moods,
+                TrackField.LOCALE: e.locale,
+            }
+            for e in enrichments
+            if e.track_id in batch_ids
+        ]
 
-        await track_repository.bulk_update(enriched_tracks, fields=config.fields)
+        await track_repository.bulk_patch(user_id=user.id, rows=rows, fields=fields)
         enriched_count += len(batch)
         logger.info(
             f"Enriched batch {i}/{total_batches} ({len(batch)} tracks)",
@@ -1,15 +1,21 @@
+import asyncio
 import logging
 from collections import Counter
 from dataclasses import dataclass
+from datetime import timedelta
 
 from museflow.application.ports.providers.library import ProviderLibraryPort
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.domain.entities.track import Track
 from museflow.domain.entities.track import TrackSuggested
 from museflow.domain.entities.user import User
+from museflow.domain.enums import MusicProvider
+from museflow.domain.services.fingerprint import fingerprint_service
 from museflow.domain.services.reconciler import Reconciler
 from museflow.domain.types import ScoreAdvisor
 from museflow.domain.types import ScoreReconciler
+from museflow.domain.value_objects.track import TrackResolution
 
 logger = logging.getLogger(__name__)
 
@@ -21,27 +27,111 @@ class TrackScored:
     reconciler_score: ScoreReconciler
 
 
-async def reconcile_tracks(
+async def reconcile_and_search_tracks(
+    user: User,
     tracks_suggested: list[TrackSuggested],
+    search_queries: list[str],
     limit: int,
+    provider: MusicProvider,
     provider_library: ProviderLibraryPort,
+    track_repository: TrackRepository,
+    track_resolution_repository: TrackResolutionRepository,
     reconciler: Reconciler,
-) -> list[TrackScored]:
-    tracks_reconciled: list[TrackScored] = []
+    ttl: timedelta,
+    negative_ttl: timedelta,
+    concurrency: int,
+) -> tuple[list[TrackScored], list[TrackScored]]:
+    fingerprints = fingerprint_service.generate_fingerprints(
+        (track_suggested.name, track_suggested.primary_artist) for track_suggested in tracks_suggested
+    )
 
-    for track_suggested in tracks_suggested:
-        candidates = await provider_library.search_tracks(
-            track=track_suggested.name,
-            artists=track_suggested.artists,
-            page_size=limit,
-            log_enabled=False,
+    # The suggestions resolved by previous sessions, reconciled or not, are neither looked up nor searched again.
+    resolutions = await track_resolution_repository.get_many(
+        user_id=user.id,
+        keys=fingerprints,
+        provider=provider,
+        ttl=ttl,
+        negative_ttl=negative_ttl,
+    )
+    results = {
+        i: resolutions[fingerprint].match for i, fingerprint in enumerate(fingerprints) if fingerprint in resolutions
+    }
+    unresolved = [i for i in range(len(tracks_suggested)) if i not in results]
+    logger.debug(f"Tracks already resolved: {len(results)}")
+
+    misses: list[int] = []
+    if unresolved:
+        # Then the local catalog is looked up: only the suggestions it does not resolve are searched on the provider.
+        catalog_candidates = await track_repository.search_catalog(
+            user_id=user.id,
+            fingerprints=[fingerprints[i] for i in unresolved],
+            provider=provider,
+            limit=limit,
+        )
+        catalog_hits = {
+            i: candidates for i, candidates in zip(unresolved, catalog_candidates, strict=True) if candidates
+        }
+        # All the suggestions of a source are reconciled at once, as a single batch.
+        results.update(
+            zip(
+                catalog_hits,
+                reconciler.reconcile_many(
+                    suggestions=[tracks_suggested[i] for i in catalog_hits],
+                    candidates_by_suggestion=list(catalog_hits.values()),
+                ),
+                strict=True,
+            )
         )
 
-        result = reconciler.reconcile(
-            track_suggested=track_suggested,
-            candidates=candidates,
+        misses = [i for i in unresolved if results.get(i) is None]
+        logger.debug(f"Tracks resolved from the local catalog: {len(unresolved) - len(misses)}")
+
+    # The provider searches of the suggestions and of the queries are sent concurrently, as many at a time as the
+    # semaphore allows to stay within the provider rate limits. Their results are collected in the order of the
+    # suggestions and of the queries, whatever order the searches complete in. No database call is made while they
+    # are in flight: the provider may refresh its token through the same database session meanwhile.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def search(track: str, artists: list[str], page_size: int) -> list[Track]:
+        async with semaphore:
+            return await provider_library.search_tracks(
+                track=track,
+                artists=artists,
+                page_size=page_size,
+                log_enabled=False,
+            )
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            miss_tasks = [
+                task_group.create_task(search(tracks_suggested[i].name, tracks_suggested[i].artists, limit))
+                for i in misses
+            ]
+            query_tasks = [task_group.create_task(search(query, [], 5)) for query in search_queries]
+    except ExceptionGroup as group:
+        # Only the first failing search matters, the other ones have just been cancelled.
+        raise group.exceptions[0] from None
+
+    if unresolved:
+        results.update(
+            zip(
+                misses,
+                reconciler.reconcile_many(
+                    suggestions=[tracks_suggested[i] for i in misses],
+                    candidates_by_suggestion=[task.result() for task in miss_tasks],
+                ),
+                strict=True,
+            )
+        )
+
+        await track_resolution_repository.bulk_upsert(
+            resolutions=[TrackResolution(key=fingerprints[i], match=results[i]) for i in unresolved],
+            provider=provider,
         )
-        if result:
+
+    tracks_reconciled: list[TrackScored] = []
+    for i, track_suggested in enumerate(tracks_suggested):
+        if result := results[i]:
             best_match, reconciler_score = result
             tracks_reconciled.append(
                 TrackScored(
@@ -54,7 +144,13 @@ async def reconcile_tracks(
         else:
             logger.debug(f"Track not reconciled: '{track_suggested}'")
 
-    return tracks_reconciled
+    tracks_searched = [
+        TrackScored(track=track, advisor_score=0.8, reconciler_score=1.0)
+        for task in query_tasks
+        for track in task.result()
+    ]
+
+    return tracks_reconciled, tracks_searched
 
 
 async def filter_known_tracks(
@@ -0,0 +1,109 @@
+import bisect
+import dataclasses
+from collections.abc import Generator
+from datetime import datetime
+
+from museflow.application.inputs.history import StreamingHistoryEntry
+from museflow.application.inputs.history import StreamingHistoryFileStats
+from museflow.application.inputs.history import StreamingHistoryTrackAggregate
+from museflow.domain.services.fingerprint import fingerprint_service
+
+
+class StreamingHistoryAggregator:
+    """Incrementally reduces play events to one aggregate per track fingerprint.
+
+    Only the first/last play, the play count and the representative metadata are kept,
+    so memory grows with the number of unique tracks, not with the number of plays.
+    When two provider_ids resolve to the same fingerprint, their plays are merged and the
+    first entry seen is kept as representative metadata.
+
+    Plays falling within `imported_ranges` (the [first, last] play range of files imported by a
+    previous run) are skipped, so only new plays are aggregated. Streaming history files are
+    partitioned chronologically, hence a range fully belongs to the already imported files.
+    """
+
+    def __init__(self, imported_ranges: list[tuple[datetime, datetime]] | None = None) -> None:
+        self.aggregates: dict[str, StreamingHistoryTrackAggregate] = {}
+
+        # Overlapping ranges are merged, so a play is looked up with a single bisection.
+        self._imported_starts: list[datetime] = []
+        self._imported_ends: list[datetime] = []
+        for start, end in sorted(imported_ranges or []):
+            if self._imported_ends and start <= self._imported_ends[-1]:
+                self._imported_ends[-1] = max(self._imported_ends[-1], end)
+            else:
+                self._imported_starts.append(start)
+                self._imported_ends.append(end)
+
+    @property
+    def plays_total(self) -> int:
+        return sum(aggregate.played_count for aggregate in self.aggregates.values())
+
+    def is_imported(self, played_at: datetime) -> bool:
+        index = bisect.bisect_right(self._imported_starts, played_at) - 1
+        return index >= 0 and played_at <= self._imported_ends[index]
+
+    def add(self, entry: StreamingHistoryEntry) -> None:
+        fp = fingerprint_service.generate_fingerprint(name=entry.name, primary_artist=entry.artist)
+        aggregate = self.aggregates.get(fp)
+        if aggregate is None:
+            self.aggregates[fp] = StreamingHistoryTrackAggregate(
+                name=entry.name,
+                artist=entry.artist,
+                album_name=entry.album_name,
+                provider_id=entry.provider_id,
+                played_at_first=entry.played_at,
+                played_at_last=entry.played_at,
+            )
+            return
+
+        aggregate.played_count += 1
+        if entry.played_at < aggregate.played_at_first:
+            aggregate.played_at_first = entry.played_at
+        elif entry.played_at > aggregate.played_at_last:
+            aggregate.played_at_last = entry.played_at
+
+    def consume(
+        self,
+        entries: Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats],
+    ) -> StreamingHistoryFileStats:
+        """Adds every entry of the generator and returns its stats (the generator return value).
+
+        The stats are completed with the plays skipped as already imported and the play range of the entries.
+        """
+        items_skipped_already_imported = 0
+        played_at_first: datetime | None = None
+        played_at_last: datetime | None = None
+
+        while True:
+            try:
+                entry = next(entries)
+            except StopIteration as stop:
+                return dataclasses.replace(
+                    stop.value,
+                    items_skipped_already_imported=items_skipped_already_imported,
+                    played_at_first=played_at_first,
+                    played_at_last=played_at_last,
+                )
+
+            if played_at_first is None or entry.played_at < played_at_first:
+                played_at_first = entry.played_at
+            if played_at_last is None or entry.played_at > played_at_last:
+                played_at_last = entry.played_at
+
+            if self.is_imported(entry.played_at):
+                items_skipped_already_imported += 1
+                continue
+            self.add(entry)
+
+    def merge(self, aggregates: dict[str, StreamingHistoryTrackAggregate]) -> None:
+        """Merges already reduced aggregates in place. Metadata already present wins."""
+        for fp, aggregate in aggregates.items():
+            current = self.aggregates.get(fp)
+            if current is None:
+                self.aggregates[fp] = aggregate
+                continue
+
+            current.played_count += aggregate.played_count
+            current.played_at_first = min(current.played_at_first, aggregate.played_at_first)
+            current.played_at_last = max(current.played_at_last, aggregate.played_at_last)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
 
-from museflow.domain.utils.text import generate_fingerprint
+from museflow.domain.services.fingerprint import fingerprint_service
 from museflow.domain.utils.text import normalize_text
 
 
@@ -41,4 +41,6 @@ class BlacklistedTrack:
         if not self.artist_name:
             raise ValueError("artist_name must not be empty")
         if not self.fingerprint:
-            object.__setattr__(self, "fingerprint", generate_fingerprint(self.name, [self.artist_name]))
+            object.__setattr__(
+                self, "fingerprint", fingerprint_service.generate_fingerprint(self.name, self.artist_name)
+            )
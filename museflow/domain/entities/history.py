@@ -0,0 +1,27 @@
+import uuid
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+
+from museflow.domain.enums import MusicProvider
+
+
+@dataclass(frozen=True, kw_only=True)
+class HistoryManifestEntry:
+    """A streaming history file already imported for a user.
+
+    Used to skip unchanged files on re-import and to only merge plays outside the
+    [played_at_first, played_at_last] ranges already imported.
+    """
+
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    user_id: uuid.UUID
+    provider: MusicProvider
+
+    file_name: str
+    content_hash: str
+    size: int
+    modified_at: datetime
+
+    played_at_first: datetime | None = None
+    played_at_last: datetime | None = None
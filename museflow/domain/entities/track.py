@@ -7,8 +7,8 @@ from museflow.domain.enums import GenreTag
 from museflow.domain.enums import MoodTag
 from museflow.domain.enums import MusicProvider
 from museflow.domain.enums import TrackSource
+from museflow.domain.services.fingerprint import fingerprint_service
 from museflow.domain.types import LocaleCode
-from museflow.domain.utils.text import generate_fingerprint
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -57,9 +57,9 @@ class Track(BaseEntity):
             raise ValueError("Track must have at least one artist")
 
         if not self.fingerprint:
-            fingerprint_val = generate_fingerprint(
+            fingerprint_val = fingerprint_service.generate_fingerprint(
                 name=self.name,
-                artist_names=[self.primary_artist],
+                primary_artist=self.primary_artist,
             )
             object.__setattr__(self, "fingerprint", fingerprint_val)
 
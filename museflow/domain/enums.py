@@ -51,6 +51,26 @@ class MoodTag(StrEnum):
     DARK = "dark"  # moody, ominous, heavy
 
 
+class TrackField(StrEnum):
+    """Track columns that can be projected as lightweight rows, without building `Track` entities."""
+
+    ID = "id"
+    NAME = "name"
+    ARTISTS = "artists"
+    PRIMARY_ARTIST = "primary_artist"  # first of the artists
+    ALBUM_NAME = "album_name"
+    FINGERPRINT = "fingerprint"
+    PLAYED_AT_FIRST = "played_at_first"
+    PLAYED_AT_LAST = "played_at_last"
+    PLAYED_COUNT = "played_count"
+    SOURCE = "source"  # raw TrackSource bits
+    SCORE = "score"
+    SCORE_SKIPPED = "score_skipped"
+    GENRES = "genres"  # raw GenreTag values
+    MOODS = "moods"  # raw MoodTag values
+    LOCALE = "locale"
+
+
 class TrackOrderBy(StrEnum):
     CREATED_AT = "created_at"
     UPDATED_AT = "updated_at"
@@ -66,9 +86,24 @@ class TrackOrderBy(StrEnum):
         return self in (TrackOrderBy.PLAYED_AT_LAST, TrackOrderBy.PLAYED_AT_FIRST, TrackOrderBy.SCORE)
 
 
+class ArtistOrderBy(StrEnum):
+    TRACK_COUNT = "track_count"  # Raw breadth: distinct tracks by the artist
+    PLAYS_COUNT = "plays_count"  # Raw depth: total plays across the artist's tracks
+    RATE_AVG = "rate_avg"  # Raw quality: simple average of the artist's track ratings
+    QUALITY = "quality"  # Smoothed quality: confidence-weighted average, small samples pulled toward the mean
+    OVERALL = "overall"  # Blended ranking: breadth x depth x smoothed quality
+
+
+class TagOrderBy(StrEnum):
+    TRACK_COUNT = "track_count"  # Tracks with the tag
+    PLAYS_COUNT = "plays_count"  # Total plays across the tracks with the tag
+    RATE_AVG = "rate_avg"  # Simple average of the ratings of the tracks with the tag
+
+
 class PlaylistHistoryOrderBy(StrEnum):
     PLAYED_COUNT = "played_count"  # Sort by how many times the track was played
     SCORE = "score"  # Sort by the track's rating score
+    RANDOM = "random"  # Random sample of the matching tracks
 
 
 class SortOrder(StrEnum):
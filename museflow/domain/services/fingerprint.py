@@ -0,0 +1,45 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from museflow.domain.utils.text import generate_fingerprint
+
+
+@dataclass(frozen=True, kw_only=True)
+class FingerprintCacheInfo:
+    hits: int
+    misses: int
+    currsize: int
+    maxsize: int | None
+
+
+class FingerprintService:
+    """
+    Domain service computing track fingerprints, memoized in a bounded LRU cache.
+
+    The same tracks come back over and over (play events of a streaming history, pages of a provider
+    library, etc.): the text normalization then runs once per distinct (name, primary artist) pair.
+    """
+
+    def __init__(self, maxsize: int = 65_536) -> None:
+        self._fingerprint = lru_cache(maxsize=maxsize)(self._compute)
+
+    @staticmethod
+    def _compute(name: str, primary_artist: str | None) -> str:
+        return generate_fingerprint(name=name, artist_names=[primary_artist] if primary_artist is not None else [])
+
+    def generate_fingerprint(self, name: str, primary_artist: str | None) -> str:
+        return self._fingerprint(name, primary_artist)
+
+    def generate_fingerprints(self, pairs: Iterable[tuple[str, str | None]]) -> list[str]:
+        """Returns the fingerprint of each (name, primary artist) pair, in the same order."""
+        fingerprint = self._fingerprint
+        return [fingerprint(name, primary_artist) for name, primary_artist in pairs]
+
+    def cache_info(self) -> FingerprintCacheInfo:
+        hits, misses, maxsize, currsize = self._fingerprint.cache_info()
+        return FingerprintCacheInfo(hits=hits, misses=misses, currsize=currsize, maxsize=maxsize)
+
+
+# Shared by the whole process, so every caller benefits from the fingerprints already computed.
+fingerprint_service = FingerprintService()
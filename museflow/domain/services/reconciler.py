@@ -1,12 +1,20 @@
 import logging
+from collections.abc import Callable
+from functools import cache
 from typing import Final
 
 from rapidfuzz import fuzz
 
+try:
+    import numpy as np
+    from rapidfuzz.process import cpdist
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
 from museflow.domain.entities.track import Track
 from museflow.domain.entities.track import TrackSuggested
 from museflow.domain.types import ScoreReconciler
-from museflow.domain.value_objects.track import TrackNormalized
+from museflow.domain.utils.text import normalize_text
 
 logger = logging.getLogger(__name__)
 
@@ -24,21 +32,50 @@ class Reconciler:
         candidates: list[Track],
     ) -> tuple[Track, ScoreReconciler] | None:
         """Finds the best canonical match for a suggested track in the provider's library."""
+        return self.reconcile_many([track_suggested], [candidates])[0]
 
-        track_target = TrackNormalized.create(
-            name=track_suggested.name,
-            artists=track_suggested.artists,
-        )
-
-        best_match: Track | None = None
-        best_score = -1.0
-
-        for candidate in candidates:
-            score = self._compute_reconciliation_score(track_target=track_target, candidate=candidate)
-            if score > best_score:
-                best_score = score
-                best_match = candidate
-
+    def reconcile_many(
+        self,
+        suggestions: list[TrackSuggested],
+        candidates_by_suggestion: list[list[Track]],
+    ) -> list[tuple[Track, ScoreReconciler] | None]:
+        """
+        Same as :meth:`reconcile` for a batch of suggested tracks, each one with its own candidates.
+
+        Each distinct name is normalized once for the whole batch. All the (suggestion, candidate) pairs of the
+        batch are then scored at once by rapidfuzz (requires the `numpy` extra), the pairs below the match
+        threshold exiting early.
+        """
+        normalize = cache(normalize_text)
+        if np is not None:
+            scores_by_suggestion = self._score_batch(suggestions, candidates_by_suggestion, normalize)
+        else:
+            scores_by_suggestion = [
+                self._score_candidates(track_suggested, candidates, normalize)
+                for track_suggested, candidates in zip(suggestions, candidates_by_suggestion, strict=True)
+            ]
+
+        results: list[tuple[Track, ScoreReconciler] | None] = []
+        for track_suggested, candidates, scores in zip(
+            suggestions, candidates_by_suggestion, scores_by_suggestion, strict=True
+        ):
+            best_match: Track | None = None
+            best_score = -1.0
+            for candidate, score in zip(candidates, scores, strict=True):
+                if score > best_score:
+                    best_score = score
+                    best_match = candidate
+
+            results.append(self._resolve(track_suggested, best_match, best_score))
+
+        return results
+
+    def _resolve(
+        self,
+        track_suggested: TrackSuggested,
+        best_match: Track | None,
+        best_score: float,
+    ) -> tuple[Track, ScoreReconciler] | None:
         if best_match and best_score >= self.SCORE_MINIMUM:
             logger.debug(
                 f"Matched '{track_suggested.primary_artist} - {track_suggested.name}' "
@@ -53,18 +90,83 @@ class Reconciler:
         )
         return None
 
-    def _compute_reconciliation_score(self, track_target: TrackNormalized, candidate: Track) -> float:
-        """Calculates a composite score using fuzzy name and artist matching."""
+    def _score_candidates(
+        self,
+        track_suggested: TrackSuggested,
+        candidates: list[Track],
+        normalize: Callable[[str], str],
+    ) -> list[float]:
+        """Calculates the composite score of each candidate, pair by pair."""
+        target_name = normalize(track_suggested.name)
+        target_artists = [normalize(artist) for artist in track_suggested.artists]
 
-        track_candidate = TrackNormalized.create(
-            name=candidate.name,
-            artists=candidate.artists,
-        )
+        scores = []
+        for candidate in candidates:
+            track_score = fuzz.token_sort_ratio(target_name, normalize(candidate.name))
+            artist_scores = [
+                fuzz.WRatio(ta, normalize(ca), score_cutoff=self.MATCH_THRESHOLD)
+                for ta in target_artists
+                for ca in candidate.artists
+            ]
+            scores.append(self._composite_score(track_score, max(artist_scores, default=0.0)))
 
-        track_score = fuzz.token_sort_ratio(track_target.name, track_candidate.name)
-        artist_scores = [fuzz.WRatio(ta, ca) for ta in track_target.artists for ca in track_candidate.artists]
-        best_artist_score = max(artist_scores) if artist_scores else 0.0
+        return scores
+
+    def _score_batch(
+        self,
+        suggestions: list[TrackSuggested],
+        candidates_by_suggestion: list[list[Track]],
+        normalize: Callable[[str], str],
+    ) -> list[list[float]]:
+        """Same as :meth:`_score_candidates` for the whole batch, each distinct pair of names being scored once."""
+        name_pairs: dict[tuple[str, str], int] = {}
+        artist_pairs: dict[tuple[str, str], int] = {}
+        name_indexes: list[int] = []  # name pair of each candidate
+        artist_indexes: list[int] = []  # artist pairs of each candidate, one after the other
+        artist_offsets: list[int] = []  # start of the artist pairs of each candidate
+
+        for track_suggested, candidates in zip(suggestions, candidates_by_suggestion, strict=True):
+            target_name = normalize(track_suggested.name)
+            target_artists = [normalize(artist) for artist in track_suggested.artists]
+            for candidate in candidates:
+                name_indexes.append(name_pairs.setdefault((target_name, normalize(candidate.name)), len(name_pairs)))
+                artist_offsets.append(len(artist_indexes))
+                artist_indexes.extend(
+                    artist_pairs.setdefault((target_artist, candidate_artist), len(artist_pairs))
+                    for candidate_artist in map(normalize, candidate.artists)
+                    for target_artist in target_artists
+                )
+
+        if not name_indexes:
+            return [[] for _ in suggestions]
+
+        track_scores = self._score_pairs(name_pairs, scorer=fuzz.token_sort_ratio)[name_indexes]
+        artist_scores = self._score_pairs(artist_pairs, scorer=fuzz.WRatio)[artist_indexes]
+        # Tracks and suggestions always have artists, so no candidate has an empty range of pairs.
+        best_artist_scores = np.maximum.reduceat(artist_scores, artist_offsets)
+
+        matched = (track_scores >= self.MATCH_THRESHOLD) & (best_artist_scores >= self.MATCH_THRESHOLD)
+        # Base composite: 60% track name weight, 40% artist name weight
+        composite_scores = np.where(matched, (track_scores * 0.6) + (best_artist_scores * 0.4), 0.0).tolist()
+
+        scores_by_suggestion = []
+        offset = 0
+        for candidates in candidates_by_suggestion:
+            scores_by_suggestion.append(composite_scores[offset : offset + len(candidates)])
+            offset += len(candidates)
+        return scores_by_suggestion
+
+    def _score_pairs(self, pairs: dict[tuple[str, str], int], scorer: Callable[..., float]) -> "np.ndarray":
+        """Scores the pairs element-wise, in their insertion order. Pairs below the match threshold score 0."""
+        return cpdist(
+            [query for query, _ in pairs],
+            [choice for _, choice in pairs],
+            scorer=scorer,
+            score_cutoff=self.MATCH_THRESHOLD,
+            dtype=np.float64,
+        )
 
+    def _composite_score(self, track_score: float, best_artist_score: float) -> float:
         if track_score < self.MATCH_THRESHOLD or best_artist_score < self.MATCH_THRESHOLD:
             return 0.0
 
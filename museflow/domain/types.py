@@ -1,3 +1,7 @@
+import uuid
+from datetime import datetime
+from typing import TypedDict
+
 from museflow.domain.enums import SortOrder
 from museflow.domain.enums import TrackOrderBy
 
@@ -5,3 +9,23 @@ type TrackOrdering = list[tuple[TrackOrderBy, SortOrder]]
 type ScoreAdvisor = float
 type ScoreReconciler = float
 type LocaleCode = str  # ISO 639-1 two-letter lowercase language code, e.g. "fr", "en"
+
+
+class TrackRow(TypedDict, total=False):
+    """A track projected on some `TrackField`: only the projected fields are set, see TrackRepository.get_rows."""
+
+    id: uuid.UUID
+    name: str
+    artists: list[str]
+    primary_artist: str | None
+    album_name: str | None
+    fingerprint: str
+    played_at_first: datetime | None
+    played_at_last: datetime | None
+    played_count: int
+    source: int  # raw TrackSource bits
+    score: int | None
+    score_skipped: bool
+    genres: list[str]  # raw GenreTag values
+    moods: list[str]  # raw MoodTag values
+    locale: LocaleCode | None
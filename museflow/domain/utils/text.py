@@ -17,17 +17,40 @@ def unidecode_lower_text(text: str) -> str:
     return unidecode(text).lower()
 
 
+# Transliteration of the Latin-1 and Latin Extended blocks, where most of the non-ASCII characters of names are:
+# done in C by `str.translate`, unidecode only handles the characters left, if any.
+_LATIN_ASCII_TABLE = str.maketrans({chr(code): unidecode(chr(code)) for code in range(0x80, 0x250)})
+
+# Remove "feat", "feat.", "ft", "ft.", "remaster", "radio edit" in brackets or parentheses
+_BRACKETS_NOISE_RE = re.compile(r"[\(\[].*?(feat\.?|ft\.?|remaster|live|edit|version).*?[\)\]]")
+
+# Remove trailing suffixes after hyphens
+_SUFFIX_NOISE_RE = re.compile(r"\s*-\s*.*?(feat\.?|ft\.?|remaster|live|edit|version|mono|stereo).*")
+
+# Remove purely non-alphanumeric noise, i.e. `[^\w\s]`: the text is ASCII once transliterated.
+_NON_WORD_ASCII_BYTES = bytes(code for code in range(128) if not re.match(r"[\w\s]", chr(code)))
+
+
 def normalize_text(text: str) -> str:
-    text = unidecode_lower_text(text)
+    """
+    Transliterates, lowercases and strips the noise (featurings, remasters, punctuation, etc.) of a name.
+
+    It is the hottest text function of the project: each step only runs when the characters it requires are present,
+    with precompiled patterns and translation tables. Its output must never change, the stored fingerprints rely on it.
+    """
+    if not text.isascii():
+        text = text.translate(_LATIN_ASCII_TABLE)
+        if not text.isascii():
+            text = unidecode(text)
+    text = text.lower()
 
-    # Remove "feat", "feat.", "ft", "ft.", "remaster", "radio edit" in brackets or parentheses
-    text = re.sub(r"[\(\[].*?(feat\.?|ft\.?|remaster|live|edit|version).*?[\)\]]", "", text)
+    if "(" in text or "[" in text:
+        text = _BRACKETS_NOISE_RE.sub("", text)
 
-    # Remove trailing suffixes after hyphens
-    text = re.sub(r"\s*-\s*.*?(feat\.?|ft\.?|remaster|live|edit|version|mono|stereo).*", "", text)
+    if "-" in text:
+        text = _SUFFIX_NOISE_RE.sub("", text)
 
-    # Remove purely non-alphanumeric noise and extra whitespace
-    text = re.sub(r"[^\w\s]", "", text)
+    text = text.encode("ascii").translate(None, _NON_WORD_ASCII_BYTES).decode("ascii")
 
     return " ".join(text.split())
 
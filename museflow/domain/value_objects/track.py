@@ -1,25 +1,11 @@
 import uuid
 from dataclasses import dataclass
-from typing import Self
 
 from museflow.domain.entities.track import Track
 from museflow.domain.enums import GenreTag
 from museflow.domain.enums import MoodTag
 from museflow.domain.types import LocaleCode
-from museflow.domain.utils.text import normalize_text
-
-
-@dataclass(frozen=True, kw_only=True)
-class TrackNormalized:
-    name: str
-    artists: list[str]
-
-    @classmethod
-    def create(cls, name: str, artists: list[str]) -> Self:
-        return cls(
-            name=normalize_text(name),
-            artists=[normalize_text(artist) for artist in artists],
-        )
+from museflow.domain.types import ScoreReconciler
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -38,3 +24,46 @@ class TrackEnrichment:
     genres: list[GenreTag]
     moods: list[MoodTag]
     locale: LocaleCode | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArtistAggregate:
+    """Value Object representing the track statistics of an artist (as primary artist)."""
+
+    artist: str
+    track_count: int
+    plays_count: int
+    rated_count: int
+    rate_avg: float | None  # None for artists with no rated tracks
+    quality_score: float | None  # None for artists with no rated tracks
+    overall_score: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class TagAggregate:
+    """Value Object representing the track statistics of a tag (genre, mood or locale)."""
+
+    tag: str
+    track_count: int
+    plays_count: int
+    rated_count: int
+    rate_avg: float | None  # None for tags with no rated tracks
+
+
+@dataclass(frozen=True, kw_only=True)
+class TrackPatchResult:
+    """Value Object representing the outcome of a bulk patch, split by whether the keys matched a track."""
+
+    matched_keys: frozenset[uuid.UUID | str]
+    unmatched_keys: frozenset[uuid.UUID | str]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TrackResolution:
+    """Value Object representing the outcome of the reconciliation of a suggested track.
+
+    A resolution without match records that the suggestion was not reconciled (negative caching).
+    """
+
+    key: str  # fingerprint of the suggested track
+    match: tuple[Track, ScoreReconciler] | None = None
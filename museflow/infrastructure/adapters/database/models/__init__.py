@@ -1,7 +1,9 @@
 from museflow.infrastructure.adapters.database.models.base import Base  # noqa
 from museflow.infrastructure.adapters.database.models.auth import *  # noqa
 from museflow.infrastructure.adapters.database.models.blacklist import *  # noqa
+from museflow.infrastructure.adapters.database.models.history import *  # noqa
 from museflow.infrastructure.adapters.database.models.track import *  # noqa
 from museflow.infrastructure.adapters.database.models.playlist import *  # noqa
+from museflow.infrastructure.adapters.database.models.resolution import *  # noqa
 from museflow.infrastructure.adapters.database.models.taste import *  # noqa
 from museflow.infrastructure.adapters.database.models.user import *  # noqa
@@ -0,0 +1,52 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger
+from sqlalchemy import DateTime
+from sqlalchemy import Enum
+from sqlalchemy import ForeignKey
+from sqlalchemy import String
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from museflow.domain.entities.history import HistoryManifestEntry as HistoryManifestEntryEntity
+from museflow.domain.enums import MusicProvider
+from museflow.infrastructure.adapters.database.models.base import Base
+from museflow.infrastructure.adapters.database.models.base import DatetimeTrackMixin
+from museflow.infrastructure.adapters.database.models.base import UUIDIdMixin
+
+
+class HistoryManifestEntry(UUIDIdMixin, DatetimeTrackMixin, Base, kw_only=True):
+    __tablename__ = "museflow_history_manifest"
+    __table_args__ = (
+        UniqueConstraint("user_id", "provider", "file_name", name="uq_museflow_history_manifest_user_file"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("museflow_user.id", ondelete="CASCADE"),
+        nullable=False,
+        sort_order=-50,
+    )
+    provider: Mapped[MusicProvider] = mapped_column(Enum(MusicProvider), nullable=False)
+
+    file_name: Mapped[str] = mapped_column(String(512), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    modified_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    played_at_first: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
+    played_at_last: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
+
+    def to_entity(self) -> HistoryManifestEntryEntity:
+        return HistoryManifestEntryEntity(
+            id=self.id,
+            user_id=self.user_id,
+            provider=self.provider,
+            file_name=self.file_name,
+            content_hash=self.content_hash,
+            size=self.size,
+            modified_at=self.modified_at,
+            played_at_first=self.played_at_first,
+            played_at_last=self.played_at_last,
+        )
@@ -0,0 +1,33 @@
+from sqlalchemy import Enum
+from sqlalchemy import Float
+from sqlalchemy import String
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from museflow.domain.enums import MusicProvider
+from museflow.infrastructure.adapters.database.models.base import Base
+from museflow.infrastructure.adapters.database.models.base import DatetimeTrackMixin
+from museflow.infrastructure.adapters.database.models.base import UUIDIdMixin
+
+
+class TrackResolution(UUIDIdMixin, DatetimeTrackMixin, Base, kw_only=True):
+    """Outcome of the reconciliation of a suggested track with the provider, shared by all the users.
+
+    The track fields are all null for a suggestion which was not reconciled. `updated_at` is the time
+    of the resolution, after which it expires.
+    """
+
+    __tablename__ = "museflow_track_resolution"
+    __table_args__ = (UniqueConstraint("provider", "suggestion_key", name="uq_museflow_track_resolution_key"),)
+
+    provider: Mapped[MusicProvider] = mapped_column(Enum(MusicProvider), nullable=False)
+    suggestion_key: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    provider_id: Mapped[str | None] = mapped_column(String(512), nullable=True, default=None)
+    name: Mapped[str | None] = mapped_column(String(255), nullable=True, default=None)
+    artists: Mapped[list[str] | None] = mapped_column(JSONB(none_as_null=True), nullable=True, default=None)
+    album_name: Mapped[str | None] = mapped_column(String(512), nullable=True, default=None)
+    fingerprint: Mapped[str | None] = mapped_column(String(512), nullable=True, default=None)
+    score: Mapped[float | None] = mapped_column(Float, nullable=True, default=None)
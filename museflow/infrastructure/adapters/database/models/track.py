@@ -2,12 +2,20 @@ import uuid
 from datetime import datetime
 from typing import TypedDict
 
+from sqlalchemy import DDL
 from sqlalchemy import Boolean
 from sqlalchemy import DateTime
+from sqlalchemy import Enum
+from sqlalchemy import Float
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import UniqueConstraint
+from sqlalchemy import and_
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import literal_column
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped
@@ -63,6 +71,9 @@ class Track(UUIDIdMixin, DatetimeTrackMixin, Base, kw_only=True):
     moods: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default_factory=list)
     locale: Mapped[LocaleCode | None] = mapped_column(String(10), nullable=True, default=None)
 
+    # Random sort key drawn once per track, to sample tracks randomly without sorting them all
+    random_key: Mapped[float] = mapped_column(Float, nullable=False, server_default=func.random(), init=False)
+
     @classmethod
     def from_entity(cls, entity: TrackEntity) -> "Track":
         return cls(
@@ -108,3 +119,117 @@ class Track(UUIDIdMixin, DatetimeTrackMixin, Base, kw_only=True):
             moods=[MoodTag(m) for m in self.moods],
             locale=self.locale,
         )
+
+
+# Primary artist (first of the artists) in lowercase, for case-insensitive lookups. The JSON index is inlined
+# instead of bound as a parameter, so that the queries match the expression index below.
+PRIMARY_ARTIST_LOWER = func.lower(Track.artists.op("->>", return_type=String)(literal_column("0", Integer)))
+
+# Indexes of the common track queries (filters and orderings of TrackRepository.get_list)
+Index("ix_museflow_track_user_created_at", Track.user_id, Track.created_at, Track.id)
+Index("ix_museflow_track_user_score", Track.user_id, Track.score.desc().nulls_last())
+Index("ix_museflow_track_user_played_count", Track.user_id, Track.played_count.desc())
+Index("ix_museflow_track_user_played_at_first", Track.user_id, Track.played_at_first.desc().nulls_last())
+Index("ix_museflow_track_user_played_at_last", Track.user_id, Track.played_at_last.desc().nulls_last())
+Index("ix_museflow_track_user_primary_artist", Track.user_id, PRIMARY_ARTIST_LOWER)
+Index("ix_museflow_track_user_random_key", Track.user_id, Track.random_key)
+Index("ix_museflow_track_genres", Track.genres, postgresql_using="gin")
+Index("ix_museflow_track_moods", Track.moods, postgresql_using="gin")
+# Catalog of all the known tracks: fingerprints are the normalized "name|primary artist", matched by similarity
+Index(
+    "ix_museflow_track_fingerprint_trgm",
+    Track.fingerprint,
+    postgresql_using="gin",
+    postgresql_ops={"fingerprint": "gin_trgm_ops"},
+)
+event.listen(Track.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+# Rating queue: the history tracks still to rate, most played first
+Index(
+    "ix_museflow_track_user_rating_queue",
+    Track.user_id,
+    Track.played_count.desc(),
+    postgresql_where=and_(
+        Track.score.is_(None),
+        Track.score_skipped.is_(False),
+        Track.source.op("&")(literal_column(str(int(TrackSource.HISTORY)), Integer)) != literal_column("0", Integer),
+    ),
+)
+
+
+class TrackProviderLink(Base, kw_only=True):
+    """Lookup table of the track provider links, so that tracks are found by provider (ID) with index scans.
+
+    `Track.provider_links` stays the source of truth: the rows are maintained by database triggers
+    on every insert or update of a track, whatever the way it is written (ORM, upsert, COPY).
+    A provider ID is not unique per user, since a track renamed by its provider gets a new fingerprint.
+    """
+
+    __tablename__ = "museflow_track_provider_link"
+
+    __table_args__ = (Index("ix_museflow_track_provider_link_lookup", "user_id", "provider_id", "provider"),)
+
+    track_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("museflow_track.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    provider: Mapped[MusicProvider] = mapped_column(Enum(MusicProvider), primary_key=True)
+    provider_id: Mapped[str] = mapped_column(String(512), primary_key=True)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("museflow_user.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+
+# Statement-level triggers: the links of all the written rows are synced at once, through transition tables.
+# The JSONB provider values are the lowercase enum values, while Postgres stores the uppercase enum names.
+TRACK_PROVIDER_LINK_SYNC_DDL: list[str] = [
+    """
+    CREATE FUNCTION museflow_track_provider_link_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO museflow_track_provider_link (track_id, provider, provider_id, user_id)
+        SELECT DISTINCT t.id, upper(elem->>'provider')::musicprovider, elem->>'provider_id', t.user_id
+        FROM new_tracks AS t, jsonb_array_elements(t.provider_links) AS elem;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    """
+    CREATE FUNCTION museflow_track_provider_link_update() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        DELETE FROM museflow_track_provider_link AS l
+        USING new_tracks AS t JOIN old_tracks AS o ON o.id = t.id
+        WHERE l.track_id = t.id AND t.provider_links IS DISTINCT FROM o.provider_links;
+
+        INSERT INTO museflow_track_provider_link (track_id, provider, provider_id, user_id)
+        SELECT DISTINCT t.id, upper(elem->>'provider')::musicprovider, elem->>'provider_id', t.user_id
+        FROM new_tracks AS t JOIN old_tracks AS o ON o.id = t.id, jsonb_array_elements(t.provider_links) AS elem
+        WHERE t.provider_links IS DISTINCT FROM o.provider_links;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    """
+    CREATE TRIGGER museflow_track_provider_link_insert
+    AFTER INSERT ON museflow_track
+    REFERENCING NEW TABLE AS new_tracks
+    FOR EACH STATEMENT EXECUTE FUNCTION museflow_track_provider_link_insert()
+    """,
+    """
+    CREATE TRIGGER museflow_track_provider_link_update
+    AFTER UPDATE ON museflow_track
+    REFERENCING OLD TABLE AS old_tracks NEW TABLE AS new_tracks
+    FOR EACH STATEMENT EXECUTE FUNCTION museflow_track_provider_link_update()
+    """,
+]
+TRACK_PROVIDER_LINK_DROP_DDL: list[str] = [
+    "DROP TRIGGER IF EXISTS museflow_track_provider_link_update ON museflow_track",
+    "DROP TRIGGER IF EXISTS museflow_track_provider_link_insert ON museflow_track",
+    "DROP FUNCTION IF EXISTS museflow_track_provider_link_update()",
+    "DROP FUNCTION IF EXISTS museflow_track_provider_link_insert()",
+]
+
+for statement in TRACK_PROVIDER_LINK_SYNC_DDL:
+    event.listen(TrackProviderLink.__table__, "after_create", DDL(statement))
+for statement in TRACK_PROVIDER_LINK_DROP_DDL:
+    event.listen(TrackProviderLink.__table__, "before_drop", DDL(statement))
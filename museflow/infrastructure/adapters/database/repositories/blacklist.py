@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from museflow.application.ports.repositories.blacklist import BlacklistRepository
 from museflow.domain.entities.blacklist import BlacklistedArtist
 from museflow.domain.entities.blacklist import BlacklistedTrack
-from museflow.domain.utils.text import generate_fingerprint
+from museflow.domain.services.fingerprint import fingerprint_service
 from museflow.domain.utils.text import normalize_text
 from museflow.domain.value_objects.blacklist import UserBlacklist
 from museflow.infrastructure.adapters.database.models.blacklist import BlacklistedArtist as BlacklistedArtistModel
@@ -42,7 +42,7 @@ class BlacklistSQLRepository(BlacklistRepository):
             user_id=user_id,
             name=name,
             artist_name=artist_name,
-            fingerprint=generate_fingerprint(name, [artist_name]),
+            fingerprint=fingerprint_service.generate_fingerprint(name, artist_name),
         )
         upsert_stmt = insert_stmt.on_conflict_do_update(
             index_elements=["user_id", "fingerprint"],
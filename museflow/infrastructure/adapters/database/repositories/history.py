@@ -0,0 +1,72 @@
+import uuid
+
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from museflow.application.ports.repositories.history import HistoryManifestRepository
+from museflow.domain.entities.history import HistoryManifestEntry
+from museflow.domain.enums import MusicProvider
+from museflow.infrastructure.adapters.database.models.history import HistoryManifestEntry as HistoryManifestEntryModel
+
+
+class HistoryManifestSQLRepository(HistoryManifestRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_list(self, user_id: uuid.UUID, provider: MusicProvider) -> list[HistoryManifestEntry]:
+        stmt = (
+            select(HistoryManifestEntryModel)
+            .where(HistoryManifestEntryModel.user_id == user_id, HistoryManifestEntryModel.provider == provider)
+            .order_by(HistoryManifestEntryModel.file_name)
+        )
+        result = await self.session.execute(stmt)
+        return [row.to_entity() for row in result.scalars()]
+
+    async def bulk_upsert(self, entries: list[HistoryManifestEntry]) -> None:
+        if not entries:
+            return
+
+        insert_stmt = pg_insert(HistoryManifestEntryModel).values(
+            [
+                {
+                    "id": entry.id,
+                    "user_id": entry.user_id,
+                    "provider": entry.provider,
+                    "file_name": entry.file_name,
+                    "content_hash": entry.content_hash,
+                    "size": entry.size,
+                    "modified_at": entry.modified_at,
+                    "played_at_first": entry.played_at_first,
+                    "played_at_last": entry.played_at_last,
+                }
+                for entry in entries
+            ]
+        )
+        excluded = insert_stmt.excluded
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["user_id", "provider", "file_name"],
+            set_={
+                "content_hash": excluded.content_hash,
+                "size": excluded.size,
+                "modified_at": excluded.modified_at,
+                "played_at_first": excluded.played_at_first,
+                "played_at_last": excluded.played_at_last,
+                "updated_at": func.now(),
+            },
+        )
+
+        await self.session.execute(upsert_stmt)
+        await self.session.commit()
+
+    async def purge(self, user_id: uuid.UUID, provider: MusicProvider) -> int:
+        result = await self.session.execute(
+            delete(HistoryManifestEntryModel).where(
+                HistoryManifestEntryModel.user_id == user_id,
+                HistoryManifestEntryModel.provider == provider,
+            )
+        )
+        await self.session.commit()
+        return int(result.rowcount)  # type: ignore
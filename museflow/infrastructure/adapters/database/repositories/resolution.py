@@ -0,0 +1,104 @@
+import uuid
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+from sqlalchemy import String
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
+from museflow.domain.entities.track import ProviderLink
+from museflow.domain.entities.track import Track
+from museflow.domain.enums import MusicProvider
+from museflow.domain.value_objects.track import TrackResolution
+from museflow.infrastructure.adapters.database.models.resolution import TrackResolution as TrackResolutionModel
+
+
+class TrackResolutionSQLRepository(TrackResolutionRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_many(
+        self,
+        user_id: uuid.UUID,
+        keys: list[str],
+        provider: MusicProvider,
+        ttl: timedelta,
+        negative_ttl: timedelta,
+    ) -> dict[str, TrackResolution]:
+        if not keys:
+            return {}
+
+        now = datetime.now(UTC)
+        stmt = select(TrackResolutionModel).where(
+            TrackResolutionModel.provider == provider,
+            TrackResolutionModel.suggestion_key == any_(bindparam("keys", keys, type_=ARRAY(String))),
+            TrackResolutionModel.updated_at
+            >= case((TrackResolutionModel.provider_id.is_(None), now - negative_ttl), else_=now - ttl),
+        )
+        result = await self.session.execute(stmt)
+
+        resolutions: dict[str, TrackResolution] = {}
+        for row in result.scalars():
+            match = None
+            if row.provider_id is not None and row.name and row.artists and row.score is not None:
+                track = Track(
+                    user_id=user_id,
+                    name=row.name,
+                    artists=row.artists,
+                    album_name=row.album_name,
+                    fingerprint=row.fingerprint or "",
+                    provider_links=[ProviderLink(provider=provider, provider_id=row.provider_id)],
+                )
+                match = (track, row.score)
+            resolutions[row.suggestion_key] = TrackResolution(key=row.suggestion_key, match=match)
+
+        return resolutions
+
+    async def bulk_upsert(self, resolutions: list[TrackResolution], provider: MusicProvider) -> None:
+        # A statement cannot update the same row twice: the last resolution of each key wins.
+        resolutions_by_key = {resolution.key: resolution for resolution in resolutions}
+        if not resolutions_by_key:
+            return
+
+        values = []
+        for key, resolution in resolutions_by_key.items():
+            track, score = resolution.match or (None, None)
+            values.append(
+                {
+                    "id": uuid.uuid4(),
+                    "provider": provider,
+                    "suggestion_key": key,
+                    "provider_id": track.get_provider_id(provider) if track else None,
+                    "name": track.name if track else None,
+                    "artists": track.artists if track else None,
+                    "album_name": track.album_name if track else None,
+                    "fingerprint": track.fingerprint if track else None,
+                    "score": score,
+                }
+            )
+
+        insert_stmt = pg_insert(TrackResolutionModel).values(values)
+        excluded = insert_stmt.excluded
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["provider", "suggestion_key"],
+            set_={
+                "provider_id": excluded.provider_id,
+                "name": excluded.name,
+                "artists": excluded.artists,
+                "album_name": excluded.album_name,
+                "fingerprint": excluded.fingerprint,
+                "score": excluded.score,
+                "updated_at": func.now(),
+            },
+        )
+
+        await self.session.execute(upsert_stmt)
+        await self.session.commit()
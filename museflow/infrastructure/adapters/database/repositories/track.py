@@ -1,31 +1,96 @@
-import dataclasses
+import json
+import random
+import typing
 import uuid
-from datetime import date
+from collections.abc import AsyncGenerator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from datetime import timedelta
+from functools import cache
 from typing import Any
 
+from sqlalchemy import UUID
+from sqlalchemy import Boolean
+from sqlalchemy import Date
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import Row
+from sqlalchemy import SQLColumnExpression
+from sqlalchemy import String
+from sqlalchemy import and_
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import case
+from sqlalchemy import cast
+from sqlalchemy import column
 from sqlalchemy import delete
+from sqlalchemy import exists
 from sqlalchemy import func
+from sqlalchemy import literal
 from sqlalchemy import or_
 from sqlalchemy import select
+from sqlalchemy import table
 from sqlalchemy import text
+from sqlalchemy import true
+from sqlalchemy import tuple_
 from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import distinct_on
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import ReadOnlyColumnCollection
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.elements import KeyedColumnElement
+from sqlalchemy.sql.type_api import TypeEngine
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.repositories.track import TrackRepository
+from museflow.domain.entities.track import ProviderLink
 from museflow.domain.entities.track import Track
+from museflow.domain.enums import ArtistOrderBy
 from museflow.domain.enums import EnrichField
-from museflow.domain.enums import GenreTag
-from museflow.domain.enums import MoodTag
 from museflow.domain.enums import MusicProvider
 from museflow.domain.enums import SortOrder
+from museflow.domain.enums import TagOrderBy
+from museflow.domain.enums import TrackField
 from museflow.domain.enums import TrackOrderBy
 from museflow.domain.enums import TrackSource
 from museflow.domain.exceptions import TrackNotFoundError
-from museflow.domain.types import LocaleCode
 from museflow.domain.types import TrackOrdering
+from museflow.domain.types import TrackRow
+from museflow.domain.value_objects.track import ArtistAggregate
+from museflow.domain.value_objects.track import TagAggregate
 from museflow.domain.value_objects.track import TrackKnowIdentifiers
+from museflow.domain.value_objects.track import TrackPatchResult
+from museflow.infrastructure.adapters.database.models import PRIMARY_ARTIST_LOWER
+from museflow.infrastructure.adapters.database.models import Playlist as PlaylistModel
+from museflow.infrastructure.adapters.database.models import PlaylistTrack as PlaylistTrackModel
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
+from museflow.infrastructure.adapters.database.models import TrackProviderLink as TrackProviderLinkModel
+
+
+def _has_source(source: TrackSource) -> ColumnElement[bool]:
+    """
+    Returns the condition of the tracks having the given source flag.
+
+    The flag is rendered inline rather than bound, so the planner can match the partial indexes on it.
+    """
+    return TrackModel.source.op("&")(literal(int(source), literal_execute=True)) != literal(0, literal_execute=True)
+
+
+@cache
+def _track_row_factory(fields: tuple[TrackField, ...]) -> Callable[[Iterable[Any]], TrackRow]:
+    """Returns the constructor of the rows projected on the given fields, built once per fields set."""
+    keys = [field.value for field in fields]
+
+    def make_row(values: Iterable[Any]) -> TrackRow:
+        # The keys are the selected fields, so the dict is a row as is (sqlalchemy's cast shadows typing's one).
+        return typing.cast(TrackRow, dict(zip(keys, values, strict=True)))
+
+    return make_row
 
 
 class TrackSQLRepository(TrackRepository):
@@ -35,92 +100,291 @@ class TrackSQLRepository(TrackRepository):
         EnrichField.LOCALE: "locale",
     }
 
+    _FIELD_TO_COLUMN: dict[TrackField, SQLColumnExpression[Any]] = {
+        TrackField.ID: TrackModel.id,
+        TrackField.NAME: TrackModel.name,
+        TrackField.ARTISTS: TrackModel.artists,
+        TrackField.PRIMARY_ARTIST: TrackModel.artists[0].as_string(),
+        TrackField.ALBUM_NAME: TrackModel.album_name,
+        TrackField.FINGERPRINT: TrackModel.fingerprint,
+        TrackField.PLAYED_AT_FIRST: TrackModel.played_at_first,
+        TrackField.PLAYED_AT_LAST: TrackModel.played_at_last,
+        TrackField.PLAYED_COUNT: TrackModel.played_count,
+        TrackField.SOURCE: TrackModel.source,
+        TrackField.SCORE: TrackModel.score,
+        TrackField.SCORE_SKIPPED: TrackModel.score_skipped,
+        TrackField.GENRES: TrackModel.genres,
+        TrackField.MOODS: TrackModel.moods,
+        TrackField.LOCALE: TrackModel.locale,
+    }
+
+    _KNOWN_IDENTIFIERS_CHUNK_SIZE: int = 10_000
+
+    _UPSERT_INDEX_ELEMENTS: list[str] = ["user_id", "fingerprint"]
+    # score_skipped, genres, moods, locale excluded so re-imports never overwrite user decisions/enrichment
+    _UPSERT_EXCLUDED: frozenset[str] = frozenset(
+        ["id", "score_skipped", "genres", "moods", "locale", *_UPSERT_INDEX_ELEMENTS]
+    )
+
+    _INGEST_STAGING_TABLE: str = "museflow_track_ingest"
+    _INGEST_COLUMNS: list[str] = [
+        "id",
+        "user_id",
+        "name",
+        "artists",
+        "album_name",
+        "fingerprint",
+        "provider_links",
+        "played_at_first",
+        "played_at_last",
+        "played_count",
+        "source",
+        "score",
+        "score_skipped",
+        "genres",
+        "moods",
+        "locale",
+    ]
+
+    _PATCH_CHUNK_SIZE: int = 10_000
+    _PATCH_KEY_TYPES: dict[TrackField, TypeEngine[Any]] = {
+        TrackField.ID: UUID(),
+        TrackField.FINGERPRINT: String(),
+    }
+    _PATCH_FIELD_TYPES: dict[TrackField, TypeEngine[Any]] = {
+        TrackField.SCORE: Integer(),
+        TrackField.SCORE_SKIPPED: Boolean(),
+        TrackField.GENRES: String(),
+        TrackField.MOODS: String(),
+        TrackField.LOCALE: String(),
+    }
+    _PATCH_TAG_FIELDS: frozenset[TrackField] = frozenset([TrackField.GENRES, TrackField.MOODS])
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def get_list(
         self,
         user_id: uuid.UUID,
-        provider: MusicProvider | None = None,
-        provider_ids: list[str] | None = None,
-        min_score: int | None = None,
-        max_score: int | None = None,
-        source: TrackSource | None = None,
-        unrated_only: bool = False,
-        exclude_skipped: bool = False,
-        score_skipped_only: bool = False,
-        artist_name: str | None = None,
-        played_first_min: date | None = None,
-        played_first_max: date | None = None,
-        played_last_min: date | None = None,
-        played_last_max: date | None = None,
-        exclude_ids: list[uuid.UUID] | None = None,
-        missing_fields: frozenset[EnrichField] | None = None,
-        genres: list[GenreTag] | None = None,
-        moods: list[MoodTag] | None = None,
-        locales: list[LocaleCode] | None = None,
+        track_filter: TrackFilter | None = None,
         order: TrackOrdering | None = None,
         offset: int | None = None,
         limit: int | None = None,
     ) -> list[Track]:
-        stmt = select(TrackModel).where(TrackModel.user_id == user_id)
+        track_filter = track_filter or TrackFilter()
+        stmt = self._filter(select(TrackModel), user_id=user_id, track_filter=track_filter)
 
-        # Filtering
-        if provider is not None:
+        rows = await self._fetch(stmt, order=order, min_score=track_filter.min_score, offset=offset, limit=limit)
+        return [track_db.to_entity() for (track_db,) in rows]
+
+    async def get_rows(
+        self,
+        fields: list[TrackField],
+        user_id: uuid.UUID,
+        track_filter: TrackFilter | None = None,
+        order: TrackOrdering | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> list[TrackRow]:
+        track_filter = track_filter or TrackFilter()
+        make_row = _track_row_factory(tuple(fields))
+        stmt = self._filter(
+            select(*(self._FIELD_TO_COLUMN[field] for field in fields)),
+            user_id=user_id,
+            track_filter=track_filter,
+        )
+
+        rows = await self._fetch(stmt, order=order, min_score=track_filter.min_score, offset=offset, limit=limit)
+        return [make_row(row) for row in rows]
+
+    async def iter_rows(
+        self,
+        fields: list[TrackField],
+        user_id: uuid.UUID,
+        track_filter: TrackFilter | None = None,
+        chunk_size: int = 1_000,
+    ) -> AsyncGenerator[list[TrackRow]]:
+        make_row = _track_row_factory(tuple(fields))
+        stmt = self._filter(
+            select(*(self._FIELD_TO_COLUMN[field] for field in fields)),
+            user_id=user_id,
+            track_filter=track_filter or TrackFilter(),
+        )
+        stmt = stmt.add_columns(TrackModel.created_at, TrackModel.id)
+
+        async for rows in self._paginate(stmt, chunk_size=chunk_size):
+            yield [make_row(row[:-2]) for row in rows]
+
+    async def _paginate(
+        self,
+        stmt: Select[*tuple[Any, ...]],
+        chunk_size: int,
+    ) -> AsyncGenerator[Sequence[Row[*tuple[Any, ...]]]]:
+        """Yields the rows of the statement chunk by chunk, its last two columns being `created_at` and `id`."""
+        stmt = stmt.order_by(TrackModel.created_at.asc(), TrackModel.id.asc()).limit(chunk_size)
+
+        # Keyset pagination: each chunk resumes right after the last (created_at, id) seen, so every query
+        # stays an index range scan of bounded size, unlike an ever-growing OFFSET.
+        keyset: tuple[Any, ...] | None = None
+        while True:
+            chunk_stmt = stmt if keyset is None else stmt.where(tuple_(TrackModel.created_at, TrackModel.id) > keyset)
+            result = await self.session.execute(chunk_stmt)
+            rows = result.all()
+            if not rows:
+                return
+
+            keyset = tuple(rows[-1][-2:])
+            yield rows
+
+            if len(rows) < chunk_size:
+                return
+
+    @staticmethod
+    def _filter[*Ts](stmt: Select[*Ts], user_id: uuid.UUID, track_filter: TrackFilter) -> Select[*Ts]:
+        stmt = stmt.where(TrackModel.user_id == user_id)
+
+        if track_filter.provider is not None:
             stmt = stmt.where(
-                text(
-                    "EXISTS (SELECT 1 FROM jsonb_array_elements(museflow_track.provider_links) AS elem "
-                    "WHERE elem->>'provider' = :provider)"
-                ).bindparams(provider=provider.value)
+                exists().where(
+                    TrackProviderLinkModel.track_id == TrackModel.id,
+                    TrackProviderLinkModel.provider == track_filter.provider,
+                )
             )
-        if provider_ids is not None:
+        if track_filter.provider_ids is not None:
             stmt = stmt.where(
-                text(
-                    "EXISTS (SELECT 1 FROM jsonb_array_elements(museflow_track.provider_links) AS elem "
-                    "WHERE elem->>'provider_id' = ANY(:provider_ids))"
-                ).bindparams(provider_ids=provider_ids)
+                TrackModel.id.in_(
+                    select(TrackProviderLinkModel.track_id).where(
+                        TrackProviderLinkModel.user_id == user_id,
+                        TrackProviderLinkModel.provider_id
+                        == any_(bindparam("provider_ids", track_filter.provider_ids, ARRAY(String))),
+                    )
+                )
             )
-        if min_score is not None:
-            stmt = stmt.where(TrackModel.score >= min_score)
-        if max_score is not None:
-            stmt = stmt.where(TrackModel.score <= max_score)
-        if source is not None:
-            stmt = stmt.where(TrackModel.source.op("&")(int(source)) != 0)
-        if unrated_only:
+        if track_filter.min_score is not None:
+            stmt = stmt.where(TrackModel.score >= track_filter.min_score)
+        if track_filter.max_score is not None:
+            stmt = stmt.where(TrackModel.score <= track_filter.max_score)
+        if track_filter.source is not None:
+            stmt = stmt.where(_has_source(track_filter.source))
+        if track_filter.unrated_only:
             stmt = stmt.where(TrackModel.score.is_(None))
-        if exclude_skipped:
+        if track_filter.exclude_skipped:
             stmt = stmt.where(TrackModel.score_skipped.is_(False))
-        if score_skipped_only:
+        if track_filter.score_skipped_only:
             stmt = stmt.where(TrackModel.score_skipped.is_(True))
-        if artist_name is not None:
-            stmt = stmt.where(func.lower(TrackModel.artists[0].as_string()) == artist_name.lower())
-        if played_first_min is not None:
-            stmt = stmt.where(func.date(TrackModel.played_at_first) >= played_first_min)
-        if played_first_max is not None:
-            stmt = stmt.where(func.date(TrackModel.played_at_first) <= played_first_max)
-        if played_last_min is not None:
-            stmt = stmt.where(func.date(TrackModel.played_at_last) >= played_last_min)
-        if played_last_max is not None:
-            stmt = stmt.where(func.date(TrackModel.played_at_last) <= played_last_max)
-        if exclude_ids:
-            stmt = stmt.where(TrackModel.id.notin_(exclude_ids))
-        if missing_fields:
+        if track_filter.artist_name is not None:
+            stmt = stmt.where(PRIMARY_ARTIST_LOWER == track_filter.artist_name.lower())
+        if track_filter.played_first_min is not None:
+            stmt = stmt.where(TrackModel.played_at_first >= cast(literal(track_filter.played_first_min), Date))
+        if track_filter.played_first_max is not None:
+            stmt = stmt.where(
+                TrackModel.played_at_first < cast(literal(track_filter.played_first_max + timedelta(days=1)), Date)
+            )
+        if track_filter.played_last_min is not None:
+            stmt = stmt.where(TrackModel.played_at_last >= cast(literal(track_filter.played_last_min), Date))
+        if track_filter.played_last_max is not None:
+            stmt = stmt.where(
+                TrackModel.played_at_last < cast(literal(track_filter.played_last_max + timedelta(days=1)), Date)
+            )
+        if track_filter.exclude_ids:
+            stmt = stmt.where(TrackModel.id.notin_(track_filter.exclude_ids))
+        if track_filter.exclude_in_playlist_type is not None:
+            # Anti-join, instead of sending back the ids of all the tracks ever placed in those playlists.
+            stmt = stmt.where(
+                ~exists().where(
+                    PlaylistTrackModel.track_id == TrackModel.id,
+                    PlaylistModel.id == PlaylistTrackModel.playlist_id,
+                    PlaylistModel.user_id == user_id,
+                    PlaylistModel.type == track_filter.exclude_in_playlist_type,
+                )
+            )
+        if track_filter.missing_fields:
             conditions = []
-            if EnrichField.GENRE in missing_fields:
+            if EnrichField.GENRE in track_filter.missing_fields:
                 conditions.append(func.array_length(TrackModel.genres, 1).is_(None))
-            if EnrichField.MOOD in missing_fields:
+            if EnrichField.MOOD in track_filter.missing_fields:
                 conditions.append(func.array_length(TrackModel.moods, 1).is_(None))
-            if EnrichField.LOCALE in missing_fields:
+            if EnrichField.LOCALE in track_filter.missing_fields:
                 conditions.append(TrackModel.locale.is_(None))
             stmt = stmt.where(or_(*conditions))
-        if genres is not None:
-            stmt = stmt.where(TrackModel.genres.overlap([g.value for g in genres]))
-        if moods is not None:
-            stmt = stmt.where(TrackModel.moods.overlap([m.value for m in moods]))
-        if locales is not None:
-            stmt = stmt.where(TrackModel.locale.in_(locales))
-
-        # Ordering
+        if track_filter.genres is not None:
+            stmt = stmt.where(TrackModel.genres.overlap([g.value for g in track_filter.genres]))
+        if track_filter.moods is not None:
+            stmt = stmt.where(TrackModel.moods.overlap([m.value for m in track_filter.moods]))
+        if track_filter.locales is not None:
+            stmt = stmt.where(TrackModel.locale.in_(track_filter.locales))
+
+        return stmt
+
+    async def _fetch[*Ts](
+        self,
+        stmt: Select[*Ts],
+        order: TrackOrdering | None,
+        min_score: int | None,
+        offset: int | None,
+        limit: int | None,
+    ) -> Sequence[Row[*Ts]]:
+        if order and order[0][0] == TrackOrderBy.RANDOM and offset is None and limit is not None:
+            return await self._sample(stmt, limit=limit)
+
+        stmt = self._order(stmt, order=order, min_score=min_score)
+
+        # Pagination
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def _sample[*Ts](self, stmt: Select[*Ts], limit: int) -> list[Row[*Ts]]:
+        """
+        Returns `limit` random rows of the statement, without sorting all of them as ORDER BY random() does.
+
+        Each track holds a random key drawn once. Each of `limit` random pivots independently picks the first
+        track at or after it in the key order, an index probe of the (user_id, random_key) index. The tracks
+        picked twice, or missed by the pivots past the last key, are topped up by the tracks following one more
+        random pivot, wrapping around when they run out.
+        """
+        ids_stmt = stmt.with_only_columns(TrackModel.id)
+
+        probes = (
+            func.unnest(bindparam("pivots", [random.random() for _ in range(limit)], ARRAY(Float)))
+            .table_valued("pivot", with_ordinality="ordinal")
+            .render_derived()
+        )
+        probe = (
+            ids_stmt.where(TrackModel.random_key >= probes.c.pivot).order_by(TrackModel.random_key).limit(1).lateral()
+        )
+        result = await self.session.execute(
+            select(probe.c.id).select_from(probes).join(probe, true()).order_by(probes.c.ordinal)
+        )
+        ids: list[uuid.UUID] = list(dict.fromkeys(result.scalars().all()))
+
+        if len(ids) < limit:
+            pivot = random.random()
+            ids_stmt = ids_stmt.where(TrackModel.id.notin_(ids)) if ids else ids_stmt
+            for window in (TrackModel.random_key >= pivot, TrackModel.random_key < pivot):
+                result = await self.session.execute(
+                    ids_stmt.where(window).order_by(TrackModel.random_key).limit(limit - len(ids))
+                )
+                ids.extend(result.scalars())
+                if len(ids) == limit:
+                    break
+
+        if not ids:
+            return []
+
+        result = await self.session.execute(
+            stmt.where(TrackModel.id.in_(ids)).order_by(
+                func.array_position(bindparam("sample_ids", ids, ARRAY(UUID())), TrackModel.id)
+            )
+        )
+        return list(result.all())
+
+    @staticmethod
+    def _order[*Ts](stmt: Select[*Ts], order: TrackOrdering | None, min_score: int | None) -> Select[*Ts]:
         if order is None and min_score is not None:
             stmt = stmt.order_by(TrackModel.score.desc().nulls_last())
         else:
@@ -139,94 +403,397 @@ class TrackSQLRepository(TrackRepository):
                 else:
                     stmt = stmt.order_by(column.asc())
 
-        # Pagination
-        if offset is not None:
-            stmt = stmt.offset(offset)
+        return stmt
+
+    async def aggregate_by_artist(
+        self,
+        user_id: uuid.UUID,
+        source: TrackSource | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        confidence: int = 0,
+        max_tracks: int | None = None,
+        min_rate_avg: float | None = None,
+        order_by: ArtistOrderBy = ArtistOrderBy.OVERALL,
+        limit: int | None = None,
+    ) -> list[ArtistAggregate]:
+        primary_artist = self._FIELD_TO_COLUMN[TrackField.PRIMARY_ARTIST]
+
+        rated = self._rated(TrackModel.score, min_score=min_score, max_score=max_score)
+
+        per_artist = (
+            self._filter(
+                select(
+                    primary_artist.label("artist"),
+                    func.count().label("track_count"),
+                    func.sum(TrackModel.played_count).label("plays_count"),
+                    func.count().filter(rated).label("rated_count"),
+                    cast(func.sum(TrackModel.score).filter(rated), Float).label("rated_sum"),
+                ),
+                user_id=user_id,
+                track_filter=TrackFilter(source=source),
+            )
+            .group_by(primary_artist)
+            .cte("per_artist")
+        )
+
+        # Mean of all the ratings, computed once over the artists totals
+        global_mean = select(
+            func.coalesce(func.sum(per_artist.c.rated_sum) / func.nullif(func.sum(per_artist.c.rated_count), 0), 0.0)
+        ).scalar_subquery()
+
+        quality = case(
+            (
+                per_artist.c.rated_count > 0,
+                (confidence * global_mean + per_artist.c.rated_sum) / (confidence + per_artist.c.rated_count),
+            ),
+        )
+        quality_ratio = case((global_mean > 0, func.coalesce(quality, global_mean) / global_mean), else_=1.0)
+        artist_stats = select(
+            per_artist.c.artist,
+            per_artist.c.track_count,
+            per_artist.c.plays_count,
+            per_artist.c.rated_count,
+            (per_artist.c.rated_sum / func.nullif(per_artist.c.rated_count, 0)).label("rate_avg"),
+            quality.label("quality_score"),
+            (func.ln(1 + per_artist.c.track_count) * func.ln(1 + per_artist.c.plays_count) * quality_ratio).label(
+                "overall_score"
+            ),
+        ).subquery("artist_stats")
+
+        stmt = select(artist_stats)
+        if max_tracks is not None:
+            stmt = stmt.where(artist_stats.c.track_count <= max_tracks)
+        if min_rate_avg is not None:
+            stmt = stmt.where(artist_stats.c.rate_avg >= min_rate_avg)
+
+        rank = {
+            ArtistOrderBy.TRACK_COUNT: artist_stats.c.track_count,
+            ArtistOrderBy.PLAYS_COUNT: artist_stats.c.plays_count,
+            ArtistOrderBy.RATE_AVG: func.coalesce(artist_stats.c.rate_avg, 0.0),
+            ArtistOrderBy.QUALITY: func.coalesce(artist_stats.c.quality_score, 0.0),
+            ArtistOrderBy.OVERALL: artist_stats.c.overall_score,
+        }[order_by]
+        # Ties are sorted by code point, whatever the database collation
+        stmt = stmt.order_by(rank.desc(), artist_stats.c.artist.collate("C"))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
+        return [ArtistAggregate(**row._asdict()) for row in result]
+
+    async def aggregate_by_tag(
+        self,
+        user_id: uuid.UUID,
+        field: EnrichField,
+        source: TrackSource | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        order_by: TagOrderBy = TagOrderBy.TRACK_COUNT,
+        limit: int | None = None,
+    ) -> list[TagAggregate]:
+        column = getattr(TrackModel, self._ENRICH_FIELD_TO_COLUMN[field])
+
+        # One row per tag of each track: arrays are unnested, NULL locales are skipped
+        tag: ColumnElement[Any] = column if field == EnrichField.LOCALE else func.unnest(column)
+        tagged_stmt = self._filter(
+            select(tag.label("tag"), TrackModel.played_count, TrackModel.score),
+            user_id=user_id,
+            track_filter=TrackFilter(source=source),
+        )
+        if field == EnrichField.LOCALE:
+            tagged_stmt = tagged_stmt.where(column.is_not(None))
+        tagged = tagged_stmt.subquery("tagged")
+
+        rated = self._rated(tagged.c.score, min_score=min_score, max_score=max_score)
+        track_count = func.count().label("track_count")
+        plays_count = func.sum(tagged.c.played_count).label("plays_count")
+        rate_avg = cast(func.avg(tagged.c.score).filter(rated), Float).label("rate_avg")
+
+        rank = {
+            TagOrderBy.TRACK_COUNT: track_count,
+            TagOrderBy.PLAYS_COUNT: plays_count,
+            TagOrderBy.RATE_AVG: func.coalesce(rate_avg, 0.0),
+        }[order_by]
+        stmt = (
+            select(tagged.c.tag, track_count, plays_count, func.count().filter(rated).label("rated_count"), rate_avg)
+            .group_by(tagged.c.tag)
+            # Ties are sorted by code point, whatever the database collation
+            .order_by(rank.desc(), tagged.c.tag.collate("C"))
+        )
         if limit is not None:
             stmt = stmt.limit(limit)
 
-        results = await self.session.execute(stmt)
-        return [tracks_db.to_entity() for tracks_db in results.scalars().all()]
+        result = await self.session.execute(stmt)
+        return [TagAggregate(**row._asdict()) for row in result]
+
+    @staticmethod
+    def _rated(
+        score: SQLColumnExpression[int | None], min_score: int | None, max_score: int | None
+    ) -> ColumnElement[bool]:
+        """Returns the condition of the ratings counted as rated: only the ones within the score range."""
+        rated: ColumnElement[bool] = score.is_not(None)
+        if min_score is not None:
+            rated = and_(rated, score >= min_score)
+        if max_score is not None:
+            rated = and_(rated, score <= max_score)
+        return rated
 
     async def get_known_identifiers(
         self,
         user_id: uuid.UUID,
         fingerprints: list[str],
     ) -> TrackKnowIdentifiers:
+        # Each chunk is bound as a single text[] parameter (instead of one parameter per value with IN),
+        # so the statement stays the same, small and cacheable whatever the number of fingerprints.
         stmt = select(TrackModel.fingerprint).where(
             TrackModel.user_id == user_id,
-            TrackModel.fingerprint.in_(fingerprints),
+            TrackModel.fingerprint == any_(bindparam("fingerprints", type_=ARRAY(String))),
         )
 
-        result = await self.session.execute(stmt)
-        known_fingerprints = frozenset(row.fingerprint for row in result.fetchall())
+        known_fingerprints: set[str] = set()
+        for offset in range(0, len(fingerprints), self._KNOWN_IDENTIFIERS_CHUNK_SIZE):
+            chunk = fingerprints[offset : offset + self._KNOWN_IDENTIFIERS_CHUNK_SIZE]
+            result = await self.session.execute(stmt, {"fingerprints": chunk})
+            known_fingerprints.update(result.scalars())
 
-        return TrackKnowIdentifiers(fingerprints=known_fingerprints)
+        return TrackKnowIdentifiers(fingerprints=frozenset(known_fingerprints))
 
-    async def bulk_upsert(self, tracks: list[Track], batch_size: int) -> tuple[list[uuid.UUID], int]:
-        track_ids: list[uuid.UUID] = []
-        created_count: int = 0
+    async def search_catalog(
+        self,
+        user_id: uuid.UUID,
+        fingerprints: list[str],
+        provider: MusicProvider,
+        limit: int,
+    ) -> list[list[Track]]:
+        if not fingerprints:
+            return []
+
+        queries = (
+            func.unnest(bindparam("fingerprints", fingerprints, type_=ARRAY(String)))
+            .table_valued("fingerprint", with_ordinality="position")
+            .render_derived(name="catalog_query")
+        )
+        similarity = func.similarity(TrackModel.fingerprint, queries.c.fingerprint)
+        # Served by the trigram index, which only supports the `%` operator (similarity above the threshold
+        # of pg_trgm). The same track shared by several users is only returned once.
+        matches = (
+            select(
+                TrackModel.name,
+                TrackModel.artists,
+                TrackModel.album_name,
+                TrackModel.fingerprint,
+                TrackModel.provider_links,
+                similarity.label("similarity"),
+            )
+            .where(
+                TrackModel.fingerprint.op("%", is_comparison=True)(queries.c.fingerprint),
+                TrackModel.provider_links.contains([{"provider": provider.value}]),
+            )
+            .ext(distinct_on(similarity, TrackModel.fingerprint))
+            .order_by(similarity.desc(), TrackModel.fingerprint)
+            .limit(limit)
+            .lateral("catalog_match")
+        )
+        stmt = (
+            select(queries.c.position, matches)
+            .select_from(queries.join(matches, literal(True)))
+            .order_by(queries.c.position, matches.c.similarity.desc(), matches.c.fingerprint)
+        )
 
-        index_elements: list[str] = ["user_id", "fingerprint"]
-        # score_skipped, genres, moods, locale excluded so re-imports never overwrite user decisions/enrichment
-        index_excluded: list[str] = ["id", "score_skipped", "genres", "moods", "locale"] + index_elements
+        candidates: list[list[Track]] = [[] for _ in fingerprints]
+        for row in await self.session.execute(stmt):
+            candidates[row.position - 1].append(
+                Track(
+                    user_id=user_id,
+                    name=row.name,
+                    artists=row.artists,
+                    album_name=row.album_name,
+                    fingerprint=row.fingerprint,
+                    provider_links=[
+                        ProviderLink(provider=provider, provider_id=link["provider_id"])
+                        for link in row.provider_links
+                        if link["provider"] == provider.value
+                    ],
+                )
+            )
 
-        tracks_dicts: list[dict[str, Any]] = [dataclasses.asdict(track) for track in tracks]
+        return candidates
 
-        total: int = len(tracks_dicts)
-        for offset in range(0, total, batch_size):
-            tracks_chunk = tracks_dicts[offset : offset + batch_size]
+    async def bulk_ingest(
+        self,
+        tracks: list[Track],
+        increment_played_count: bool = False,
+        commit: bool = True,
+    ) -> tuple[dict[str, uuid.UUID], int]:
+        if not tracks:
+            return {}, 0
+
+        # Binary COPY into a transaction-scoped staging table: a single round trip for all the rows,
+        # without building (and having Postgres parse) a huge multi-row VALUES statement.
+        connection = await self.session.connection()
+        await connection.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {self._INGEST_STAGING_TABLE} "
+                f"(LIKE {TrackModel.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            self._INGEST_STAGING_TABLE,
+            records=[self._to_ingest_record(track) for track in tracks],
+            columns=self._INGEST_COLUMNS,
+        )
 
-            stmt = pg_insert(TrackModel).values(tracks_chunk)
-            excluded = stmt.excluded
+        # Then merged at once.
+        staging = table(self._INGEST_STAGING_TABLE, *(column(name) for name in self._INGEST_COLUMNS))
+        stmt = pg_insert(TrackModel).from_select(self._INGEST_COLUMNS, select(*staging.c))
+        upsert_stmt = stmt.on_conflict_do_update(
+            index_elements=self._UPSERT_INDEX_ELEMENTS,
+            set_=self._build_upsert_set(
+                stmt.excluded,
+                keys=self._INGEST_COLUMNS,
+                increment_played_count=increment_played_count,
+            ),
+        ).returning(
+            TrackModel.fingerprint,
+            TrackModel.id,
+            text("(xmax = 0) AS was_created"),
+        )
+        rows = (await self.session.execute(upsert_stmt)).all()
+
+        # ON COMMIT DROP is not enough when the session runs within an outer transaction.
+        await connection.execute(text(f"DROP TABLE {self._INGEST_STAGING_TABLE}"))
+        if commit:
+            await self.session.commit()
+
+        return {row[0]: row[1] for row in rows}, sum(row[2] for row in rows)
+
+    @classmethod
+    def _build_upsert_set(
+        cls,
+        excluded: ReadOnlyColumnCollection[str, KeyedColumnElement[Any]],
+        keys: Iterable[str],
+        increment_played_count: bool,
+    ) -> dict[str, Any]:
+        return {
+            key: (
+                func.greatest(getattr(TrackModel, key), excluded[key])
+                if key == "played_at_last"
+                else func.least(
+                    func.coalesce(getattr(TrackModel, key), excluded[key]),
+                    func.coalesce(excluded[key], getattr(TrackModel, key)),
+                )
+                if key == "played_at_first"
+                else getattr(TrackModel, key).op("|")(excluded[key])
+                if key == "source"
+                else func.coalesce(getattr(TrackModel, key), excluded[key])
+                if key == "score"
+                else TrackModel.provider_links.op("||")(excluded[key])
+                if key == "provider_links"
+                # Tracks never played yet (e.g. discovered ones) only hold the default count.
+                else case(
+                    (TrackModel.played_at_last.is_(None), excluded[key]),
+                    else_=TrackModel.played_count + excluded[key],
+                )
+                if key == "played_count" and increment_played_count
+                else excluded[key]
+            )
+            for key in keys
+            if key not in cls._UPSERT_EXCLUDED
+        }
+
+    @staticmethod
+    def _to_ingest_record(track: Track) -> tuple[Any, ...]:
+        # Must match _INGEST_COLUMNS. JSONB values are given as JSON text to the driver codec.
+        return (
+            track.id,
+            track.user_id,
+            track.name,
+            json.dumps(track.artists),
+            track.album_name,
+            track.fingerprint,
+            json.dumps(
+                [{"provider": link.provider.value, "provider_id": link.provider_id} for link in track.provider_links]
+            ),
+            track.played_at_first,
+            track.played_at_last,
+            track.played_count,
+            int(track.source),
+            track.score,
+            track.score_skipped,
+            [genre.value for genre in track.genres],
+            [mood.value for mood in track.moods],
+            track.locale,
+        )
 
-            upsert_stmt = stmt.on_conflict_do_update(
-                index_elements=index_elements,
-                set_={
-                    key: (
-                        func.greatest(getattr(TrackModel, key), excluded[key])
-                        if key == "played_at_last"
-                        else func.least(
-                            func.coalesce(getattr(TrackModel, key), excluded[key]),
-                            func.coalesce(excluded[key], getattr(TrackModel, key)),
+    async def bulk_patch(
+        self,
+        user_id: uuid.UUID,
+        rows: list[dict[TrackField, Any]],
+        fields: frozenset[TrackField],
+        key: TrackField = TrackField.ID,
+    ) -> TrackPatchResult:
+        if key not in self._PATCH_KEY_TYPES:
+            raise ValueError(f"Tracks cannot be patched by {key}")
+        if not fields <= self._PATCH_FIELD_TYPES.keys():
+            raise ValueError(f"Track fields cannot be patched: {sorted(fields - self._PATCH_FIELD_TYPES.keys())}")
+
+        # The last row of a key wins, as a joined UPDATE would apply an arbitrary one.
+        rows_by_key = {row[key]: row for row in rows}
+        if not rows_by_key or not fields:
+            return TrackPatchResult(matched_keys=frozenset(), unmatched_keys=frozenset(rows_by_key))
+
+        patch_fields = sorted(fields)
+        matched_keys: set[uuid.UUID | str] = set()
+        keys = list(rows_by_key)
+
+        for offset in range(0, len(keys), self._PATCH_CHUNK_SIZE):
+            chunk_keys = keys[offset : offset + self._PATCH_CHUNK_SIZE]
+
+            # One array per column, zipped back into rows by unnest: the statement stays the same whatever
+            # the chunk size. The tags are given as JSON arrays, as unnest would flatten arrays of arrays.
+            arrays = [bindparam("key", chunk_keys, type_=ARRAY(self._PATCH_KEY_TYPES[key]))]
+            for field in patch_fields:
+                values = [rows_by_key[k][field] for k in chunk_keys]
+                if field in self._PATCH_TAG_FIELDS:
+                    values = [json.dumps([str(tag) for tag in tags]) for tags in values]
+                arrays.append(bindparam(field.value, values, type_=ARRAY(self._PATCH_FIELD_TYPES[field])))
+
+            patch = (
+                func.unnest(*arrays)
+                .table_valued("key", *(field.value for field in patch_fields))
+                .render_derived(name="patch")
+            )
+            stmt = (
+                update(TrackModel)
+                .where(TrackModel.user_id == user_id)
+                .where(self._FIELD_TO_COLUMN[key] == patch.c.key)
+                .values(
+                    {
+                        field.value: (
+                            func.array(
+                                select(func.jsonb_array_elements_text(cast(patch.c[field.value], JSONB)))
+                                .correlate(patch)
+                                .scalar_subquery()
+                            )
+                            if field in self._PATCH_TAG_FIELDS
+                            else patch.c[field.value]
                         )
-                        if key == "played_at_first"
-                        else getattr(TrackModel, key).op("|")(excluded[key])
-                        if key == "source"
-                        else func.coalesce(getattr(TrackModel, key), excluded[key])
-                        if key == "score"
-                        else TrackModel.provider_links.op("||")(excluded[key])
-                        if key == "provider_links"
-                        else excluded[key]
-                    )
-                    for key in tracks_chunk[0]
-                    if key not in index_excluded
-                },
-            ).returning(
-                TrackModel.id,
-                text("(xmax = 0) AS was_created"),
+                        for field in patch_fields
+                    }
+                )
+                .returning(patch.c.key)
             )
-
-            results = await self.session.execute(upsert_stmt)
-            rows = results.all()
-
-            track_ids.extend([row[0] for row in rows])
-            created_count += sum(row[1] for row in rows)
+            result = await self.session.execute(stmt)
+            matched_keys.update(result.scalars("key").all())
 
         await self.session.commit()
 
-        return track_ids, created_count
-
-    async def bulk_update(self, tracks: list[Track], fields: frozenset[EnrichField]) -> None:
-        if not tracks:
-            return
-        columns = {self._ENRICH_FIELD_TO_COLUMN[f] for f in fields}
-
-        await self.session.execute(
-            update(TrackModel),
-            [{"id": t.id, **{col: getattr(t, col) for col in columns}} for t in tracks],
+        return TrackPatchResult(
+            matched_keys=frozenset(matched_keys),
+            unmatched_keys=frozenset(k for k in keys if k not in matched_keys),
         )
-        await self.session.commit()
 
     async def rate(self, user_id: uuid.UUID, track_id: uuid.UUID, score: int) -> None:
         stmt = (
@@ -256,7 +823,7 @@ class TrackSQLRepository(TrackRepository):
         stmt = (
             update(TrackModel)
             .where(TrackModel.user_id == user_id)
-            .where(TrackModel.source.op("&")(int(source)) != 0)
+            .where(_has_source(source))
             .values(score=None)
             .returning(TrackModel.id)
         )
@@ -280,11 +847,11 @@ class TrackSQLRepository(TrackRepository):
         stmt = delete(TrackModel).where(TrackModel.user_id == user_id)
 
         if artist_name is not None:
-            stmt = stmt.where(func.lower(TrackModel.artists[0].as_string()) == artist_name.lower())
+            stmt = stmt.where(PRIMARY_ARTIST_LOWER == artist_name.lower())
         if track_name is not None:
             stmt = stmt.where(func.lower(TrackModel.name) == track_name.lower())
         if source is not None:
-            stmt = stmt.where(TrackModel.source.op("&")(int(source)) != 0)
+            stmt = stmt.where(_has_source(source))
 
         result = await self.session.execute(stmt)
         await self.session.commit()
@@ -294,8 +861,8 @@ class TrackSQLRepository(TrackRepository):
         return await self._strip_provider_and_delete_empty(user_id=user_id, provider=provider)
 
     async def _strip_provider_and_delete_empty(self, user_id: uuid.UUID, provider: MusicProvider) -> int:
-        # Step 1: Remove provider link from all tracks that have it
-        await self.session.execute(
+        # Step 1: Remove the provider link from the tracks found through the link table
+        result = await self.session.execute(
             text("""
                 UPDATE museflow_track
                 SET provider_links = (
@@ -303,18 +870,23 @@ class TrackSQLRepository(TrackRepository):
                     FROM jsonb_array_elements(provider_links) AS elem
                     WHERE elem->>'provider' != :provider
                 )
-                WHERE user_id = :user_id
-                  AND EXISTS (
-                      SELECT 1 FROM jsonb_array_elements(provider_links) AS elem
-                      WHERE elem->>'provider' = :provider
-                  )
-            """).bindparams(user_id=user_id, provider=provider.value)
+                WHERE id IN (
+                    SELECT track_id FROM museflow_track_provider_link
+                    WHERE user_id = :user_id AND provider = :link_provider
+                )
+                RETURNING id, provider_links = '[]'::jsonb AS is_empty
+            """).bindparams(
+                bindparam("link_provider", provider, type_=TrackProviderLinkModel.provider.type),
+                user_id=user_id,
+                provider=provider.value,
+            )
         )
+        empty_track_ids = [track_id for track_id, is_empty in result if is_empty]
 
-        # Step 2: Delete tracks now left with no provider links
+        # Step 2: Delete the tracks now left with no provider links
         delete_stmt = delete(TrackModel).where(
             TrackModel.user_id == user_id,
-            func.jsonb_array_length(TrackModel.provider_links) == 0,
+            TrackModel.id == any_(bindparam("track_ids", empty_track_ids, ARRAY(UUID))),
         )
         result = await self.session.execute(delete_stmt)
 
@@ -1,44 +1,261 @@
 import asyncio
+import hashlib
+import io
 import logging
+import mmap
+import multiprocessing
+import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import UTC
 from datetime import datetime
+from enum import StrEnum
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import IO
+from typing import Any
 
 import ijson
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from museflow.application.inputs.history import StreamingHistoryEntry
+from museflow.application.inputs.history import StreamingHistoryFileInfo
 from museflow.application.inputs.history import StreamingHistoryFileStats
+from museflow.application.ports.providers.history import FileAggregates
 from museflow.application.ports.providers.history import StreamingHistoryPort
+from museflow.application.utils.history import StreamingHistoryAggregator
+from museflow.domain.exceptions import StreamingHistoryDirectoryNotFound
 from museflow.domain.exceptions import StreamingHistoryInvalidFormat
 
 logger = logging.getLogger(__name__)
 
 
+class HistoryJsonBackend(StrEnum):
+    # The whole file is decoded at once, several times faster than streaming it (requires the `orjson` extra).
+    ORJSON = "orjson"
+    # The file is streamed with the fastest ijson backend available (the C `yajl2_c` one for the wheels).
+    IJSON = "ijson"
+
+
 class SpotifyStreamingHistoryAdapter(StreamingHistoryPort):
-    async def parse_file(
+    # Files larger than this are always streamed, so the memory used per worker stays bounded.
+    FULL_LOAD_MAX_SIZE: int = 128 * 1024 * 1024
+
+    def __init__(self, json_backend: HistoryJsonBackend | None = None) -> None:
+        """
+        Args:
+            json_backend: Forces the parser of the files. By default, each file is decoded at once with orjson
+                          when it is installed and the file is not larger than `FULL_LOAD_MAX_SIZE`,
+                          and streamed with ijson otherwise.
+
+        Raises:
+            ValueError: If the orjson backend is forced while orjson is not installed.
+        """
+        if json_backend == HistoryJsonBackend.ORJSON and orjson is None:
+            raise ValueError("The orjson backend requires the `orjson` extra to be installed.")
+
+        self._json_backend = json_backend
+
+    def iter_entries(
+        self,
+        path: Path,
+        min_ms_played: int,
+    ) -> Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats]:
+        return self._iter_entries_sync(path=path, min_ms_played=min_ms_played, json_backend=self._json_backend)
+
+    async def aggregate_files(
         self,
+        paths: list[Path],
+        min_ms_played: int,
+        jobs: int = 1,
+        imported_ranges: list[tuple[datetime, datetime]] | None = None,
+    ) -> AsyncGenerator[FileAggregates]:
+        if jobs <= 1 or len(paths) <= 1:
+            for path in paths:
+                yield await asyncio.to_thread(
+                    self._aggregate_file_sync,
+                    path=path,
+                    min_ms_played=min_ms_played,
+                    imported_ranges=imported_ranges,
+                    json_backend=self._json_backend,
+                )
+            return
+
+        # ijson iteration is pure Python and GIL-bound: only separate processes scale with cores.
+        # Workers send back the compact per-fingerprint aggregates, never the raw play events.
+        # At most `jobs` files are in flight: no new file is submitted while the consumer lags behind.
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[FileAggregates]] = deque()
+        paths_left = iter(paths)
+
+        # Spawned rather than forked: the event loop process already runs threads (see `describe_files`).
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths)), mp_context=mp_context) as executor:
+
+            def submit(path: Path) -> None:
+                pending.append(
+                    loop.run_in_executor(
+                        executor,
+                        partial(
+                            self._aggregate_file_sync,
+                            path=path,
+                            min_ms_played=min_ms_played,
+                            imported_ranges=imported_ranges,
+                            json_backend=self._json_backend,
+                        ),
+                    )
+                )
+
+            for path in islice(paths_left, jobs):
+                submit(path)
+
+            try:
+                while pending:
+                    result = await pending.popleft()
+                    if (next_path := next(paths_left, None)) is not None:
+                        submit(next_path)
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def list_files(self, path: Path) -> list[Path]:
+        return await asyncio.to_thread(self._list_files_sync, path)
+
+    async def describe_files(self, paths: list[Path]) -> list[StreamingHistoryFileInfo]:
+        return list(await asyncio.gather(*(asyncio.to_thread(self._describe_file_sync, path) for path in paths)))
+
+    @staticmethod
+    def _list_files_sync(path: Path) -> list[Path]:
+        if path.is_dir():
+            return sorted(path.glob("*.json"))
+
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                return sorted(
+                    path / info.filename
+                    for info in archive.infolist()
+                    if not info.is_dir() and info.filename.endswith(".json")
+                )
+
+        raise StreamingHistoryDirectoryNotFound(f"Neither a directory nor a ZIP archive: {path}")
+
+    @staticmethod
+    def _split_archive_member(path: Path) -> tuple[Path, str] | None:
+        # A member of a ZIP archive is addressed as `<archive>/<member>`: its closest existing ancestor is a file.
+        archive = next((parent for parent in path.parents if parent.is_file()), None)
+        return (archive, path.relative_to(archive).as_posix()) if archive is not None else None
+
+    @staticmethod
+    @contextmanager
+    def _open_sync(path: Path) -> Iterator[IO[bytes]]:
+        """Opens a file, or streams a ZIP archive member without extracting it on disk."""
+        if (member := SpotifyStreamingHistoryAdapter._split_archive_member(path)) is None:
+            with open(path, "rb") as f:
+                yield f
+            return
+
+        archive_path, member_name = member
+        with zipfile.ZipFile(archive_path) as archive, archive.open(member_name) as f:
+            yield f
+
+    @staticmethod
+    def _stat_sync(path: Path) -> tuple[int, datetime]:
+        """Returns the (uncompressed) size and the modification time of a file or of a ZIP archive member."""
+        if (member := SpotifyStreamingHistoryAdapter._split_archive_member(path)) is None:
+            stat = path.stat()
+            return stat.st_size, datetime.fromtimestamp(stat.st_mtime, tz=UTC)
+
+        archive_path, member_name = member
+        with zipfile.ZipFile(archive_path) as archive:
+            info = archive.getinfo(member_name)
+        # ZIP timestamps carry no timezone: they are the local time of the machine which wrote the archive.
+        return info.file_size, datetime(*info.date_time).astimezone(UTC)
+
+    @staticmethod
+    def _describe_file_sync(path: Path) -> StreamingHistoryFileInfo:
+        size, modified_at = SpotifyStreamingHistoryAdapter._stat_sync(path)
+
+        # Hashed on the uncompressed content: a file has the same hash whether it is read from a directory or from
+        # the export archive.
+        with SpotifyStreamingHistoryAdapter._open_sync(path) as f:
+            digest = hashlib.file_digest(f, "sha256")  # type: ignore[arg-type]
+
+        # Keyed on the path within the archive: members of different folders may share the same file name.
+        member = SpotifyStreamingHistoryAdapter._split_archive_member(path)
+        return StreamingHistoryFileInfo(
+            name=member[1] if member is not None else path.name,
+            size=size,
+            modified_at=modified_at,
+            content_hash=digest.hexdigest(),
+        )
+
+    @staticmethod
+    def _aggregate_file_sync(
         path: Path,
         min_ms_played: int,
-    ) -> tuple[list[StreamingHistoryEntry], StreamingHistoryFileStats]:
-        return await asyncio.to_thread(
-            self._parse_file_sync,
-            path=path,
-            min_ms_played=min_ms_played,
+        imported_ranges: list[tuple[datetime, datetime]] | None = None,
+        json_backend: HistoryJsonBackend | None = None,
+    ) -> FileAggregates:
+        aggregator = StreamingHistoryAggregator(imported_ranges=imported_ranges)
+        stats = aggregator.consume(
+            SpotifyStreamingHistoryAdapter._iter_entries_sync(
+                path=path,
+                min_ms_played=min_ms_played,
+                json_backend=json_backend,
+            )
         )
+        return aggregator.aggregates, stats
+
+    @staticmethod
+    def _select_json_backend(size: int) -> HistoryJsonBackend:
+        if orjson is not None and size <= SpotifyStreamingHistoryAdapter.FULL_LOAD_MAX_SIZE:
+            return HistoryJsonBackend.ORJSON
+        return HistoryJsonBackend.IJSON
 
     @staticmethod
-    def _parse_file_sync(
-        path: Path, min_ms_played: int
-    ) -> tuple[list[StreamingHistoryEntry], StreamingHistoryFileStats]:
-        track_entries: list[StreamingHistoryEntry] = []
+    def _load_items_sync(f: IO[bytes], size: int) -> list[Any]:
+        # A regular file is decoded straight from its memory mapping, without copying it into a bytes object first.
+        if isinstance(f, io.BufferedReader) and size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer, memoryview(buffer) as view:
+                items = orjson.loads(view)
+        else:
+            items = orjson.loads(f.read())
 
+        # Same as streaming the `item` prefix: only the elements of a top-level array are play events.
+        return items if isinstance(items, list) else []
+
+    @staticmethod
+    def _iter_entries_sync(
+        path: Path,
+        min_ms_played: int,
+        json_backend: HistoryJsonBackend | None = None,
+    ) -> Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats]:
         items_read = 0
         items_skipped_no_timestamp = 0
         items_skipped_short_play = 0
         items_skipped_no_track_id = 0
 
         try:
-            with open(path, "rb") as f:
-                for item in ijson.items(f, "item"):
+            size, _ = SpotifyStreamingHistoryAdapter._stat_sync(path)
+            json_backend = json_backend or SpotifyStreamingHistoryAdapter._select_json_backend(size)
+
+            with SpotifyStreamingHistoryAdapter._open_sync(path) as f:
+                items = (
+                    SpotifyStreamingHistoryAdapter._load_items_sync(f, size)
+                    if json_backend == HistoryJsonBackend.ORJSON
+                    else ijson.items(f, "item")
+                )
+                for item in items:
                     items_read += 1
 
                     ts_raw = item.get("ts")
@@ -66,19 +283,17 @@ class SpotifyStreamingHistoryAdapter(StreamingHistoryPort):
                     artist = item.get("master_metadata_album_artist_name") or ""
                     album_name = item.get("master_metadata_album_album_name") or None
 
-                    track_entries.append(
-                        StreamingHistoryEntry(
-                            provider_id=track_id,
-                            played_at=ts,
-                            name=name,
-                            artist=artist,
-                            album_name=album_name,
-                        )
+                    yield StreamingHistoryEntry(
+                        provider_id=track_id,
+                        played_at=ts,
+                        name=name,
+                        artist=artist,
+                        album_name=album_name,
                     )
         except Exception as exc:
             raise StreamingHistoryInvalidFormat(f"Failed to parse {path}: {exc}") from exc
 
-        return track_entries, StreamingHistoryFileStats(
+        return StreamingHistoryFileStats(
             items_read=items_read,
             items_skipped_no_timestamp=items_skipped_no_timestamp,
             items_skipped_short_play=items_skipped_short_play,
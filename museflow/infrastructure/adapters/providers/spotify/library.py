@@ -20,7 +20,7 @@ from museflow.domain.exceptions import ProviderPageValidationError
 from museflow.domain.exceptions import ProviderPremiumRequiredException
 from museflow.infrastructure.adapters.providers.spotify.exceptions import SpotifyApiError
 from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_playlist
-from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_track
+from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_tracks
 from museflow.infrastructure.adapters.providers.spotify.oauth import SpotifyOAuthAdapter
 from museflow.infrastructure.adapters.providers.spotify.queries import SpotifySearchTrackQuery
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPage
@@ -261,4 +261,4 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
     # -------------------------------------------------------------------------
 
     def _extract_search_tracks(self, page: SpotifyPage[SpotifyTrack], *_: Any) -> list[Track]:
-        return [to_domain_track(item, user_id=self.user.id) for item in page.items if item]
+        return to_domain_tracks([item for item in page.items if item], user_id=self.user.id)
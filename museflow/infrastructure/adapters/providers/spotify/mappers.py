@@ -6,6 +6,7 @@ from museflow.domain.entities.track import Track
 from museflow.domain.enums import MusicProvider
 from museflow.domain.enums import PlaylistType
 from museflow.domain.enums import TrackSource
+from museflow.domain.services.fingerprint import fingerprint_service
 from museflow.domain.value_objects.auth import OAuthProviderTokenPayload
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylist
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyToken
@@ -35,18 +36,37 @@ def to_domain_token_payload(
 def to_domain_track(
     spotify_track: SpotifyTrack,
     user_id: uuid.UUID,
+    fingerprint: str = "",
 ) -> Track:
-    """Converts a SpotifyTrack schema object to a domain Track entity."""
+    """Converts a SpotifyTrack schema object to a domain Track entity.
+
+    The fingerprint is computed by the entity when it is not provided.
+    """
     return Track(
         user_id=user_id,
         name=spotify_track.name,
         provider_links=[ProviderLink(provider=MusicProvider.SPOTIFY, provider_id=spotify_track.id)],
         artists=[artist.name for artist in spotify_track.artists],
         album_name=spotify_track.album.name if spotify_track.album else None,
+        fingerprint=fingerprint,
         source=TrackSource.HISTORY,
     )
 
 
+def to_domain_tracks(
+    spotify_tracks: list[SpotifyTrack],
+    user_id: uuid.UUID,
+) -> list[Track]:
+    fingerprints = fingerprint_service.generate_fingerprints(
+        (spotify_track.name, spotify_track.artists[0].name if spotify_track.artists else None)
+        for spotify_track in spotify_tracks
+    )
+    return [
+        to_domain_track(spotify_track, user_id=user_id, fingerprint=fingerprint)
+        for spotify_track, fingerprint in zip(spotify_tracks, fingerprints, strict=True)
+    ]
+
+
 def to_domain_playlist(
     spotify_playlist: SpotifyPlaylist,
     user_id: uuid.UUID,
@@ -47,6 +47,8 @@ class AppSettings(BaseSettings):
     DISCOVERY_BLACKLIST_SCORE_THRESHOLD: int = 3
     DISCOVERY_LIKED_SCORE_THRESHOLD: int = 7
     DISCOVERY_LIKED_TRACKS_LIMIT: int = 200  # 200 is a quality cap, not a technical constraint (higher is noise)
+    DISCOVERY_RESOLUTION_TTL_DAYS: int = 30
+    DISCOVERY_RESOLUTION_NEGATIVE_TTL_DAYS: int = 1  # Short: new releases may be reconciled later
 
     STATS_BAYESIAN_CONFIDENCE: int = 5
 
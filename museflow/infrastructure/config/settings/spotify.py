@@ -28,6 +28,8 @@ class SpotifySettings(BaseSettings):
     HTTP_MAX_RETRIES: int = 5
     HTTP_MAX_RETRY_WAIT: int = 60
 
+    SEARCH_CONCURRENCY: int = 5  # Spotify rate limits over a rolling window: bursts end up with 429
+
     TOKEN_BUFFER_SECONDS: int = 60 * 5
 
 
@@ -8,6 +8,7 @@ from pydantic import EmailStr
 import typer
 import yaml
 
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.enrich import app
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
@@ -49,14 +50,19 @@ async def export_logic(email: EmailStr) -> list[dict[str, Any]]:
         if user is None:
             raise UserNotFound()
 
-        tracks = await track_repository.get_list(user_id=user.id)
-        enriched = [t for t in tracks if t.genres]
-        return [
-            {
-                "fingerprint": t.fingerprint,
-                "genres": [g.value for g in t.genres],
-                "moods": [m.value for m in t.moods],
-                "locale": t.locale,
-            }
-            for t in enriched
-        ]
+        result: list[dict[str, Any]] = []
+        async for rows in track_repository.iter_rows(
+            fields=[TrackField.FINGERPRINT, TrackField.GENRES, TrackField.MOODS, TrackField.LOCALE],
+            user_id=user.id,
+        ):
+            result += [
+                {
+                    "fingerprint": row["fingerprint"],
+                    "genres": row["genres"],
+                    "moods": row["moods"],
+                    "locale": row["locale"],
+                }
+                for row in rows
+                if row["genres"]
+            ]
+        return result
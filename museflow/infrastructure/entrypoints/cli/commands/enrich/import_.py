@@ -1,5 +1,4 @@
 import asyncio
-import dataclasses
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,7 +11,7 @@ import typer
 import yaml
 
 from museflow.application.inputs.enrich import EnrichEntryInput
-from museflow.domain.enums import EnrichField
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.enrich import app
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
@@ -70,21 +69,21 @@ async def import_logic(email: EmailStr, data: list[Any]) -> EnrichImportResult:
 
         entries = TypeAdapter(list[EnrichEntryInput]).validate_python(data)
 
-        all_tracks = await track_repository.get_list(user_id=user.id)
-        fingerprint_to_track = {t.fingerprint: t for t in all_tracks}
-
-        updated_tracks = []
-        not_found_count = 0
-        for entry in entries:
-            if entry.fingerprint not in fingerprint_to_track:
-                not_found_count += 1
-                continue
-            track = fingerprint_to_track[entry.fingerprint]
-            updated_tracks.append(
-                dataclasses.replace(track, genres=entry.genres, moods=entry.moods, locale=entry.locale)
-            )
-
-        if updated_tracks:
-            await track_repository.bulk_update(updated_tracks, fields=frozenset(EnrichField))
-
-        return EnrichImportResult(imported_count=len(updated_tracks), not_found_count=not_found_count)
+        # Written by fingerprint in a single pass, without loading the library first.
+        result = await track_repository.bulk_patch(
+            user_id=user.id,
+            rows=[
+                {
+                    TrackField.FINGERPRINT: entry.fingerprint,
+                    TrackField.GENRES: entry.genres,
+                    TrackField.MOODS: entry.moods,
+                    TrackField.LOCALE: entry.locale,
+                }
+                for entry in entries
+            ],
+            fields=frozenset([TrackField.GENRES, TrackField.MOODS, TrackField.LOCALE]),
+            key=TrackField.FINGERPRINT,
+        )
+
+        not_found_count = sum(1 for entry in entries if entry.fingerprint in result.unmatched_keys)
+        return EnrichImportResult(imported_count=len(entries) - not_found_count, not_found_count=not_found_count)
@@ -1,5 +1,6 @@
 import asyncio
 from contextlib import AsyncExitStack
+from datetime import timedelta
 
 from pydantic import EmailStr
 
@@ -22,6 +23,7 @@ from museflow.domain.exceptions import TasteProfileNotFoundException
 from museflow.domain.exceptions import TasteProfileStatusNotReadyException
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.config.settings.app import app_settings
+from museflow.infrastructure.config.settings.spotify import spotify_settings
 from museflow.infrastructure.entrypoints.cli.commands.playlist import app
 from museflow.infrastructure.entrypoints.cli.dependencies import ADVISOR_TO_PROFILER
 from museflow.infrastructure.entrypoints.cli.dependencies import get_advisor_adapter
@@ -34,6 +36,7 @@ from museflow.infrastructure.entrypoints.cli.dependencies import get_provider_oa
 from museflow.infrastructure.entrypoints.cli.dependencies import get_reconciler
 from museflow.infrastructure.entrypoints.cli.dependencies import get_taste_profile_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_track_repository
+from museflow.infrastructure.entrypoints.cli.dependencies import get_track_resolution_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_user_repository
 from museflow.infrastructure.entrypoints.cli.parsers import parse_email
 
@@ -113,9 +116,12 @@ def discover(
                     custom_instructions=custom_instructions,
                     advisor_limit=advisor_limit,
                     reconciler_limit=reconciler_limit,
+                    reconciler_concurrency=spotify_settings.SEARCH_CONCURRENCY,
                     score_band_width=app_settings.DISCOVERY_SCORE_BAND_WIDTH,
                     liked_tracks_score_threshold=app_settings.DISCOVERY_LIKED_SCORE_THRESHOLD,
                     liked_tracks_limit=app_settings.DISCOVERY_LIKED_TRACKS_LIMIT,
+                    resolution_ttl=timedelta(days=app_settings.DISCOVERY_RESOLUTION_TTL_DAYS),
+                    resolution_negative_ttl=timedelta(days=app_settings.DISCOVERY_RESOLUTION_NEGATIVE_TTL_DAYS),
                     playlist_limit=playlist_limit,
                     max_attempts=max_attempts,
                     max_tracks_per_artist=max_tracks_per_artist,
@@ -231,6 +237,7 @@ async def discover_logic(
         user_repository = get_user_repository(session)
         auth_token_repository = get_auth_token_repository(session)
         track_repository = get_track_repository(session)
+        track_resolution_repository = get_track_resolution_repository(session)
         taste_profile_repository = get_taste_profile_repository(session)
         blacklist_repository = get_blacklist_repository(session)
         playlist_repository = get_playlist_repository(session)
@@ -257,6 +264,7 @@ async def discover_logic(
 
         use_case = DiscoverTasteUseCase(
             track_repository=track_repository,
+            track_resolution_repository=track_resolution_repository,
             taste_profile_repository=taste_profile_repository,
             blacklist_repository=blacklist_repository,
             playlist_repository=playlist_repository,
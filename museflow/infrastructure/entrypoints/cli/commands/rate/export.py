@@ -8,7 +8,9 @@ from pydantic import EmailStr
 import typer
 import yaml
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.const import DISCOVERY_TRACK_SCORE_MIN
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.rate import app
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
@@ -52,9 +54,17 @@ async def export_logic(email: EmailStr) -> list[dict[str, Any]]:
         if user is None:
             raise UserNotFound()
 
-        rated = await track_repository.get_list(user_id=user.id, min_score=DISCOVERY_TRACK_SCORE_MIN)
-        skipped = await track_repository.get_list(user_id=user.id, score_skipped_only=True)
-
-        result: list[dict[str, Any]] = [{"fingerprint": t.fingerprint, "score": t.score} for t in rated]
-        result += [{"fingerprint": t.fingerprint, "score_skipped": True} for t in skipped]
+        result: list[dict[str, Any]] = []
+        async for rows in track_repository.iter_rows(
+            fields=[TrackField.FINGERPRINT, TrackField.SCORE],
+            user_id=user.id,
+            track_filter=TrackFilter(min_score=DISCOVERY_TRACK_SCORE_MIN),
+        ):
+            result += [{"fingerprint": row["fingerprint"], "score": row["score"]} for row in rows]
+        async for rows in track_repository.iter_rows(
+            fields=[TrackField.FINGERPRINT],
+            user_id=user.id,
+            track_filter=TrackFilter(score_skipped_only=True),
+        ):
+            result += [{"fingerprint": row["fingerprint"], "score_skipped": True} for row in rows]
         return result
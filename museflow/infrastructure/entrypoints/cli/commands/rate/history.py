@@ -7,6 +7,7 @@ from pydantic import EmailStr
 
 import typer
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.providers.library import ProviderLibraryPort
 from museflow.application.use_cases.rate import track_rate
 from museflow.application.use_cases.rate import track_skip
@@ -127,12 +128,14 @@ async def rate_history_logic(
 
         tracks = await track_repository.get_list(
             user_id=user.id,
-            source=TrackSource.HISTORY,
-            unrated_only=True,
-            exclude_skipped=True,
+            track_filter=TrackFilter(
+                source=TrackSource.HISTORY,
+                unrated_only=True,
+                exclude_skipped=True,
+                artist_name=artist,
+            ),
             order=[(TrackOrderBy.PLAYED_COUNT, SortOrder.DESC)],
             limit=limit,
-            artist_name=artist,
         )
         if not tracks:
             return RateHistoryResult(no_tracks=True)
@@ -11,7 +11,7 @@ import typer
 import yaml
 
 from museflow.application.inputs.rate import RateEntryInput
-from museflow.application.use_cases.rate import track_skip
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.rate import app
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
@@ -70,22 +70,47 @@ async def import_logic(email: EmailStr, data: list[Any]) -> RateImportResult:
 
         entries = TypeAdapter(list[RateEntryInput]).validate_python(data)
 
-        all_tracks = await track_repository.get_list(user_id=user.id)
-        fingerprint_to_id = {t.fingerprint: t.id for t in all_tracks}
+        # Scores and permanent skips are written by fingerprint, without loading the library first.
+        skipped = await track_repository.bulk_patch(
+            user_id=user.id,
+            rows=[
+                {TrackField.FINGERPRINT: entry.fingerprint, TrackField.SCORE_SKIPPED: True}
+                for entry in entries
+                if entry.score_skipped
+            ],
+            fields=frozenset([TrackField.SCORE_SKIPPED]),
+            key=TrackField.FINGERPRINT,
+        )
+        rated = await track_repository.bulk_patch(
+            user_id=user.id,
+            rows=[
+                {TrackField.FINGERPRINT: entry.fingerprint, TrackField.SCORE: entry.score}
+                for entry in entries
+                if not entry.score_skipped and entry.score is not None
+            ],
+            fields=frozenset([TrackField.SCORE]),
+            key=TrackField.FINGERPRINT,
+        )
+
+        # The entries with nothing to write are only looked up, so that the unknown ones are still reported.
+        noop_fingerprints = {entry.fingerprint for entry in entries if not entry.score_skipped and entry.score is None}
+        noop_unmatched: set[str] = set()
+        if noop_fingerprints:
+            known = await track_repository.get_known_identifiers(
+                user_id=user.id, fingerprints=sorted(noop_fingerprints)
+            )
+            noop_unmatched = noop_fingerprints - known.fingerprints
 
+        unmatched = skipped.unmatched_keys | rated.unmatched_keys | noop_unmatched
         imported_count = 0
         skipped_count = 0
         not_found_count = 0
         for entry in entries:
-            if entry.fingerprint not in fingerprint_to_id:
+            if entry.fingerprint in unmatched:
                 not_found_count += 1
-                continue
-            track_id = fingerprint_to_id[entry.fingerprint]
-            if entry.score_skipped:
-                await track_skip(track_id=track_id, user_id=user.id, track_repository=track_repository)
+            elif entry.score_skipped:
                 skipped_count += 1
             elif entry.score is not None:
-                await track_repository.rate(user_id=user.id, track_id=track_id, score=entry.score)
                 imported_count += 1
 
         return RateImportResult(
@@ -7,6 +7,7 @@ from pydantic import EmailStr
 
 import typer
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.providers.library import ProviderLibraryPort
 from museflow.application.use_cases.rate import track_rate
 from museflow.domain.const import DISCOVERY_TRACK_SCORE_MAX
@@ -133,8 +134,7 @@ async def rate_playlist_logic(
         else:
             tracks = await track_repository.get_list(
                 user_id=user.id,
-                source=TrackSource.DISCOVERY,
-                unrated_only=True,
+                track_filter=TrackFilter(source=TrackSource.DISCOVERY, unrated_only=True),
                 order=[(TrackOrderBy.CREATED_AT, SortOrder.DESC)],
                 limit=limit,
             )
@@ -1,16 +1,13 @@
 import asyncio
-import math
-from collections import defaultdict
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from typing import cast
 
 from pydantic import EmailStr
 
 import typer
 from rich.table import Table
 
-from museflow.domain.entities.track import Track
+from museflow.domain.enums import ArtistOrderBy
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.config.settings.app import app_settings
 from museflow.infrastructure.entrypoints.cli.commands.stats import app
@@ -99,16 +96,6 @@ def stats_artists(
     console.print(table)
 
 
-def _is_in_score_range(score: int | None, score_min: int | None, score_max: int | None) -> bool:
-    if score is None:
-        return False
-    if score_min is not None and score < score_min:
-        return False
-    if score_max is not None and score > score_max:
-        return False
-    return True
-
-
 async def artists_logic(
     email: EmailStr,
     limit: int,
@@ -127,61 +114,25 @@ async def artists_logic(
         if not user:
             raise UserNotFound()
 
-        all_tracks = await track_repository.get_list(
+        aggregates = await track_repository.aggregate_by_artist(
             user_id=user.id,
             source=source.to_track_source(),
-            limit=None,
+            min_score=score_min,
+            max_score=score_max,
+            confidence=confidence,
+            order_by=ArtistOrderBy(sort),
+            limit=limit,
         )
 
-    artist_tracks: dict[str, list[Track]] = defaultdict(list)
-    for track in all_tracks:
-        artist_tracks[track.primary_artist].append(track)
-
-    all_rated_scores = [cast(int, t.score) for t in all_tracks if _is_in_score_range(t.score, score_min, score_max)]
-    global_mean = sum(all_rated_scores) / len(all_rated_scores) if all_rated_scores else 0.0
-
-    rows: list[ArtistRow] = []
-    for artist, tracks in artist_tracks.items():
-        rated_scores = [cast(int, t.score) for t in tracks if _is_in_score_range(t.score, score_min, score_max)]
-        rated_count = len(rated_scores)
-        track_count = len(tracks)
-        plays_count = sum(t.played_count for t in tracks)
-
-        rate_avg: float | None
-        quality_score: float | None
-        if rated_count > 0:
-            rate_avg = sum(rated_scores) / rated_count
-            quality = (confidence * global_mean + rated_count * rate_avg) / (confidence + rated_count)
-            quality_score = quality
-        else:
-            rate_avg = None
-            quality = global_mean
-            quality_score = None
-
-        quality_ratio = quality / global_mean if global_mean > 0 else 1.0
-        overall_score = math.log(1 + track_count) * math.log(1 + plays_count) * quality_ratio
-
-        rows.append(
-            ArtistRow(
-                artist=artist,
-                quality_score=quality_score,
-                overall_score=overall_score,
-                rate_avg=rate_avg,
-                rated_count=rated_count,
-                track_count=track_count,
-                plays_count=plays_count,
-            )
+    return [
+        ArtistRow(
+            artist=aggregate.artist,
+            quality_score=aggregate.quality_score,
+            overall_score=aggregate.overall_score,
+            rate_avg=aggregate.rate_avg,
+            rated_count=aggregate.rated_count,
+            track_count=aggregate.track_count,
+            plays_count=aggregate.plays_count,
         )
-
-    if sort == ArtistSortBy.TRACK_COUNT:
-        rows.sort(key=lambda r: (-r.track_count, r.artist))
-    elif sort == ArtistSortBy.PLAYS_COUNT:
-        rows.sort(key=lambda r: (-r.plays_count, r.artist))
-    elif sort == ArtistSortBy.RATE_AVG:
-        rows.sort(key=lambda r: (-(r.rate_avg or 0.0), r.artist))
-    elif sort == ArtistSortBy.QUALITY:
-        rows.sort(key=lambda r: (-(r.quality_score or 0.0), r.artist))
-    else:
-        rows.sort(key=lambda r: (-r.overall_score, r.artist))
-
-    return rows[:limit]
+        for aggregate in aggregates
+    ]
@@ -1,15 +1,13 @@
 import asyncio
-from collections import defaultdict
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from typing import cast
 
 from pydantic import EmailStr
 
 import typer
 from rich.table import Table
 
-from museflow.domain.entities.track import Track
+from museflow.domain.enums import ArtistOrderBy
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.stats import SourceFilter
 from museflow.infrastructure.entrypoints.cli.commands.stats import app
@@ -89,39 +87,22 @@ async def candidates_logic(
         if not user:
             raise UserNotFound()
 
-        all_tracks = await track_repository.get_list(
+        aggregates = await track_repository.aggregate_by_artist(
             user_id=user.id,
             source=source.to_track_source(),
-            limit=None,
+            max_tracks=max_tracks,
+            min_rate_avg=min_avg,
+            order_by=ArtistOrderBy.RATE_AVG,
+            limit=limit,
         )
 
-    artist_tracks: dict[str, list[Track]] = defaultdict(list)
-    for track in all_tracks:
-        artist_tracks[track.primary_artist].append(track)
-
-    rows: list[CandidateRow] = []
-    for artist, tracks in artist_tracks.items():
-        total_count = len(tracks)
-        if total_count > max_tracks:
-            continue
-
-        rated_scores = [cast(int, t.score) for t in tracks if t.score is not None]
-        rated_count = len(rated_scores)
-        if rated_count == 0:
-            continue
-
-        avg_score = sum(rated_scores) / rated_count
-        if avg_score < min_avg:
-            continue
-
-        rows.append(
-            CandidateRow(
-                artist=artist,
-                avg_score=avg_score,
-                rated_count=rated_count,
-                total_count=total_count,
-            )
+    return [
+        CandidateRow(
+            artist=aggregate.artist,
+            avg_score=aggregate.rate_avg,
+            rated_count=aggregate.rated_count,
+            total_count=aggregate.track_count,
         )
-
-    rows.sort(key=lambda r: (-r.avg_score, r.artist))
-    return rows[:limit]
+        for aggregate in aggregates
+        if aggregate.rate_avg is not None
+    ]
@@ -0,0 +1,120 @@
+import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+
+from pydantic import EmailStr
+
+import typer
+from rich.table import Table
+
+from museflow.domain.enums import EnrichField
+from museflow.domain.enums import TagOrderBy
+from museflow.domain.exceptions import UserNotFound
+from museflow.infrastructure.entrypoints.cli.commands.stats import app
+from museflow.infrastructure.entrypoints.cli.commands.stats import console
+from museflow.infrastructure.entrypoints.cli.dependencies import get_db
+from museflow.infrastructure.entrypoints.cli.dependencies import get_track_repository
+from museflow.infrastructure.entrypoints.cli.dependencies import get_user_repository
+from museflow.infrastructure.entrypoints.cli.parsers import parse_email
+from museflow.infrastructure.entrypoints.cli.types import SourceFilter
+from museflow.infrastructure.entrypoints.cli.types import TagSortBy
+
+
+@dataclass(frozen=True, kw_only=True)
+class TagRow:
+    tag: str
+    rate_avg: float | None  # None for tags with no rated tracks
+    rated_count: int
+    track_count: int
+    plays_count: int
+
+
+@app.command("tags", help="Show the breakdown of the tracks per genre, mood or locale.")
+def stats_tags(
+    email: str = typer.Option(..., help="User email address", parser=parse_email),
+    field: EnrichField = typer.Option(EnrichField.GENRE, "--field", help="Tag field to break down"),
+    source: SourceFilter = typer.Option(SourceFilter.ALL, "--source", help="Track source to include"),
+    score_min: int | None = typer.Option(None, "--score-min", help="Minimum score filter (0-10)"),
+    score_max: int | None = typer.Option(None, "--score-max", help="Maximum score filter (0-10)"),
+    sort: TagSortBy = typer.Option(TagSortBy.TRACK_COUNT, "--sort", help="Ranking strategy"),
+    limit: int = typer.Option(20, help="Max rows in the table"),
+) -> None:
+    try:
+        rows = asyncio.run(
+            tags_logic(
+                email=email,
+                field=field,
+                limit=limit,
+                source=source,
+                score_min=score_min,
+                score_max=score_max,
+                sort=sort,
+            )
+        )
+    except UserNotFound as e:
+        raise typer.BadParameter(f"User not found with email: {email}") from e
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1) from e
+
+    if not rows:
+        typer.secho(f"No {field} stats found.", fg=typer.colors.YELLOW)
+        return
+
+    table = Table(title=f"Top {field.capitalize()}s")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column(field.capitalize())
+    table.add_column("Rate Avg", justify="center")
+    table.add_column("Rated", justify="right")
+    table.add_column("Tracks", justify="right")
+    table.add_column("Played", justify="right")
+    for i, row in enumerate(rows, start=1):
+        table.add_row(
+            str(i),
+            row.tag,
+            f"{row.rate_avg:.1f}" if row.rate_avg is not None else "—",
+            str(row.rated_count),
+            str(row.track_count),
+            str(row.plays_count),
+        )
+    console.print(table)
+
+
+async def tags_logic(
+    email: EmailStr,
+    field: EnrichField,
+    limit: int,
+    source: SourceFilter,
+    score_min: int | None,
+    score_max: int | None,
+    sort: TagSortBy,
+) -> list[TagRow]:
+    async with AsyncExitStack() as stack:
+        session = await stack.enter_async_context(get_db())
+        user_repository = get_user_repository(session)
+        track_repository = get_track_repository(session)
+
+        user = await user_repository.get_by_email(email)
+        if not user:
+            raise UserNotFound()
+
+        aggregates = await track_repository.aggregate_by_tag(
+            user_id=user.id,
+            field=field,
+            source=source.to_track_source(),
+            min_score=score_min,
+            max_score=score_max,
+            order_by=TagOrderBy(sort),
+            limit=limit,
+        )
+
+    return [
+        TagRow(
+            tag=aggregate.tag,
+            rate_avg=aggregate.rate_avg,
+            rated_count=aggregate.rated_count,
+            track_count=aggregate.track_count,
+            plays_count=aggregate.plays_count,
+        )
+        for aggregate in aggregates
+    ]
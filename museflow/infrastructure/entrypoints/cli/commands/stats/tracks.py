@@ -1,14 +1,17 @@
 import asyncio
+import heapq
+import itertools
 from contextlib import AsyncExitStack
-from typing import cast
 
 from pydantic import EmailStr
 
 import typer
 from rich.table import Table
 
-from museflow.domain.entities.track import Track
+from museflow.application.inputs.track import TrackFilter
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
+from museflow.domain.types import TrackRow
 from museflow.infrastructure.entrypoints.cli.commands.stats import app
 from museflow.infrastructure.entrypoints.cli.commands.stats import console
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
@@ -53,7 +56,9 @@ def stats_tracks(
     table.add_column("Score", justify="center")
     table.add_column("Played", justify="center")
     for i, track in enumerate(tracks, start=1):
-        table.add_row(str(i), ", ".join(track.artists), track.name, str(track.score), str(track.played_count))
+        table.add_row(
+            str(i), ", ".join(track["artists"]), track["name"], str(track["score"]), str(track["played_count"])
+        )
     console.print(table)
 
 
@@ -63,7 +68,7 @@ async def tracks_logic(
     score_min: int | None,
     score_max: int | None,
     sort: TrackSortBy,
-) -> list[Track]:
+) -> list[TrackRow]:
     async with AsyncExitStack() as stack:
         session = await stack.enter_async_context(get_db())
         user_repository = get_user_repository(session)
@@ -73,15 +78,23 @@ async def tracks_logic(
         if not user:
             raise UserNotFound()
 
-        tracks = await track_repository.get_list(
+        sort_key = _played_count_sort_key if sort == TrackSortBy.PLAYED_COUNT else _score_sort_key
+
+        # Only the current top tracks are kept while the library is streamed, whatever its size.
+        tracks: list[TrackRow] = []
+        async for rows in track_repository.iter_rows(
+            fields=[TrackField.ID, TrackField.NAME, TrackField.ARTISTS, TrackField.SCORE, TrackField.PLAYED_COUNT],
             user_id=user.id,
-            min_score=score_min if score_min is not None else 0,
-            max_score=score_max,
-            limit=None,
-        )
-        if sort == TrackSortBy.PLAYED_COUNT:
-            tracks.sort(key=lambda t: (-t.played_count, t.artists[0] if t.artists else ""))
-        else:
-            tracks.sort(key=lambda t: (-cast(int, t.score), t.artists[0] if t.artists else ""))
+            track_filter=TrackFilter(min_score=score_min if score_min is not None else 0, max_score=score_max),
+        ):
+            tracks = heapq.nsmallest(limit, itertools.chain(tracks, rows), key=sort_key)
+
+    return tracks
+
+
+def _score_sort_key(track: TrackRow) -> tuple[int, str]:
+    return -(track["score"] or 0), track["artists"][0] if track["artists"] else ""
+
 
-    return tracks[:limit]
+def _played_count_sort_key(track: TrackRow) -> tuple[int, str]:
+    return -track["played_count"], track["artists"][0] if track["artists"] else ""
@@ -6,6 +6,7 @@ from pydantic import EmailStr
 
 import typer
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.enums import MusicProvider
 from museflow.domain.enums import TrackSource
 from museflow.domain.exceptions import UserNotFound
@@ -81,9 +82,7 @@ async def delete_logic(
 
         tracks = await track_repository.get_list(
             user_id=user.id,
-            artist_name=artist,
-            source=source,
-            provider=provider,
+            track_filter=TrackFilter(artist_name=artist, source=source, provider=provider),
         )
         if name is not None:
             tracks = [t for t in tracks if t.name.lower() == name.lower()]
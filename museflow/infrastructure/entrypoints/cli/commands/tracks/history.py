@@ -17,19 +17,20 @@ from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.tracks import app
 from museflow.infrastructure.entrypoints.cli.commands.tracks import console
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
+from museflow.infrastructure.entrypoints.cli.dependencies import get_history_manifest_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_streaming_history_adapter
 from museflow.infrastructure.entrypoints.cli.dependencies import get_track_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_user_repository
 from museflow.infrastructure.entrypoints.cli.parsers import parse_email
 
 
-@app.command("history", help="Import extended streaming history from JSON files.")
+@app.command("history", help="Import extended streaming history from JSON files or the export ZIP archive.")
 def history(
     email: str = typer.Option(..., help="User email address", parser=parse_email),
     directory: Path = typer.Option(
         ...,
         "--directory",
-        help="Directory containing streaming history JSON files",
+        help="Directory containing streaming history JSON files, or the export ZIP archive",
     ),
     provider: MusicProvider = typer.Option(
         MusicProvider.SPOTIFY, "--provider", help="Music provider to import streaming history from"
@@ -38,11 +39,17 @@ def history(
         90, "--min-duration-played", help="Minimum duration played in seconds to include"
     ),
     batch_size: int = typer.Option(
-        20,
+        5_000,
         "--batch-size",
         help="Number of tracks to upsert per batch",
         min=1,
-        max=500,
+        max=50_000,
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        help="Number of worker processes parsing the JSON files in parallel",
+        min=1,
     ),
     purge: bool = typer.Option(False, "--purge/--no-purge", help="Purge existing tracks before import"),
 ) -> None:
@@ -52,6 +59,7 @@ def history(
         directory=directory,
         min_ms_played=min_duration_played * 1_000,
         batch_size=batch_size,
+        jobs=jobs,
         purge=purge,
     )
 
@@ -75,10 +83,13 @@ def history(
     table.add_column("Label", style="cyan")
     table.add_column("Value", justify="right", style="magenta")
 
+    table.add_row("Files read", str(report.files_read))
+    table.add_row("Files skipped (unchanged)", str(report.files_skipped_unchanged))
     table.add_row("Items read", str(report.items_read))
     table.add_row("Items skipped (no timestamp)", str(report.items_skipped_no_timestamp))
     table.add_row("Items skipped (short play)", str(report.items_skipped_short_play))
     table.add_row("Items skipped (no track ID)", str(report.items_skipped_no_track_id))
+    table.add_row("Items skipped (already imported)", str(report.items_skipped_already_imported))
     table.add_row("Unique track IDs", str(report.unique_track_ids))
     table.add_row("Tracks already known", str(report.tracks_already_known))
     table.add_row("Tracks play data updated", str(report.tracks_played_at_updated))
@@ -103,6 +114,7 @@ async def history_logic(
 
         use_case = ImportStreamingHistoryUseCase(
             track_repository=track_repository,
+            history_manifest_repository=get_history_manifest_repository(session),
             streaming_history=get_streaming_history_adapter(provider),
         )
         return await use_case.import_history(user=user, config=config)
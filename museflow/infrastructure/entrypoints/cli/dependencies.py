@@ -10,7 +10,9 @@ from museflow.application.ports.providers.history import StreamingHistoryPort
 from museflow.application.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.application.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.application.ports.repositories.blacklist import BlacklistRepository
+from museflow.application.ports.repositories.history import HistoryManifestRepository
 from museflow.application.ports.repositories.playlist import PlaylistRepository
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
 from museflow.application.ports.repositories.taste import TasteProfileRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.application.ports.repositories.users import UserRepository
@@ -24,7 +26,9 @@ from museflow.infrastructure.adapters.advisors.gemini.client import GeminiAdviso
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderStateSQLRepository
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderTokenSQLRepository
 from museflow.infrastructure.adapters.database.repositories.blacklist import BlacklistSQLRepository
+from museflow.infrastructure.adapters.database.repositories.history import HistoryManifestSQLRepository
 from museflow.infrastructure.adapters.database.repositories.playlist import PlaylistSQLRepository
+from museflow.infrastructure.adapters.database.repositories.resolution import TrackResolutionSQLRepository
 from museflow.infrastructure.adapters.database.repositories.taste import TasteProfileSQLRepository
 from museflow.infrastructure.adapters.database.repositories.track import TrackSQLRepository
 from museflow.infrastructure.adapters.database.repositories.users import UserSQLRepository
@@ -212,6 +216,14 @@ def get_playlist_repository(session: AsyncSession) -> PlaylistRepository:
     return PlaylistSQLRepository(session)
 
 
+def get_history_manifest_repository(session: AsyncSession) -> HistoryManifestRepository:
+    return HistoryManifestSQLRepository(session)
+
+
+def get_track_resolution_repository(session: AsyncSession) -> TrackResolutionRepository:
+    return TrackResolutionSQLRepository(session)
+
+
 # --- Services ---
 
 
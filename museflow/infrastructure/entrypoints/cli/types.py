@@ -27,3 +27,9 @@ class ArtistSortBy(enum.StrEnum):
 class TrackSortBy(enum.StrEnum):
     SCORE = "score"
     PLAYED_COUNT = "played_count"
+
+
+class TagSortBy(enum.StrEnum):
+    TRACK_COUNT = "track_count"  # Tracks with the tag
+    PLAYS_COUNT = "plays_count"  # Total plays across the tracks with the tag
+    RATE_AVG = "rate_avg"  # Simple average of the ratings of the tracks with the tag
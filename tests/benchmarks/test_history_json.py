@@ -0,0 +1,76 @@
+import json
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from typing import Final
+
+import ijson
+import pytest
+
+from museflow.infrastructure.adapters.providers.spotify.history import HistoryJsonBackend
+from museflow.infrastructure.adapters.providers.spotify.history import SpotifyStreamingHistoryAdapter
+
+from tests import ASSETS_DIR
+
+HISTORY_ASSETS: Final[Path] = ASSETS_DIR / "history" / "spotify"
+
+pytest.importorskip("orjson")
+
+# Plays of a yearly file of a Spotify extended streaming history export (~15 MB).
+ITEMS_COUNT: Final[int] = 30_000
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+@pytest.fixture(scope="module")
+def history_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An export-sized file, built from the play events of the `tests/assets/history/spotify` fixtures."""
+    items = [
+        item
+        for path in sorted(HISTORY_ASSETS.rglob("*.json"))
+        if isinstance(data := json.loads(path.read_text()), list)
+        for item in data
+    ]
+    path = tmp_path_factory.mktemp("benchmark") / "Streaming_History_Audio_2024.json"
+    path.write_text(json.dumps((items * (ITEMS_COUNT // len(items) + 1))[:ITEMS_COUNT]))
+    return path
+
+
+@pytest.mark.slow
+class TestHistoryJsonBackendBenchmark:
+    """
+    Run with: pytest tests/benchmarks --slow --no-cov -s
+    """
+
+    def test__decode(self, history_file: Path) -> None:
+        size = history_file.stat().st_size
+
+        def load_orjson() -> int:
+            with history_file.open("rb") as f:
+                return len(SpotifyStreamingHistoryAdapter._load_items_sync(f, size))
+
+        def load_ijson() -> int:
+            with history_file.open("rb") as f:
+                return sum(1 for _ in ijson.items(f, "item"))
+
+        assert load_orjson() == load_ijson() == ITEMS_COUNT
+
+        orjson_time = best_of(load_orjson)
+        ijson_time = best_of(load_ijson)
+        print(f"\ndecode: orjson={orjson_time:.3f}s ijson={ijson_time:.3f}s ({ijson_time / orjson_time:.1f}x)")
+
+        assert ijson_time / orjson_time > 1.5
+
+    def test__iter_entries(self, history_file: Path) -> None:
+        def iter_entries(json_backend: HistoryJsonBackend) -> int:
+            adapter = SpotifyStreamingHistoryAdapter(json_backend=json_backend)
+            return sum(1 for _ in adapter.iter_entries(path=history_file, min_ms_played=0))
+
+        orjson_time = best_of(lambda: iter_entries(HistoryJsonBackend.ORJSON))
+        ijson_time = best_of(lambda: iter_entries(HistoryJsonBackend.IJSON))
+        print(f"\niter_entries: orjson={orjson_time:.3f}s ijson={ijson_time:.3f}s ({ijson_time / orjson_time:.1f}x)")
+
+        assert orjson_time < ijson_time
@@ -0,0 +1,45 @@
+import timeit
+from collections.abc import Callable
+from typing import Final
+
+import pytest
+
+from museflow.domain.utils.text import normalize_text
+
+from tests.unit.utils.text import reference_normalize_text
+
+# Typical track and artist names: most have no noise at all, some have a featuring, a remaster or a live suffix.
+NAMES: Final[list[str]] = [
+    "Bohemian Rhapsody",
+    "Queen",
+    "Soldi famiglia (feat. Sfera Ebbasta)",
+    "Anacaona - Remastered 2025",
+    "J'en rêve encore - Radio Edit",
+    "Beyoncé",
+    "Fabricando Fantasías - Salsa Version",
+    "Somebody That I Used To Know",
+    "Mi Luz (ft. Rels B)",
+    "Daft Punk",
+] * 1_000
+
+
+@pytest.mark.slow
+class TestNormalizeTextBenchmark:
+    """
+    Run with: pytest tests/benchmarks --slow --no-cov -s
+    """
+
+    def test__faster_than_reference(self) -> None:
+        def run(func: Callable[[str], str]) -> float:
+            return min(timeit.repeat(lambda: [func(name) for name in NAMES], number=1, repeat=5))
+
+        assert [normalize_text(name) for name in NAMES] == [reference_normalize_text(name) for name in NAMES]
+
+        optimized_time = run(normalize_text)
+        reference_time = run(reference_normalize_text)
+        print(
+            f"\nnormalize_text: optimized={optimized_time * 1e6 / len(NAMES):.2f}us "
+            f"reference={reference_time * 1e6 / len(NAMES):.2f}us ({reference_time / optimized_time:.1f}x)"
+        )
+
+        assert reference_time / optimized_time > 1.5
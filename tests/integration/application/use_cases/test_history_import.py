@@ -1,7 +1,11 @@
+import json
+import shutil
+import zipfile
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
 from typing import Final
+from unittest import mock
 
 from sqlalchemy import func
 from sqlalchemy import select
@@ -10,12 +14,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 from museflow.application.inputs.history import StreamingHistoryImportConfigInput
+from museflow.application.ports.repositories.history import HistoryManifestRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.application.use_cases.history_import import ImportStreamingHistoryReport
 from museflow.application.use_cases.history_import import ImportStreamingHistoryUseCase
 from museflow.domain.entities.user import User
 from museflow.domain.enums import MusicProvider
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
+from museflow.infrastructure.adapters.database.repositories.history import HistoryManifestSQLRepository
+from museflow.infrastructure.adapters.database.repositories.track import TrackSQLRepository
 from museflow.infrastructure.adapters.providers.spotify.history import SpotifyStreamingHistoryAdapter
 
 from tests import ASSETS_DIR
@@ -46,10 +53,12 @@ class TestImportStreamingHistorySpotifyUseCase:
     def use_case(
         self,
         track_repository: TrackRepository,
+        history_manifest_repository: HistoryManifestRepository,
         spotify_streaming_history: SpotifyStreamingHistoryAdapter,
     ) -> ImportStreamingHistoryUseCase:
         return ImportStreamingHistoryUseCase(
             track_repository=track_repository,
+            history_manifest_repository=history_manifest_repository,
             streaming_history=spotify_streaming_history,
         )
 
@@ -72,6 +81,8 @@ class TestImportStreamingHistorySpotifyUseCase:
         )
 
         assert report == ImportStreamingHistoryReport(
+            files_read=2,
+            files_skipped_unchanged=0,
             items_read=6,
             items_skipped_no_timestamp=0,
             items_skipped_short_play=2,
@@ -84,6 +95,91 @@ class TestImportStreamingHistorySpotifyUseCase:
             tracks_purged=0,
         )
 
+    async def test__archive(
+        self,
+        user: User,
+        use_case: ImportStreamingHistoryUseCase,
+        tmp_path: Path,
+    ) -> None:
+        archive_path = tmp_path / "my_spotify_data.zip"
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for path in sorted(HISTORY_DIR.glob("*.json")):
+                archive.write(path, f"Spotify Extended Streaming History/{path.name}")
+
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=archive_path, min_ms_played=30_000, jobs=2),
+        )
+
+        assert report.files_read == 2
+        assert report.items_read == 6
+        assert report.unique_track_ids == 4
+        assert report.tracks_created == 4
+
+        # The extracted files have the same content: they are already imported.
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=HISTORY_DIR, min_ms_played=30_000),
+        )
+
+        assert report.files_read == 0
+        assert report.files_skipped_unchanged == 2
+
+    async def test__jobs__parallel_parsing(
+        self,
+        user: User,
+        use_case: ImportStreamingHistoryUseCase,
+    ) -> None:
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(
+                directory=HISTORY_DIR,
+                min_ms_played=30_000,
+                jobs=2,
+            ),
+        )
+
+        assert report.items_read == 6
+        assert report.unique_track_ids == 4
+        assert report.plays_total == 4
+        assert report.tracks_created == 4
+
+    async def test__pipeline__track_across_files(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        use_case: ImportStreamingHistoryUseCase,
+        tmp_path: Path,
+    ) -> None:
+        """A track written once per file ends up with the totals of the whole run."""
+        for i, day in enumerate([1, 2, 3], start=1):
+            play = {
+                "ts": f"2024-01-0{day}T10:00:00Z",
+                "ms_played": 200000,
+                "master_metadata_track_name": "Song",
+                "master_metadata_album_artist_name": "Artist",
+                "master_metadata_album_album_name": "Album",
+                "spotify_track_uri": "spotify:track:song",
+            }
+            (tmp_path / f"history_{i}.json").write_text(json.dumps([play, play]))
+
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=tmp_path, min_ms_played=0, jobs=2),
+        )
+
+        assert report.files_read == 3
+        assert report.unique_track_ids == 1
+        assert report.plays_total == 6
+        assert report.tracks_created == 1
+
+        track_db = (
+            await async_session_db.execute(select(TrackModel).where(TrackModel.user_id == user.id))
+        ).scalar_one()
+        assert track_db.played_count == 6
+        assert track_db.played_at_first == datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+        assert track_db.played_at_last == datetime(2024, 1, 3, 10, 0, 0, tzinfo=UTC)
+
     async def test__purge(
         self,
         async_session_db: AsyncSession,
@@ -106,6 +202,8 @@ class TestImportStreamingHistorySpotifyUseCase:
         )
 
         assert report == ImportStreamingHistoryReport(
+            files_read=2,
+            files_skipped_unchanged=0,
             items_read=6,
             items_skipped_no_timestamp=0,
             items_skipped_short_play=2,
@@ -187,11 +285,128 @@ class TestImportStreamingHistorySpotifyUseCase:
         assert track_db.played_count == 3
 
         second_report = await use_case.import_history(user=user, config=config)
-        assert second_report.tracks_played_at_updated == 1
+        assert second_report.files_skipped_unchanged == 1
+        assert second_report.tracks_played_at_updated == 0
         assert second_report.tracks_created == 0
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.played_count == 3
 
+    async def test__incremental__appended_plays_only(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        use_case: ImportStreamingHistoryUseCase,
+        tmp_path: Path,
+    ) -> None:
+        history_file = tmp_path / "history.json"
+        shutil.copy(REIMPORT_HISTORY_DIR / "history.json", history_file)
+        config = StreamingHistoryImportConfigInput(directory=tmp_path, min_ms_played=0)
+        stmt = select(TrackModel).where(
+            TrackModel.user_id == user.id,
+            TrackModel.fingerprint == "reimport track|reimport artist",
+        )
+
+        await use_case.import_history(user=user, config=config)
+
+        items = json.loads(history_file.read_text())
+        items.append({**items[-1], "ts": "2024-02-01T10:00:00Z"})
+        history_file.write_text(json.dumps(items))
+
+        report = await use_case.import_history(user=user, config=config)
+
+        assert report.files_read == 1
+        assert report.files_skipped_unchanged == 0
+        assert report.items_read == 4
+        assert report.items_skipped_already_imported == 3
+        assert report.plays_total == 1
+        assert report.tracks_played_at_updated == 1
+
+        track_db = (await async_session_db.execute(stmt)).scalar_one()
+        assert track_db.played_count == 4
+        assert track_db.played_at_last == datetime(2024, 2, 1, 10, 0, 0, tzinfo=UTC)
+
+    async def test__incremental__new_file_only(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        use_case: ImportStreamingHistoryUseCase,
+        tmp_path: Path,
+    ) -> None:
+        shutil.copy(REIMPORT_HISTORY_DIR / "history.json", tmp_path / "history_2024.json")
+        config = StreamingHistoryImportConfigInput(directory=tmp_path, min_ms_played=0)
+
+        await use_case.import_history(user=user, config=config)
+
+        items = json.loads((tmp_path / "history_2024.json").read_text())
+        (tmp_path / "history_2025.json").write_text(
+            json.dumps([{**item, "ts": item["ts"].replace("2024", "2025")} for item in items])
+        )
+
+        report = await use_case.import_history(user=user, config=config)
+
+        assert report.files_read == 1
+        assert report.files_skipped_unchanged == 1
+        assert report.items_skipped_already_imported == 0
+        assert report.plays_total == 3
+
+        track_db = (
+            await async_session_db.execute(
+                select(TrackModel).where(
+                    TrackModel.user_id == user.id,
+                    TrackModel.fingerprint == "reimport track|reimport artist",
+                )
+            )
+        ).scalar_one()
+        assert track_db.played_count == 6
+        assert track_db.played_at_first == datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+
+    async def test__incremental__interrupted_run_resumed(
+        self,
+        async_session_trans: AsyncSession,
+        user: User,
+        spotify_streaming_history: SpotifyStreamingHistoryAdapter,
+        tmp_path: Path,
+    ) -> None:
+        history_manifest_repository = HistoryManifestSQLRepository(async_session_trans)
+        use_case = ImportStreamingHistoryUseCase(
+            track_repository=TrackSQLRepository(async_session_trans),
+            history_manifest_repository=history_manifest_repository,
+            streaming_history=spotify_streaming_history,
+        )
+        shutil.copy(REIMPORT_HISTORY_DIR / "history.json", tmp_path / "history_2024.json")
+        config = StreamingHistoryImportConfigInput(directory=tmp_path, min_ms_played=0)
+
+        await use_case.import_history(user=user, config=config)
+
+        items = json.loads((tmp_path / "history_2024.json").read_text())
+        (tmp_path / "history_2025.json").write_text(
+            json.dumps([{**item, "ts": item["ts"].replace("2024", "2025")} for item in items])
+        )
+
+        # The run is interrupted once the new file plays are written, before its manifest entry is.
+        with (
+            mock.patch.object(history_manifest_repository, "bulk_upsert", side_effect=RuntimeError("Interrupted")),
+            pytest.raises(RuntimeError, match="Interrupted"),
+        ):
+            await use_case.import_history(user=user, config=config)
+        # As when the CLI session is closed.
+        await async_session_trans.rollback()
+
+        report = await use_case.import_history(user=user, config=config)
+
+        assert report.files_read == 1
+        assert report.plays_total == 3
+
+        track_db = (
+            await async_session_trans.execute(
+                select(TrackModel).where(
+                    TrackModel.user_id == user.id,
+                    TrackModel.fingerprint == "reimport track|reimport artist",
+                )
+            )
+        ).scalar_one()
+        assert track_db.played_count == 6
+
     async def test__same_fingerprint__different_provider_ids__deduplicates(
         self,
         async_session_db: AsyncSession,
@@ -201,8 +416,6 @@ class TestImportStreamingHistorySpotifyUseCase:
         spotify_streaming_history: SpotifyStreamingHistoryAdapter,
     ) -> None:
         """Two Spotify IDs for the same song collapse into one DB row with merged play count."""
-        import json
-
         history_file = tmp_path / "history.json"
         history_file.write_text(
             json.dumps(
@@ -229,6 +442,7 @@ class TestImportStreamingHistorySpotifyUseCase:
 
         dup_use_case = ImportStreamingHistoryUseCase(
             track_repository=use_case._track_repository,
+            history_manifest_repository=use_case._history_manifest_repository,
             streaming_history=spotify_streaming_history,
         )
 
@@ -155,6 +155,31 @@ class TestPlaylistHistoryUseCase:
         assert result.playlist is not None
         assert [t.id for t in result.playlist.tracks] == [high.id, mid.id, low.id, unscored.id]
 
+    async def test__sort_by_random__sampled(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        playlist_repository: PlaylistRepository,
+        spotify_library: ProviderLibraryPort,
+    ) -> None:
+        tracks = await TrackModelFactory.create_batch_async(
+            size=10, user_id=user.id, source=TrackSource.HISTORY, score=8
+        )
+        await TrackModelFactory.create_async(user_id=user.id, source=TrackSource.HISTORY, score=2)
+
+        result = await playlist_history(
+            user=user,
+            config=PlaylistHistoryConfigInput(
+                sort_by=PlaylistHistoryOrderBy.RANDOM, score_min=5, limit=4, dry_run=True
+            ),
+            track_repository=track_repository,
+            playlist_repository=playlist_repository,
+            provider_library=spotify_library,
+        )
+
+        assert len(result.tracks) == 4
+        assert {t.id for t in result.tracks} <= {t.id for t in tracks}
+
     async def test__filters_by_played_first_range(
         self,
         user: User,
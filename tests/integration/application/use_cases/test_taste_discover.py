@@ -4,6 +4,7 @@ from museflow.application.inputs.discovery import DiscoverTasteConfigInput
 from museflow.application.ports.providers.library import ProviderLibraryPort
 from museflow.application.ports.repositories.blacklist import BlacklistRepository
 from museflow.application.ports.repositories.playlist import PlaylistRepository
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
 from museflow.application.ports.repositories.taste import TasteProfileRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.application.use_cases.taste_discover import DiscoverTasteUseCase
@@ -21,6 +22,7 @@ class TestDiscoverTasteUseCase:
     def use_case(
         self,
         track_repository: TrackRepository,
+        track_resolution_repository: TrackResolutionRepository,
         taste_profile_repository: TasteProfileRepository,
         blacklist_repository: BlacklistRepository,
         playlist_repository: PlaylistRepository,
@@ -30,6 +32,7 @@ class TestDiscoverTasteUseCase:
     ) -> DiscoverTasteUseCase:
         return DiscoverTasteUseCase(
             track_repository=track_repository,
+            track_resolution_repository=track_resolution_repository,
             taste_profile_repository=taste_profile_repository,
             blacklist_repository=blacklist_repository,
             playlist_repository=playlist_repository,
@@ -21,7 +21,9 @@ from museflow.application.inputs.user import UserUpdateInput
 from museflow.application.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.application.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.application.ports.repositories.blacklist import BlacklistRepository
+from museflow.application.ports.repositories.history import HistoryManifestRepository
 from museflow.application.ports.repositories.playlist import PlaylistRepository
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
 from museflow.application.ports.repositories.taste import TasteProfileRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.application.ports.repositories.users import UserRepository
@@ -42,7 +44,9 @@ from museflow.infrastructure.adapters.database.models import Base
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderStateSQLRepository
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderTokenSQLRepository
 from museflow.infrastructure.adapters.database.repositories.blacklist import BlacklistSQLRepository
+from museflow.infrastructure.adapters.database.repositories.history import HistoryManifestSQLRepository
 from museflow.infrastructure.adapters.database.repositories.playlist import PlaylistSQLRepository
+from museflow.infrastructure.adapters.database.repositories.resolution import TrackResolutionSQLRepository
 from museflow.infrastructure.adapters.database.repositories.taste import TasteProfileSQLRepository
 from museflow.infrastructure.adapters.database.repositories.track import TrackSQLRepository
 from museflow.infrastructure.adapters.database.repositories.users import UserSQLRepository
@@ -253,6 +257,16 @@ def playlist_repository(async_session_db: AsyncSession) -> PlaylistRepository:
     return PlaylistSQLRepository(async_session_db)
 
 
+@pytest.fixture
+def history_manifest_repository(async_session_db: AsyncSession) -> HistoryManifestRepository:
+    return HistoryManifestSQLRepository(async_session_db)
+
+
+@pytest.fixture
+def track_resolution_repository(async_session_db: AsyncSession) -> TrackResolutionRepository:
+    return TrackResolutionSQLRepository(async_session_db)
+
+
 # --- Entity factories ---
 
 
@@ -0,0 +1,25 @@
+from typing import Any
+
+from polyfactory import Use
+
+from museflow.domain.enums import MusicProvider
+from museflow.infrastructure.adapters.database.models.history import HistoryManifestEntry as HistoryManifestEntryModel
+
+from tests.integration.factories.models.base import BaseModelFactory
+from tests.integration.factories.models.user import UserModelFactory
+
+
+class HistoryManifestEntryModelFactory(BaseModelFactory[HistoryManifestEntryModel]):
+    __model__ = HistoryManifestEntryModel
+
+    provider = MusicProvider.SPOTIFY
+    file_name = Use(BaseModelFactory.__faker__.file_name, extension="json")
+    content_hash = Use(BaseModelFactory.__faker__.sha256)
+    size = Use(BaseModelFactory.__faker__.pyint, min_value=1)
+
+    @classmethod
+    async def create_async(cls, **kwargs: Any) -> HistoryManifestEntryModel:
+        if "user_id" not in kwargs:
+            user = await UserModelFactory.create_async()
+            kwargs["user_id"] = user.id
+        return await super().create_async(**kwargs)
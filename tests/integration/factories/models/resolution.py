@@ -0,0 +1,21 @@
+from polyfactory import Use
+
+from museflow.domain.enums import MusicProvider
+from museflow.infrastructure.adapters.database.models.resolution import TrackResolution as TrackResolutionModel
+
+from tests.integration.factories.models.base import BaseModelFactory
+
+
+class TrackResolutionModelFactory(BaseModelFactory[TrackResolutionModel]):
+    __model__ = TrackResolutionModel
+
+    provider = MusicProvider.SPOTIFY
+    suggestion_key = Use(lambda: f"{BaseModelFactory.__faker__.sentence()}|{BaseModelFactory.__faker__.name()}")
+
+    # Unresolved by default.
+    provider_id = None
+    name = None
+    artists = None
+    album_name = None
+    fingerprint = None
+    score = None
@@ -1,5 +1,13 @@
+import uuid
+
+from sqlalchemy import delete
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from museflow.domain.enums import MusicProvider
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
+from museflow.infrastructure.adapters.database.models import TrackProviderLink as TrackProviderLinkModel
 
 from tests.integration.factories.models.track import TrackModelFactory
 from tests.unit.factories.entities.track import TrackFactory
@@ -27,3 +35,53 @@ class TestTrackModel:
         assert len(model.provider_links) == len(entity.provider_links)
         assert model.provider_links[0]["provider"] == MusicProvider.SPOTIFY.value
         assert model.provider_links[0]["provider_id"] == entity.provider_links[0].provider_id
+
+
+class TestTrackProviderLinkModel:
+    @staticmethod
+    async def _get_links(session: AsyncSession, track_id: uuid.UUID) -> set[tuple[MusicProvider, str, uuid.UUID]]:
+        stmt = select(
+            TrackProviderLinkModel.provider,
+            TrackProviderLinkModel.provider_id,
+            TrackProviderLinkModel.user_id,
+        ).where(TrackProviderLinkModel.track_id == track_id)
+        return {tuple(row) for row in await session.execute(stmt)}  # type: ignore[misc]
+
+    async def test__insert__synced(self, async_session_db: AsyncSession) -> None:
+        track = await TrackModelFactory.create_async(
+            provider_links=[
+                {"provider": "spotify", "provider_id": "abc"},
+                {"provider": "spotify", "provider_id": "def"},
+                {"provider": "spotify", "provider_id": "abc"},
+            ]
+        )
+
+        assert await self._get_links(async_session_db, track.id) == {
+            (MusicProvider.SPOTIFY, "abc", track.user_id),
+            (MusicProvider.SPOTIFY, "def", track.user_id),
+        }
+
+    async def test__update__provider_links__synced(self, async_session_db: AsyncSession) -> None:
+        track = await TrackModelFactory.create_async(provider_links=[{"provider": "spotify", "provider_id": "abc"}])
+
+        await async_session_db.execute(
+            update(TrackModel)
+            .where(TrackModel.id == track.id)
+            .values(provider_links=[{"provider": "spotify", "provider_id": "def"}])
+        )
+
+        assert await self._get_links(async_session_db, track.id) == {(MusicProvider.SPOTIFY, "def", track.user_id)}
+
+    async def test__update__other_column__unchanged(self, async_session_db: AsyncSession) -> None:
+        track = await TrackModelFactory.create_async(provider_links=[{"provider": "spotify", "provider_id": "abc"}])
+
+        await async_session_db.execute(update(TrackModel).where(TrackModel.id == track.id).values(score=5))
+
+        assert await self._get_links(async_session_db, track.id) == {(MusicProvider.SPOTIFY, "abc", track.user_id)}
+
+    async def test__delete__cascade(self, async_session_db: AsyncSession) -> None:
+        track = await TrackModelFactory.create_async()
+
+        await async_session_db.execute(delete(TrackModel).where(TrackModel.id == track.id))
+
+        assert await self._get_links(async_session_db, track.id) == set()
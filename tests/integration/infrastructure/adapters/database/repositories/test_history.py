@@ -0,0 +1,103 @@
+import dataclasses
+import uuid
+from datetime import UTC
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from museflow.application.ports.repositories.history import HistoryManifestRepository
+from museflow.domain.entities.history import HistoryManifestEntry
+from museflow.domain.entities.user import User
+from museflow.domain.enums import MusicProvider
+from museflow.infrastructure.adapters.database.models.history import HistoryManifestEntry as HistoryManifestEntryModel
+
+from tests.integration.factories.models.history import HistoryManifestEntryModelFactory
+
+
+class TestHistoryManifestSQLRepository:
+    async def test__get_list__nominal(
+        self,
+        user: User,
+        history_manifest_repository: HistoryManifestRepository,
+    ) -> None:
+        entry_b = await HistoryManifestEntryModelFactory.create_async(user_id=user.id, file_name="b.json")
+        entry_a = await HistoryManifestEntryModelFactory.create_async(user_id=user.id, file_name="a.json")
+        await HistoryManifestEntryModelFactory.create_async()
+
+        entries = await history_manifest_repository.get_list(user_id=user.id, provider=MusicProvider.SPOTIFY)
+
+        assert entries == [entry_a.to_entity(), entry_b.to_entity()]
+
+    async def test__bulk_upsert__create(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        history_manifest_repository: HistoryManifestRepository,
+    ) -> None:
+        entry = HistoryManifestEntry(
+            user_id=user.id,
+            provider=MusicProvider.SPOTIFY,
+            file_name="history.json",
+            content_hash="hash",
+            size=42,
+            modified_at=datetime(2024, 1, 1, tzinfo=UTC),
+            played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+            played_at_last=datetime(2023, 12, 31, tzinfo=UTC),
+        )
+
+        await history_manifest_repository.bulk_upsert([entry])
+
+        entry_db = (
+            await async_session_db.execute(
+                select(HistoryManifestEntryModel).where(HistoryManifestEntryModel.id == entry.id)
+            )
+        ).scalar_one()
+        assert entry_db.to_entity() == entry
+
+    async def test__bulk_upsert__update(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        history_manifest_repository: HistoryManifestRepository,
+    ) -> None:
+        entry_db = await HistoryManifestEntryModelFactory.create_async(user_id=user.id, file_name="history.json")
+        # A new entry for the same file: the existing row (and its id) is updated in place.
+        updated = dataclasses.replace(
+            entry_db.to_entity(),
+            id=uuid.uuid4(),
+            content_hash="new-hash",
+            played_at_last=datetime(2024, 12, 31, tzinfo=UTC),
+        )
+
+        await history_manifest_repository.bulk_upsert([updated])
+        await async_session_db.refresh(entry_db)
+
+        entries = await history_manifest_repository.get_list(user_id=user.id, provider=MusicProvider.SPOTIFY)
+        assert entries == [dataclasses.replace(updated, id=entry_db.id)]
+
+    async def test__bulk_upsert__empty(
+        self,
+        async_session_db: AsyncSession,
+        history_manifest_repository: HistoryManifestRepository,
+    ) -> None:
+        await history_manifest_repository.bulk_upsert([])
+
+        count = (await async_session_db.execute(select(func.count()).select_from(HistoryManifestEntryModel))).scalar()
+        assert count == 0
+
+    async def test__purge(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        history_manifest_repository: HistoryManifestRepository,
+    ) -> None:
+        await HistoryManifestEntryModelFactory.create_batch_async(size=2, user_id=user.id)
+        other = await HistoryManifestEntryModelFactory.create_async()
+
+        count = await history_manifest_repository.purge(user_id=user.id, provider=MusicProvider.SPOTIFY)
+
+        assert count == 2
+        remaining = (await async_session_db.execute(select(HistoryManifestEntryModel.id))).scalars().all()
+        assert remaining == [other.id]
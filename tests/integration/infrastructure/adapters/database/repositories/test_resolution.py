@@ -0,0 +1,161 @@
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
+from museflow.domain.entities.track import ProviderLink
+from museflow.domain.entities.user import User
+from museflow.domain.enums import MusicProvider
+from museflow.domain.value_objects.track import TrackResolution
+from museflow.infrastructure.adapters.database.models.resolution import TrackResolution as TrackResolutionModel
+
+from tests.integration.factories.models.resolution import TrackResolutionModelFactory
+from tests.unit.factories.entities.track import TrackFactory
+
+TTL = timedelta(days=30)
+NEGATIVE_TTL = timedelta(days=1)
+
+
+class TestTrackResolutionSQLRepository:
+    async def test__get_many__none(self, user: User, track_resolution_repository: TrackResolutionRepository) -> None:
+        resolutions = await track_resolution_repository.get_many(
+            user_id=user.id,
+            keys=[],
+            provider=MusicProvider.SPOTIFY,
+            ttl=TTL,
+            negative_ttl=NEGATIVE_TTL,
+        )
+        assert resolutions == {}
+
+    async def test__get_many__nominal(
+        self,
+        user: User,
+        track_resolution_repository: TrackResolutionRepository,
+    ) -> None:
+        await TrackResolutionModelFactory.create_async(
+            suggestion_key="bohemian rapsody|queen",
+            provider_id="bohemian",
+            name="Bohemian Rhapsody",
+            artists=["Queen"],
+            album_name="A Night at the Opera",
+            fingerprint="bohemian rhapsody|queen",
+            score=0.95,
+        )
+        await TrackResolutionModelFactory.create_async(suggestion_key="unknown|nobody")
+        await TrackResolutionModelFactory.create_async(suggestion_key="not|asked")
+
+        resolutions = await track_resolution_repository.get_many(
+            user_id=user.id,
+            keys=["bohemian rapsody|queen", "unknown|nobody", "missing|nobody"],
+            provider=MusicProvider.SPOTIFY,
+            ttl=TTL,
+            negative_ttl=NEGATIVE_TTL,
+        )
+
+        assert set(resolutions) == {"bohemian rapsody|queen", "unknown|nobody"}
+        assert resolutions["unknown|nobody"] == TrackResolution(key="unknown|nobody")
+
+        match = resolutions["bohemian rapsody|queen"].match
+        assert match is not None
+        track, score = match
+        assert score == 0.95
+        assert track.user_id == user.id
+        assert track.name == "Bohemian Rhapsody"
+        assert track.artists == ["Queen"]
+        assert track.album_name == "A Night at the Opera"
+        assert track.fingerprint == "bohemian rhapsody|queen"
+        assert track.provider_links == [ProviderLink(provider=MusicProvider.SPOTIFY, provider_id="bohemian")]
+
+    async def test__get_many__expired(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        track_resolution_repository: TrackResolutionRepository,
+    ) -> None:
+        now = datetime.now(UTC)
+        resolved_at = {
+            "old|match": now - TTL - timedelta(hours=1),
+            "recent|match": now - NEGATIVE_TTL - timedelta(hours=1),
+            "old|none": now - NEGATIVE_TTL - timedelta(hours=1),
+            "recent|none": now - timedelta(hours=1),
+        }
+        for key in resolved_at:
+            if key.endswith("|match"):
+                await TrackResolutionModelFactory.create_async(
+                    suggestion_key=key,
+                    provider_id="id",
+                    name="name",
+                    artists=["artist"],
+                    fingerprint="name|artist",
+                    score=0.9,
+                )
+            else:
+                await TrackResolutionModelFactory.create_async(suggestion_key=key)
+            await async_session_db.execute(
+                update(TrackResolutionModel)
+                .where(TrackResolutionModel.suggestion_key == key)
+                .values(updated_at=resolved_at[key])
+            )
+
+        resolutions = await track_resolution_repository.get_many(
+            user_id=user.id,
+            keys=list(resolved_at),
+            provider=MusicProvider.SPOTIFY,
+            ttl=TTL,
+            negative_ttl=NEGATIVE_TTL,
+        )
+
+        assert set(resolutions) == {"recent|match", "recent|none"}
+
+    async def test__bulk_upsert(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        track_resolution_repository: TrackResolutionRepository,
+    ) -> None:
+        resolution_db = await TrackResolutionModelFactory.create_async(suggestion_key="known|artist")
+        track = TrackFactory.build(user_id=user.id)
+
+        await track_resolution_repository.bulk_upsert(
+            resolutions=[
+                TrackResolution(key="unknown|nobody"),
+                TrackResolution(key="known|artist"),
+                # The last resolution of a key wins.
+                TrackResolution(key="known|artist", match=(track, 0.9)),
+            ],
+            provider=MusicProvider.SPOTIFY,
+        )
+
+        # The existing row is updated in place.
+        await async_session_db.refresh(resolution_db)
+        assert resolution_db.provider_id == track.get_provider_id(MusicProvider.SPOTIFY)
+
+        resolutions = await track_resolution_repository.get_many(
+            user_id=user.id,
+            keys=["known|artist", "unknown|nobody"],
+            provider=MusicProvider.SPOTIFY,
+            ttl=TTL,
+            negative_ttl=NEGATIVE_TTL,
+        )
+        assert resolutions["unknown|nobody"] == TrackResolution(key="unknown|nobody")
+
+        match = resolutions["known|artist"].match
+        assert match is not None
+        assert match[0].fingerprint == track.fingerprint
+        assert match[0].provider_links == track.provider_links
+        assert match[1] == 0.9
+
+    async def test__bulk_upsert__empty(
+        self,
+        async_session_db: AsyncSession,
+        track_resolution_repository: TrackResolutionRepository,
+    ) -> None:
+        await track_resolution_repository.bulk_upsert(resolutions=[], provider=MusicProvider.SPOTIFY)
+
+        count = (await async_session_db.execute(select(func.count()).select_from(TrackResolutionModel))).scalar()
+        assert count == 0
@@ -1,9 +1,11 @@
 import asyncio
 import dataclasses
+import math
 import operator
 import uuid
 from datetime import UTC
 from datetime import datetime
+from unittest import mock
 
 from sqlalchemy import func
 from sqlalchemy import select
@@ -11,18 +13,30 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import pytest
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.domain.entities.track import ProviderLink
 from museflow.domain.entities.track import Track
 from museflow.domain.entities.user import User
+from museflow.domain.enums import ArtistOrderBy
 from museflow.domain.enums import EnrichField
+from museflow.domain.enums import GenreTag
+from museflow.domain.enums import MoodTag
 from museflow.domain.enums import MusicProvider
+from museflow.domain.enums import PlaylistType
 from museflow.domain.enums import SortOrder
+from museflow.domain.enums import TagOrderBy
+from museflow.domain.enums import TrackField
 from museflow.domain.enums import TrackOrderBy
 from museflow.domain.enums import TrackSource
 from museflow.domain.exceptions import TrackNotFoundError
+from museflow.domain.types import TrackRow
+from museflow.domain.value_objects.track import TagAggregate
+from museflow.domain.value_objects.track import TrackPatchResult
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
+from museflow.infrastructure.adapters.database.repositories.track import TrackSQLRepository
 
+from tests.integration.factories.models.playlist import PlaylistModelFactory
 from tests.integration.factories.models.track import TrackModelFactory
 from tests.integration.factories.models.user import UserModelFactory
 from tests.unit.factories.entities.track import TrackFactory
@@ -83,7 +97,7 @@ class TestTrackSQLRepository:
         tracks_other: list[Track],
         track_repository: TrackRepository,
     ) -> None:
-        track_list = await track_repository.get_list(user.id, provider=MusicProvider.SPOTIFY)
+        track_list = await track_repository.get_list(user.id, track_filter=TrackFilter(provider=MusicProvider.SPOTIFY))
 
         assert len(track_list) == len(tracks)
         assert {t.id for t in track_list} == {t.id for t in tracks}
@@ -100,10 +114,12 @@ class TestTrackSQLRepository:
             user_id=user.id, source=int(TrackSource.HISTORY | TrackSource.DISCOVERY)
         )
 
-        history_list = await track_repository.get_list(user.id, source=TrackSource.HISTORY)
+        history_list = await track_repository.get_list(user.id, track_filter=TrackFilter(source=TrackSource.HISTORY))
         assert {t.id for t in history_list} == {history_db.id, both_db.id}
 
-        discovery_list = await track_repository.get_list(user.id, source=TrackSource.DISCOVERY)
+        discovery_list = await track_repository.get_list(
+            user.id, track_filter=TrackFilter(source=TrackSource.DISCOVERY)
+        )
         assert {t.id for t in discovery_list} == {discovery_db.id, both_db.id}
 
     async def test__get_list__filtering__max_score(
@@ -114,7 +130,7 @@ class TestTrackSQLRepository:
         low_db = await TrackModelFactory.create_async(user_id=user.id, score=4)
         await TrackModelFactory.create_async(user_id=user.id, score=8)
 
-        result = await track_repository.get_list(user.id, max_score=5)
+        result = await track_repository.get_list(user.id, track_filter=TrackFilter(max_score=5))
         assert [t.id for t in result] == [low_db.id]
 
     async def test__get_list__filtering__unrated_only(
@@ -125,7 +141,7 @@ class TestTrackSQLRepository:
         unrated_db = await TrackModelFactory.create_async(user_id=user.id, score=None)
         await TrackModelFactory.create_async(user_id=user.id, score=7)
 
-        unrated_list = await track_repository.get_list(user.id, unrated_only=True)
+        unrated_list = await track_repository.get_list(user.id, track_filter=TrackFilter(unrated_only=True))
         assert [t.id for t in unrated_list] == [unrated_db.id]
 
     async def test__get_list__filtering__artist_name(
@@ -136,12 +152,45 @@ class TestTrackSQLRepository:
         target_db = await TrackModelFactory.create_async(user_id=user.id, artists=["Radiohead"])
         await TrackModelFactory.create_async(user_id=user.id, artists=["Other Artist"])
 
-        result = await track_repository.get_list(user.id, artist_name="Radiohead")
+        result = await track_repository.get_list(user.id, track_filter=TrackFilter(artist_name="Radiohead"))
         assert [t.id for t in result] == [target_db.id]
 
-        result_ci = await track_repository.get_list(user.id, artist_name="radiohead")
+        result_ci = await track_repository.get_list(user.id, track_filter=TrackFilter(artist_name="radiohead"))
         assert [t.id for t in result_ci] == [target_db.id]
 
+    async def test__get_list__filtering__provider_ids(
+        self,
+        user: User,
+        tracks: list[Track],
+        tracks_other: list[Track],
+        track_repository: TrackRepository,
+    ) -> None:
+        provider_ids = [t.provider_links[0].provider_id for t in [*tracks[:3], *tracks_other]]
+
+        track_list = await track_repository.get_list(user.id, track_filter=TrackFilter(provider_ids=provider_ids))
+
+        assert {t.id for t in track_list} == {t.id for t in tracks[:3]}
+
+    async def test__get_list__filtering__provider_ids__merged_link(
+        self,
+        user: User,
+        tracks: list[Track],
+        track_repository: TrackRepository,
+    ) -> None:
+        merged = dataclasses.replace(
+            tracks[0],
+            provider_links=[ProviderLink(provider=MusicProvider.SPOTIFY, provider_id="album_version")],
+        )
+        await track_repository.bulk_ingest([merged])
+
+        track_list = await track_repository.get_list(user.id, track_filter=TrackFilter(provider_ids=["album_version"]))
+
+        assert [t.id for t in track_list] == [tracks[0].id]
+        assert track_list[0].provider_links == [
+            *tracks[0].provider_links,
+            ProviderLink(provider=MusicProvider.SPOTIFY, provider_id="album_version"),
+        ]
+
     async def test__get_list__min_score_with_explicit_order__order_wins(
         self,
         user: User,
@@ -151,9 +200,7 @@ class TestTrackSQLRepository:
         high_played = await TrackModelFactory.create_async(user_id=user.id, score=5, played_count=10)
 
         result = await track_repository.get_list(
-            user.id,
-            min_score=5,
-            order=[(TrackOrderBy.PLAYED_COUNT, SortOrder.DESC)],
+            user.id, track_filter=TrackFilter(min_score=5), order=[(TrackOrderBy.PLAYED_COUNT, SortOrder.DESC)]
         )
 
         assert [t.id for t in result] == [high_played.id, low_played.id]
@@ -166,10 +213,31 @@ class TestTrackSQLRepository:
         kept = await TrackModelFactory.create_async(user_id=user.id)
         excluded = await TrackModelFactory.create_async(user_id=user.id)
 
-        result = await track_repository.get_list(user.id, exclude_ids=[excluded.id])
+        result = await track_repository.get_list(user.id, track_filter=TrackFilter(exclude_ids=[excluded.id]))
 
         assert [t.id for t in result] == [kept.id]
 
+    async def test__get_list__exclude_in_playlist_type(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+    ) -> None:
+        kept = await TrackModelFactory.create_async(user_id=user.id)
+        in_discovery = await TrackModelFactory.create_async(user_id=user.id)
+        in_history = await TrackModelFactory.create_async(user_id=user.id)
+        await PlaylistModelFactory.create_async(user_id=user.id, type=PlaylistType.HISTORY, track_ids=[in_history.id])
+        await PlaylistModelFactory.create_async(
+            user_id=user.id, type=PlaylistType.DISCOVERY, track_ids=[in_discovery.id]
+        )
+        # The playlists of other users are not considered, even holding the same tracks.
+        await PlaylistModelFactory.create_async(type=PlaylistType.HISTORY, track_ids=[kept.id])
+
+        result = await track_repository.get_list(
+            user.id, track_filter=TrackFilter(exclude_in_playlist_type=PlaylistType.HISTORY)
+        )
+
+        assert {t.id for t in result} == {kept.id, in_discovery.id}
+
     async def test__get_list__exclude_skipped(
         self,
         user: User,
@@ -178,7 +246,7 @@ class TestTrackSQLRepository:
         not_skipped_db = await TrackModelFactory.create_async(user_id=user.id, score=None, score_skipped=False)
         await TrackModelFactory.create_async(user_id=user.id, score=None, score_skipped=True)
 
-        result = await track_repository.get_list(user.id, exclude_skipped=True)
+        result = await track_repository.get_list(user.id, track_filter=TrackFilter(exclude_skipped=True))
 
         assert [t.id for t in result] == [not_skipped_db.id]
 
@@ -190,7 +258,7 @@ class TestTrackSQLRepository:
         await TrackModelFactory.create_async(user_id=user.id, score=None, score_skipped=False)
         skipped_db = await TrackModelFactory.create_async(user_id=user.id, score=None, score_skipped=True)
 
-        result = await track_repository.get_list(user.id, score_skipped_only=True)
+        result = await track_repository.get_list(user.id, track_filter=TrackFilter(score_skipped_only=True))
 
         assert [t.id for t in result] == [skipped_db.id]
 
@@ -251,6 +319,74 @@ class TestTrackSQLRepository:
         # There is a "tiny chance" (1 in 10! ~= 1 in 3.6 million) this fails... If it happens, I will be a millionaire!
         assert [t.id for t in random_list_1] != [t.id for t in random_list_2]
 
+    @pytest.mark.parametrize("pivot", [0.0, 0.5, 1.0])
+    async def test__get_list__ordering__random__sampled(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        tracks_other: list[Track],
+        track_repository: TrackRepository,
+        pivot: float,
+    ) -> None:
+        await TrackModelFactory.create_batch_async(size=10, user_id=user.id)
+        stmt = select(TrackModel.id, TrackModel.random_key).where(TrackModel.user_id == user.id)
+        keys = sorted((await async_session_db.execute(stmt)).all(), key=operator.itemgetter(1))
+        # Tracks after the pivot in the key order, then the ones before it
+        expected_ids = [id_ for id_, key in keys if key >= pivot] + [id_ for id_, key in keys if key < pivot]
+
+        with mock.patch(f"{TrackSQLRepository.__module__}.random.random", return_value=pivot):
+            track_list = await track_repository.get_list(
+                user.id, order=[(TrackOrderBy.RANDOM, SortOrder.ASC)], limit=4
+            )
+            rows = await track_repository.get_rows(
+                fields=[TrackField.ID],
+                user_id=user.id,
+                order=[(TrackOrderBy.RANDOM, SortOrder.ASC)],
+                limit=4,
+            )
+
+        assert [t.id for t in track_list] == expected_ids[:4]
+        assert [row["id"] for row in rows] == expected_ids[:4]
+
+    async def test__get_list__ordering__random__sampled__independent(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        tracks_other: list[Track],
+        track_repository: TrackRepository,
+    ) -> None:
+        await TrackModelFactory.create_batch_async(size=20, user_id=user.id)
+        stmt = select(TrackModel.id).where(TrackModel.user_id == user.id).order_by(TrackModel.random_key)
+        positions = {id_: position for position, id_ in enumerate((await async_session_db.execute(stmt)).scalars())}
+
+        def is_window(track_list: list[Track]) -> bool:
+            # Whether the tracks are consecutive in the key order, wrapping around.
+            picked = {positions[t.id] for t in track_list}
+            return any(picked == {(start + i) % 20 for i in range(len(picked))} for start in range(20))
+
+        samples = [
+            await track_repository.get_list(user.id, order=[(TrackOrderBy.RANDOM, SortOrder.ASC)], limit=5)
+            for _ in range(2)
+        ]
+
+        assert all(len({t.id for t in sample}) == 5 for sample in samples)
+        # An independent sample of 5 out of 20 tracks is a window 20 / C(20, 5) ~= 1 in 775 times, so both ~= 1 in 600k.
+        assert not all(is_window(sample) for sample in samples)
+
+    async def test__get_list__ordering__random__sampled__filtering(
+        self,
+        user: User,
+        tracks_other: list[Track],
+        track_repository: TrackRepository,
+    ) -> None:
+        tracks = [await TrackModelFactory.create_async(user_id=user.id, score=score) for score in range(10)]
+
+        track_list = await track_repository.get_list(
+            user.id, track_filter=TrackFilter(min_score=7), order=[(TrackOrderBy.RANDOM, SortOrder.ASC)], limit=5
+        )
+
+        assert {t.id for t in track_list} == {t.id for t in tracks if t.score is not None and t.score >= 7}
+
     async def test__get_list__ordering__nullable(
         self,
         user: User,
@@ -291,6 +427,307 @@ class TestTrackSQLRepository:
         )
         assert set([t.user_id for t in track_list]) == {user.id}
 
+    @pytest.mark.parametrize(("chunk_size", "chunk_lengths"), [(3, [3, 3, 3, 1]), (5, [5, 5]), (20, [10])])
+    async def test__iter_rows__chunks(
+        self,
+        user: User,
+        chunk_size: int,
+        chunk_lengths: list[int],
+        tracks: list[Track],
+        tracks_other: list[Track],
+        track_repository: TrackRepository,
+        async_session_db: AsyncSession,
+    ) -> None:
+        chunks = [
+            chunk
+            async for chunk in track_repository.iter_rows(
+                fields=[TrackField.ID, TrackField.FINGERPRINT],
+                user_id=user.id,
+                chunk_size=chunk_size,
+            )
+        ]
+
+        assert [len(chunk) for chunk in chunks] == chunk_lengths
+        stmt = (
+            select(TrackModel.id).where(TrackModel.user_id == user.id).order_by(TrackModel.created_at, TrackModel.id)
+        )
+        assert [row["id"] for chunk in chunks for row in chunk] == list((await async_session_db.scalars(stmt)).all())
+        assert {(row["id"], row["fingerprint"]) for chunk in chunks for row in chunk} == {
+            (t.id, t.fingerprint) for t in tracks
+        }
+
+    async def test__iter_rows__none(self, user: User, track_repository: TrackRepository) -> None:
+        assert [chunk async for chunk in track_repository.iter_rows(fields=[TrackField.ID], user_id=user.id)] == []
+
+    async def test__iter_rows__filtering(self, user: User, track_repository: TrackRepository) -> None:
+        tracks_db = await TrackModelFactory.create_batch_async(size=5, user_id=user.id, score=8)
+        await TrackModelFactory.create_batch_async(size=5, user_id=user.id, score=None)
+
+        chunks = [
+            chunk
+            async for chunk in track_repository.iter_rows(
+                fields=[TrackField.ID],
+                user_id=user.id,
+                track_filter=TrackFilter(min_score=5),
+                chunk_size=2,
+            )
+        ]
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert {row["id"] for chunk in chunks for row in chunk} == {t.id for t in tracks_db}
+
+    async def test__get_rows__fields(self, user: User, track_repository: TrackRepository) -> None:
+        track_db = await TrackModelFactory.create_async(
+            user_id=user.id,
+            artists=["Artist A", "Artist B"],
+            score=7,
+            genres=[GenreTag.ROCK.value],
+        )
+
+        rows = await track_repository.get_rows(
+            fields=[TrackField.FINGERPRINT, TrackField.PRIMARY_ARTIST, TrackField.SCORE, TrackField.GENRES],
+            user_id=user.id,
+        )
+
+        assert rows == [
+            TrackRow(fingerprint=track_db.fingerprint, primary_artist="Artist A", score=7, genres=["rock"]),
+        ]
+
+    async def test__get_rows__filtering_ordering_pagination(
+        self, user: User, track_repository: TrackRepository
+    ) -> None:
+        for score in (5, 9, 7, None):
+            await TrackModelFactory.create_async(user_id=user.id, score=score)
+        await TrackModelFactory.create_async(score=10)
+
+        rows = await track_repository.get_rows(
+            fields=[TrackField.SCORE], user_id=user.id, track_filter=TrackFilter(min_score=0)
+        )
+        assert [row["score"] for row in rows] == [9, 7, 5]
+
+        rows = await track_repository.get_rows(
+            fields=[TrackField.SCORE],
+            user_id=user.id,
+            order=[(TrackOrderBy.SCORE, SortOrder.ASC)],
+            offset=1,
+            limit=2,
+        )
+        assert [row["score"] for row in rows] == [7, 9]
+
+    async def test__aggregate_by_artist__none(self, user: User, track_repository: TrackRepository) -> None:
+        assert await track_repository.aggregate_by_artist(user_id=user.id) == []
+
+    async def test__aggregate_by_artist__nominal(self, user: User, track_repository: TrackRepository) -> None:
+        # global_mean = (8 + 6 + 10) / 3 = 8.0
+        # Artist A: quality = (5*8 + 8 + 6) / (5+2) = 54/7, overall = log(3) × log(1 + 3 + 4) × quality/8
+        # Artist B: quality = (5*8 + 10) / (5+1) = 50/6, overall = log(2) × log(2) × quality/8
+        await TrackModelFactory.create_async(
+            user_id=user.id, artists=["Artist A", "Featured"], score=8, played_count=3
+        )
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Artist A"], score=6, played_count=4)
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Artist B"], score=10, played_count=1)
+        await TrackModelFactory.create_async(artists=["Artist C"], score=10)
+
+        aggregates = await track_repository.aggregate_by_artist(user_id=user.id, confidence=5)
+
+        assert [aggregate.artist for aggregate in aggregates] == ["Artist A", "Artist B"]
+        artist_a, artist_b = aggregates
+        assert (artist_a.track_count, artist_a.plays_count, artist_a.rated_count) == (2, 7, 2)
+        assert artist_a.rate_avg == 7.0
+        assert artist_a.quality_score == pytest.approx(54 / 7)
+        assert artist_a.overall_score == pytest.approx(math.log(3) * math.log(8) * (54 / 7) / 8)
+        assert (artist_b.track_count, artist_b.plays_count, artist_b.rated_count) == (1, 1, 1)
+        assert artist_b.rate_avg == 10.0
+        assert artist_b.quality_score == pytest.approx(50 / 6)
+        assert artist_b.overall_score == pytest.approx(math.log(2) ** 2 * (50 / 6) / 8)
+
+    async def test__aggregate_by_artist__unrated(self, user: User, track_repository: TrackRepository) -> None:
+        await TrackModelFactory.create_batch_async(
+            size=2, user_id=user.id, artists=["Artist A"], score=None, played_count=1
+        )
+
+        aggregates = await track_repository.aggregate_by_artist(user_id=user.id, confidence=5)
+
+        assert len(aggregates) == 1
+        assert aggregates[0].rated_count == 0
+        assert aggregates[0].rate_avg is None
+        assert aggregates[0].quality_score is None
+        # Without any rating, the overall score only depends on the volume
+        assert aggregates[0].overall_score == pytest.approx(math.log(3) ** 2)
+
+    async def test__aggregate_by_artist__score_range(self, user: User, track_repository: TrackRepository) -> None:
+        for score in (2, 5, 9):
+            await TrackModelFactory.create_async(user_id=user.id, artists=["Artist A"], score=score)
+
+        aggregates = await track_repository.aggregate_by_artist(user_id=user.id, min_score=3, max_score=8)
+
+        assert len(aggregates) == 1
+        assert aggregates[0].track_count == 3
+        assert aggregates[0].rated_count == 1
+        assert aggregates[0].rate_avg == 5.0
+
+    async def test__aggregate_by_artist__source(self, user: User, track_repository: TrackRepository) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Artist A"], source=TrackSource.HISTORY)
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Artist B"], source=TrackSource.DISCOVERY)
+
+        aggregates = await track_repository.aggregate_by_artist(user_id=user.id, source=TrackSource.DISCOVERY)
+
+        assert [aggregate.artist for aggregate in aggregates] == ["Artist B"]
+
+    async def test__aggregate_by_artist__candidates(self, user: User, track_repository: TrackRepository) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Hidden Gem"], score=9)
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Nice Find"], score=8)
+        await TrackModelFactory.create_batch_async(size=6, user_id=user.id, artists=["Big Name"], score=9)
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Mediocre"], score=4)
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Unknown"], score=None)
+
+        aggregates = await track_repository.aggregate_by_artist(
+            user_id=user.id,
+            max_tracks=5,
+            min_rate_avg=7.0,
+            order_by=ArtistOrderBy.RATE_AVG,
+        )
+
+        assert [(aggregate.artist, aggregate.rate_avg) for aggregate in aggregates] == [
+            ("Hidden Gem", 9.0),
+            ("Nice Find", 8.0),
+        ]
+
+    @pytest.mark.parametrize(
+        ("order_by", "expected"),
+        [
+            (ArtistOrderBy.TRACK_COUNT, ["Artist B", "Artist C", "Artist A"]),
+            (ArtistOrderBy.PLAYS_COUNT, ["Artist A", "Artist B", "Artist C"]),
+            (ArtistOrderBy.RATE_AVG, ["Artist A", "Artist B", "Artist C"]),
+            (ArtistOrderBy.QUALITY, ["Artist A", "Artist B", "Artist C"]),
+            (ArtistOrderBy.OVERALL, ["Artist A", "Artist B", "Artist C"]),
+        ],
+    )
+    async def test__aggregate_by_artist__order_by(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        order_by: ArtistOrderBy,
+        expected: list[str],
+    ) -> None:
+        # Artist A: 1 track at 10, played a lot. Artist B: 3 tracks at 5. Artist C: 3 unrated tracks.
+        await TrackModelFactory.create_async(user_id=user.id, artists=["Artist A"], score=10, played_count=100)
+        await TrackModelFactory.create_batch_async(
+            size=3, user_id=user.id, artists=["Artist B"], score=5, played_count=2
+        )
+        await TrackModelFactory.create_batch_async(
+            size=3, user_id=user.id, artists=["Artist C"], score=None, played_count=1
+        )
+
+        aggregates = await track_repository.aggregate_by_artist(user_id=user.id, confidence=5, order_by=order_by)
+
+        assert [aggregate.artist for aggregate in aggregates] == expected
+
+    async def test__aggregate_by_artist__ties_and_limit(self, user: User, track_repository: TrackRepository) -> None:
+        for artist in ("zara", "Zoe", "Aaron", "aaron"):
+            await TrackModelFactory.create_async(user_id=user.id, artists=[artist], score=8, played_count=1)
+
+        aggregates = await track_repository.aggregate_by_artist(user_id=user.id, limit=3)
+
+        # Ties are sorted by code point
+        assert [aggregate.artist for aggregate in aggregates] == ["Aaron", "Zoe", "aaron"]
+
+    async def test__aggregate_by_tag__none(self, user: User, track_repository: TrackRepository) -> None:
+        assert await track_repository.aggregate_by_tag(user_id=user.id, field=EnrichField.GENRE) == []
+
+    @pytest.mark.parametrize(
+        ("field", "tags_column"),
+        [
+            (EnrichField.GENRE, "genres"),
+            (EnrichField.MOOD, "moods"),
+        ],
+    )
+    async def test__aggregate_by_tag__unnested(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        field: EnrichField,
+        tags_column: str,
+    ) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, score=8, played_count=2, **{tags_column: ["a", "b"]})
+        await TrackModelFactory.create_async(user_id=user.id, score=6, played_count=3, **{tags_column: ["a"]})
+        await TrackModelFactory.create_async(user_id=user.id, score=None, played_count=1, **{tags_column: ["a"]})
+        await TrackModelFactory.create_async(user_id=user.id, score=10, **{tags_column: []})
+        await TrackModelFactory.create_async(score=10, **{tags_column: ["a", "c"]})
+
+        aggregates = await track_repository.aggregate_by_tag(user_id=user.id, field=field)
+
+        assert aggregates == [
+            TagAggregate(tag="a", track_count=3, plays_count=6, rated_count=2, rate_avg=7.0),
+            TagAggregate(tag="b", track_count=1, plays_count=2, rated_count=1, rate_avg=8.0),
+        ]
+
+    async def test__aggregate_by_tag__locale(self, user: User, track_repository: TrackRepository) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, locale="fr", score=None, played_count=1)
+        await TrackModelFactory.create_async(user_id=user.id, locale="fr", score=9, played_count=1)
+        await TrackModelFactory.create_async(user_id=user.id, locale="en", score=5, played_count=4)
+        await TrackModelFactory.create_async(user_id=user.id, locale=None)
+
+        aggregates = await track_repository.aggregate_by_tag(user_id=user.id, field=EnrichField.LOCALE)
+
+        assert aggregates == [
+            TagAggregate(tag="fr", track_count=2, plays_count=2, rated_count=1, rate_avg=9.0),
+            TagAggregate(tag="en", track_count=1, plays_count=4, rated_count=1, rate_avg=5.0),
+        ]
+
+    async def test__aggregate_by_tag__filtering(self, user: User, track_repository: TrackRepository) -> None:
+        for score in (2, 5, 9):
+            await TrackModelFactory.create_async(
+                user_id=user.id, genres=["rock"], score=score, source=TrackSource.HISTORY
+            )
+        await TrackModelFactory.create_async(user_id=user.id, genres=["jazz"], source=TrackSource.DISCOVERY)
+
+        aggregates = await track_repository.aggregate_by_tag(
+            user_id=user.id,
+            field=EnrichField.GENRE,
+            source=TrackSource.HISTORY,
+            min_score=3,
+            max_score=8,
+        )
+
+        assert len(aggregates) == 1
+        assert aggregates[0].tag == "rock"
+        assert aggregates[0].track_count == 3
+        assert aggregates[0].rated_count == 1
+        assert aggregates[0].rate_avg == 5.0
+
+    @pytest.mark.parametrize(
+        ("order_by", "expected"),
+        [
+            (TagOrderBy.TRACK_COUNT, ["b", "c", "a"]),
+            (TagOrderBy.PLAYS_COUNT, ["a", "b", "c"]),
+            (TagOrderBy.RATE_AVG, ["a", "b", "c"]),
+        ],
+    )
+    async def test__aggregate_by_tag__order_by(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        order_by: TagOrderBy,
+        expected: list[str],
+    ) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, genres=["a"], score=10, played_count=100)
+        await TrackModelFactory.create_batch_async(size=3, user_id=user.id, genres=["b"], score=5, played_count=2)
+        await TrackModelFactory.create_batch_async(size=3, user_id=user.id, genres=["c"], score=None, played_count=1)
+
+        aggregates = await track_repository.aggregate_by_tag(
+            user_id=user.id, field=EnrichField.GENRE, order_by=order_by
+        )
+
+        assert [aggregate.tag for aggregate in aggregates] == expected
+
+    async def test__aggregate_by_tag__limit(self, user: User, track_repository: TrackRepository) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, genres=["c", "b", "a"])
+
+        aggregates = await track_repository.aggregate_by_tag(user_id=user.id, field=EnrichField.GENRE, limit=2)
+
+        assert [aggregate.tag for aggregate in aggregates] == ["a", "b"]
+
     async def test__get_known_identifiers__none(self, user: User, track_repository: TrackRepository) -> None:
         known_identifiers = await track_repository.get_known_identifiers(
             user_id=user.id,
@@ -311,21 +748,100 @@ class TestTrackSQLRepository:
 
         assert known_identifiers.fingerprints == frozenset(["foo", "bar"])
 
-    async def test__bulk_upsert__create(
+    async def test__get_known_identifiers__chunked(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(TrackSQLRepository, "_KNOWN_IDENTIFIERS_CHUNK_SIZE", 2)
+        for fingerprint in ["a", "c", "e"]:
+            await TrackModelFactory.create_async(user_id=user.id, fingerprint=fingerprint)
+
+        known_identifiers = await track_repository.get_known_identifiers(
+            user_id=user.id,
+            fingerprints=["a", "b", "c", "d", "e"],
+        )
+
+        assert known_identifiers.fingerprints == frozenset(["a", "c", "e"])
+
+    async def test__search_catalog__none(self, user: User, track_repository: TrackRepository) -> None:
+        candidates = await track_repository.search_catalog(
+            user_id=user.id,
+            fingerprints=[],
+            provider=MusicProvider.SPOTIFY,
+            limit=5,
+        )
+        assert candidates == []
+
+    async def test__search_catalog(self, user: User, track_repository: TrackRepository) -> None:
+        provider_links = [{"provider": MusicProvider.SPOTIFY.value, "provider_id": "bohemian"}]
+        await TrackModelFactory.create_async(
+            name="Bohemian Rhapsody",
+            artists=["Queen"],
+            album_name="A Night at the Opera",
+            fingerprint="bohemian rhapsody|queen",
+            provider_links=provider_links,
+        )
+        # The same track in the library of another user is only returned once.
+        await TrackModelFactory.create_async(
+            name="Bohemian Rhapsody",
+            artists=["Queen"],
+            album_name="A Night at the Opera",
+            fingerprint="bohemian rhapsody|queen",
+            provider_links=provider_links,
+        )
+        await TrackModelFactory.create_async(fingerprint="bohemian like you|the dandy warhols")
+        await TrackModelFactory.create_async(fingerprint="bohemian rhapsody live|queen", provider_links=[])
+        await TrackModelFactory.create_async(fingerprint="under pressure|david bowie")
+
+        candidates = await track_repository.search_catalog(
+            user_id=user.id,
+            fingerprints=["bohemian rapsody|queen", "nothing alike|nobody", "under pressure|queen"],
+            provider=MusicProvider.SPOTIFY,
+            limit=5,
+        )
+
+        assert [[track.fingerprint for track in tracks] for tracks in candidates] == [
+            ["bohemian rhapsody|queen"],
+            [],
+            ["under pressure|david bowie"],
+        ]
+        track = candidates[0][0]
+        assert track.user_id == user.id
+        assert track.name == "Bohemian Rhapsody"
+        assert track.artists == ["Queen"]
+        assert track.album_name == "A Night at the Opera"
+        assert track.provider_links == [ProviderLink(provider=MusicProvider.SPOTIFY, provider_id="bohemian")]
+
+    async def test__search_catalog__limit(self, user: User, track_repository: TrackRepository) -> None:
+        for fingerprint in ["hello|adele", "hello you|adele", "hello again|adele"]:
+            await TrackModelFactory.create_async(fingerprint=fingerprint)
+
+        candidates = await track_repository.search_catalog(
+            user_id=user.id,
+            fingerprints=["hello|adele"],
+            provider=MusicProvider.SPOTIFY,
+            limit=2,
+        )
+
+        assert [[track.fingerprint for track in tracks] for tracks in candidates] == [
+            ["hello|adele", "hello you|adele"]
+        ]
+
+    async def test__bulk_ingest__create(
         self,
         async_session_db: AsyncSession,
         user: User,
         tracks_create: list[Track],
         track_repository: TrackRepository,
     ) -> None:
-        track_ids, create_count = await track_repository.bulk_upsert(
-            tracks_create,
-            batch_size=int(len(tracks_create) / 5),
-        )
+        track_ids, create_count = await track_repository.bulk_ingest(tracks_create)
 
         assert len(track_ids) == len(tracks_create) == create_count == 10
+        assert track_ids == {t.fingerprint: t.id for t in tracks_create}
 
-        stmt = select(TrackModel).where(TrackModel.id.in_(track_ids))
+        stmt = select(TrackModel).where(TrackModel.id.in_(track_ids.values()))
         results = await async_session_db.execute(stmt)
         tracks_db = results.scalars().all()
 
@@ -335,7 +851,7 @@ class TestTrackSQLRepository:
             [t.provider_links[0].provider_id for t in tracks_create]
         )
 
-    async def test__bulk_upsert__update(
+    async def test__bulk_ingest__update(
         self,
         async_session_db: AsyncSession,
         user: User,
@@ -343,15 +859,13 @@ class TestTrackSQLRepository:
         tracks_update: list[Track],
         track_repository: TrackRepository,
     ) -> None:
-        track_ids, create_count = await track_repository.bulk_upsert(
-            tracks_update,
-            batch_size=int(len(tracks_update) / 5),
-        )
+        track_ids, create_count = await track_repository.bulk_ingest(tracks_update)
 
         assert len(track_ids) == len(tracks_update) == len(tracks) == 10
+        assert track_ids == {t.fingerprint: t.id for t in tracks}
         assert create_count == 0
 
-        stmt = select(TrackModel).where(TrackModel.id.in_(track_ids))
+        stmt = select(TrackModel).where(TrackModel.id.in_(track_ids.values()))
         results = await async_session_db.execute(stmt)
         tracks_db = results.scalars().all()
 
@@ -362,32 +876,7 @@ class TestTrackSQLRepository:
         expected_artists = ["SCH" for _ in range(len(tracks_db))]
         assert artists == expected_artists
 
-    async def test__bulk_upsert__both(
-        self,
-        async_session_db: AsyncSession,
-        user: User,
-        tracks_mix: list[Track],
-        track_repository: TrackRepository,
-    ) -> None:
-        track_ids, create_count = await track_repository.bulk_upsert(tracks_mix, 300)
-
-        assert len(track_ids) == len(tracks_mix) == 10
-        assert create_count == 5
-
-        stmt = select(TrackModel).where(TrackModel.id.in_(track_ids)).order_by(TrackModel.created_at.asc())
-        results = await async_session_db.execute(stmt)
-        tracks_db = results.scalars().all()
-        assert len(tracks_db) == len(tracks_mix)
-        assert set([t.user_id for t in tracks_db]) == {user.id}
-
-        assert sorted([t.provider_links[0]["provider_id"] for t in tracks_db[:5]]) == sorted(
-            [t.provider_links[0].provider_id for t in tracks_mix[:5]]
-        )
-        artists = [track_db.artists[0] for track_db in tracks_db[5:]]
-        expected_artists = ["SCH" for _ in range(len(tracks_db[5:]))]
-        assert artists == expected_artists
-
-    async def test__bulk_upsert__played_at_last_keeps_latest(
+    async def test__bulk_ingest__played_at_last_keeps_latest(
         self,
         user: User,
         track_repository: TrackRepository,
@@ -397,20 +886,20 @@ class TestTrackSQLRepository:
         newer = datetime(2023, 6, 1, tzinfo=UTC)
 
         track = TrackFactory.build(user_id=user.id, played_at_last=older)
-        await track_repository.bulk_upsert([track], batch_size=1)
+        await track_repository.bulk_ingest([track])
 
-        await track_repository.bulk_upsert([dataclasses.replace(track, played_at_last=newer)], batch_size=1)
+        await track_repository.bulk_ingest([dataclasses.replace(track, played_at_last=newer)])
 
         stmt = select(TrackModel).where(TrackModel.id == track.id)
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.played_at_last == newer
 
-        await track_repository.bulk_upsert([dataclasses.replace(track, played_at_last=older)], batch_size=1)
+        await track_repository.bulk_ingest([dataclasses.replace(track, played_at_last=older)])
 
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.played_at_last == newer
 
-    async def test__bulk_upsert__played_at_first_keeps_earliest(
+    async def test__bulk_ingest__played_at_first_keeps_earliest(
         self,
         user: User,
         track_repository: TrackRepository,
@@ -420,35 +909,70 @@ class TestTrackSQLRepository:
         later = datetime(2023, 6, 1, tzinfo=UTC)
 
         track = TrackFactory.build(user_id=user.id, played_at_first=later)
-        await track_repository.bulk_upsert([track], batch_size=1)
+        await track_repository.bulk_ingest([track])
 
-        await track_repository.bulk_upsert([dataclasses.replace(track, played_at_first=earlier)], batch_size=1)
+        await track_repository.bulk_ingest([dataclasses.replace(track, played_at_first=earlier)])
 
         stmt = select(TrackModel).where(TrackModel.id == track.id)
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.played_at_first == earlier
 
-        await track_repository.bulk_upsert([dataclasses.replace(track, played_at_first=later)], batch_size=1)
+        await track_repository.bulk_ingest([dataclasses.replace(track, played_at_first=later)])
 
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.played_at_first == earlier
 
-    async def test__bulk_upsert__played_count_replaced(
+    async def test__bulk_ingest__played_count_replaced(
         self,
         user: User,
         track_repository: TrackRepository,
         async_session_db: AsyncSession,
     ) -> None:
         track = TrackFactory.build(user_id=user.id, played_count=3)
-        await track_repository.bulk_upsert([track], batch_size=1)
+        await track_repository.bulk_ingest([track])
 
-        await track_repository.bulk_upsert([dataclasses.replace(track, played_count=7)], batch_size=1)
+        await track_repository.bulk_ingest([dataclasses.replace(track, played_count=7)])
 
         stmt = select(TrackModel).where(TrackModel.id == track.id)
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.played_count == 7
 
-    async def test__bulk_upsert__same_fingerprint_different_provider_id__deduplicates(
+    async def test__bulk_ingest__played_count_incremented(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        async_session_db: AsyncSession,
+    ) -> None:
+        played_at = datetime(2023, 6, 1, tzinfo=UTC)
+        track = TrackFactory.build(user_id=user.id, played_count=3, played_at_last=played_at)
+        await track_repository.bulk_ingest([track])
+
+        await track_repository.bulk_ingest([dataclasses.replace(track, played_count=2)], increment_played_count=True)
+
+        stmt = select(TrackModel).where(TrackModel.id == track.id)
+        track_db = (await async_session_db.execute(stmt)).scalar_one()
+        assert track_db.played_count == 5
+
+    async def test__bulk_ingest__played_count_incremented__never_played(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        async_session_db: AsyncSession,
+    ) -> None:
+        track = TrackFactory.build(user_id=user.id, played_count=1, played_at_first=None, played_at_last=None)
+        await track_repository.bulk_ingest([track])
+
+        played_at = datetime(2023, 6, 1, tzinfo=UTC)
+        await track_repository.bulk_ingest(
+            [dataclasses.replace(track, played_count=2, played_at_first=played_at, played_at_last=played_at)],
+            increment_played_count=True,
+        )
+
+        stmt = select(TrackModel).where(TrackModel.id == track.id)
+        track_db = (await async_session_db.execute(stmt)).scalar_one()
+        assert track_db.played_count == 2
+
+    async def test__bulk_ingest__same_fingerprint_different_provider_id__deduplicates(
         self,
         user: User,
         track_repository: TrackRepository,
@@ -468,8 +992,8 @@ class TestTrackSQLRepository:
             played_count=5,
         )
 
-        _, created_first = await track_repository.bulk_upsert([first], batch_size=10)
-        _, created_second = await track_repository.bulk_upsert([second], batch_size=10)
+        _, created_first = await track_repository.bulk_ingest([first])
+        _, created_second = await track_repository.bulk_ingest([second])
 
         assert created_first == 1
         assert created_second == 0
@@ -485,26 +1009,222 @@ class TestTrackSQLRepository:
         assert "album_version" in provider_ids
         assert rows[0].played_count == 5
 
-    async def test__bulk_upsert__does_not_overwrite_score_skipped(
+    async def test__bulk_ingest__does_not_overwrite_score_skipped(
         self,
         async_session_db: AsyncSession,
         user: User,
         track_repository: TrackRepository,
     ) -> None:
         track = TrackFactory.build(user_id=user.id, score_skipped=False)
-        await track_repository.bulk_upsert([track], batch_size=1)
+        await track_repository.bulk_ingest([track])
 
         await track_repository.skip(user_id=user.id, track_id=track.id)
 
         track_not_skipped = dataclasses.replace(track, score_skipped=False)
-        await track_repository.bulk_upsert([track_not_skipped], batch_size=1)
+        await track_repository.bulk_ingest([track_not_skipped])
 
         stmt = select(TrackModel).where(TrackModel.id == track.id)
         track_db = (await async_session_db.execute(stmt)).scalar_one()
         assert track_db.score_skipped is True
 
-    async def test__bulk_update__empty_list__is_noop(self, track_repository: TrackRepository) -> None:
-        await track_repository.bulk_update([], frozenset({EnrichField.GENRE}))
+    async def test__bulk_ingest__both(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        tracks_mix: list[Track],
+        track_repository: TrackRepository,
+    ) -> None:
+        track_ids, create_count = await track_repository.bulk_ingest(tracks_mix)
+
+        assert track_ids == {t.fingerprint: t.id for t in tracks_mix}
+        assert create_count == 5
+
+        stmt = select(TrackModel).where(TrackModel.id.in_(track_ids.values()))
+        tracks_db = {track_db.id: track_db for track_db in (await async_session_db.execute(stmt)).scalars()}
+        for track in tracks_mix[:5]:
+            created = tracks_db[track.id].to_entity()
+            assert created.provider_links == track.provider_links, f"Track {track.id}"
+            assert created.artists == track.artists, f"Track {track.id}"
+            assert created.source == track.source, f"Track {track.id}"
+            assert created.genres == track.genres, f"Track {track.id}"
+            assert created.moods == track.moods, f"Track {track.id}"
+        assert [tracks_db[track.id].artists for track in tracks_mix[5:]] == [["SCH"]] * 5
+
+    async def test__bulk_ingest__merge_rules(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        track_repository: TrackRepository,
+    ) -> None:
+        track = TrackFactory.build(
+            user_id=user.id,
+            provider_links=[ProviderLink(provider=MusicProvider.SPOTIFY, provider_id="first")],
+            played_at_first=datetime(2022, 1, 1, tzinfo=UTC),
+            played_at_last=datetime(2022, 6, 1, tzinfo=UTC),
+            played_count=3,
+            source=TrackSource.HISTORY,
+            score=80,
+            score_skipped=True,
+            genres=[GenreTag.ROCK],
+        )
+        await track_repository.bulk_ingest([track])
+
+        await track_repository.bulk_ingest(
+            [
+                dataclasses.replace(
+                    track,
+                    id=uuid.uuid4(),
+                    provider_links=[ProviderLink(provider=MusicProvider.SPOTIFY, provider_id="second")],
+                    played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+                    played_at_last=datetime(2023, 6, 1, tzinfo=UTC),
+                    played_count=2,
+                    source=TrackSource.DISCOVERY,
+                    score=None,
+                    score_skipped=False,
+                    genres=[],
+                )
+            ],
+            increment_played_count=True,
+        )
+
+        track_db = (await async_session_db.execute(select(TrackModel).where(TrackModel.id == track.id))).scalar_one()
+        assert [link["provider_id"] for link in track_db.provider_links] == ["first", "second"]
+        assert track_db.played_at_first == datetime(2022, 1, 1, tzinfo=UTC)
+        assert track_db.played_at_last == datetime(2023, 6, 1, tzinfo=UTC)
+        assert track_db.played_count == 5
+        assert track_db.source == int(TrackSource.HISTORY | TrackSource.DISCOVERY)
+        assert track_db.score == 80
+        assert track_db.score_skipped is True
+        assert track_db.genres == [GenreTag.ROCK.value]
+
+    async def test__bulk_ingest__twice_in_transaction(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+    ) -> None:
+        _, created_first = await track_repository.bulk_ingest([TrackFactory.build(user_id=user.id)])
+        _, created_second = await track_repository.bulk_ingest([TrackFactory.build(user_id=user.id)])
+
+        assert created_first == created_second == 1
+
+    async def test__bulk_ingest__empty_list__is_noop(self, track_repository: TrackRepository) -> None:
+        assert await track_repository.bulk_ingest([]) == ({}, 0)
+
+    async def test__bulk_patch__by_id(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        track_repository: TrackRepository,
+    ) -> None:
+        track_db = await TrackModelFactory.create_async(
+            user_id=user.id, score=3, genres=[GenreTag.ROCK.value], moods=[], locale=None
+        )
+        other_db = await TrackModelFactory.create_async(user_id=user.id, genres=[GenreTag.ROCK.value])
+
+        result = await track_repository.bulk_patch(
+            user_id=user.id,
+            rows=[
+                {
+                    TrackField.ID: track_db.id,
+                    TrackField.GENRES: [GenreTag.JAZZ, GenreTag.NEO_SOUL],
+                    TrackField.MOODS: [MoodTag.CHILL],
+                    TrackField.LOCALE: "fr",
+                },
+            ],
+            fields=frozenset([TrackField.GENRES, TrackField.MOODS, TrackField.LOCALE]),
+        )
+        assert result == TrackPatchResult(matched_keys=frozenset([track_db.id]), unmatched_keys=frozenset())
+
+        await async_session_db.refresh(track_db)
+        assert track_db.genres == [GenreTag.JAZZ.value, GenreTag.NEO_SOUL.value]
+        assert track_db.moods == [MoodTag.CHILL.value]
+        assert track_db.locale == "fr"
+        assert track_db.score == 3
+
+        await async_session_db.refresh(other_db)
+        assert other_db.genres == [GenreTag.ROCK.value]
+
+    async def test__bulk_patch__by_fingerprint(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        track_repository: TrackRepository,
+    ) -> None:
+        rated_db = await TrackModelFactory.create_async(user_id=user.id, score=None, score_skipped=False)
+        skipped_db = await TrackModelFactory.create_async(user_id=user.id, score=None, score_skipped=False)
+        other_user_db = await TrackModelFactory.create_async(score=None)
+
+        scores = await track_repository.bulk_patch(
+            user_id=user.id,
+            rows=[
+                {TrackField.FINGERPRINT: rated_db.fingerprint, TrackField.SCORE: 2},
+                {TrackField.FINGERPRINT: rated_db.fingerprint, TrackField.SCORE: 8},
+                {TrackField.FINGERPRINT: other_user_db.fingerprint, TrackField.SCORE: 5},
+                {TrackField.FINGERPRINT: "unknown", TrackField.SCORE: 5},
+            ],
+            fields=frozenset([TrackField.SCORE]),
+            key=TrackField.FINGERPRINT,
+        )
+        skips = await track_repository.bulk_patch(
+            user_id=user.id,
+            rows=[{TrackField.FINGERPRINT: skipped_db.fingerprint, TrackField.SCORE_SKIPPED: True}],
+            fields=frozenset([TrackField.SCORE_SKIPPED]),
+            key=TrackField.FINGERPRINT,
+        )
+
+        assert scores.matched_keys == {rated_db.fingerprint}
+        assert scores.unmatched_keys == {other_user_db.fingerprint, "unknown"}
+        assert skips.matched_keys == {skipped_db.fingerprint}
+
+        await async_session_db.refresh(rated_db)
+        assert rated_db.score == 8
+        assert rated_db.score_skipped is False
+        await async_session_db.refresh(skipped_db)
+        assert skipped_db.score_skipped is True
+        assert skipped_db.score is None
+        await async_session_db.refresh(other_user_db)
+        assert other_user_db.score is None
+
+    async def test__bulk_patch__chunks(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        track_repository: TrackRepository,
+    ) -> None:
+        tracks_db = await TrackModelFactory.create_batch_async(size=5, user_id=user.id, score=None)
+
+        with mock.patch.object(TrackSQLRepository, "_PATCH_CHUNK_SIZE", 2):
+            result = await track_repository.bulk_patch(
+                user_id=user.id,
+                rows=[{TrackField.ID: track_db.id, TrackField.SCORE: i} for i, track_db in enumerate(tracks_db)],
+                fields=frozenset([TrackField.SCORE]),
+            )
+
+        assert result.matched_keys == {track_db.id for track_db in tracks_db}
+        stmt = select(TrackModel.id, TrackModel.score).where(TrackModel.user_id == user.id)
+        scores = dict((await async_session_db.execute(stmt)).all())
+        assert scores == {track_db.id: i for i, track_db in enumerate(tracks_db)}
+
+    async def test__bulk_patch__empty_list__is_noop(self, user: User, track_repository: TrackRepository) -> None:
+        result = await track_repository.bulk_patch(user_id=user.id, rows=[], fields=frozenset([TrackField.SCORE]))
+        assert result == TrackPatchResult(matched_keys=frozenset(), unmatched_keys=frozenset())
+
+    @pytest.mark.parametrize(
+        ("fields", "key"),
+        [
+            pytest.param(frozenset([TrackField.NAME]), TrackField.ID, id="field"),
+            pytest.param(frozenset([TrackField.SCORE]), TrackField.NAME, id="key"),
+        ],
+    )
+    async def test__bulk_patch__invalid(
+        self,
+        user: User,
+        track_repository: TrackRepository,
+        fields: frozenset[TrackField],
+        key: TrackField,
+    ) -> None:
+        with pytest.raises(ValueError):
+            await track_repository.bulk_patch(user_id=user.id, rows=[], fields=fields, key=key)
 
     async def test__purge(
         self,
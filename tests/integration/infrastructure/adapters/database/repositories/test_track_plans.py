@@ -0,0 +1,220 @@
+from collections.abc import AsyncGenerator
+from collections.abc import Iterator
+from datetime import date
+from hashlib import md5
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import pytest
+
+from museflow.application.inputs.track import TrackFilter
+from museflow.domain.entities.user import User
+from museflow.domain.enums import GenreTag
+from museflow.domain.enums import MoodTag
+from museflow.domain.enums import MusicProvider
+from museflow.domain.enums import SortOrder
+from museflow.domain.enums import TrackField
+from museflow.domain.enums import TrackOrderBy
+from museflow.domain.enums import TrackSource
+from museflow.infrastructure.adapters.database.repositories.track import TrackSQLRepository
+
+from tests.integration.factories.models.user import UserModelFactory
+
+# Large enough for the planner to prefer the indexes over sequential scans.
+LIBRARY_SIZE = 10_000
+
+SEED_LIBRARY_SQL = text("""
+    INSERT INTO museflow_track (
+        id, user_id, name, provider_links, artists, fingerprint, played_at_first, played_at_last, played_count,
+        source, score, score_skipped, genres, moods, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(),
+        :user_id,
+        'Track ' || i,
+        jsonb_build_array(jsonb_build_object('provider', 'spotify', 'provider_id', 'spotify-' || i)),
+        jsonb_build_array('Artist ' || (i % 2000)),
+        md5('track ' || i) || '|' || md5('artist ' || (i % 2000)),
+        timestamptz '2015-01-01' + (i % 3650) * interval '1 day',
+        timestamptz '2025-01-01' - (i % 3650) * interval '1 day',
+        1 + (i * 7919) % 500,
+        CASE WHEN i % 4 = 0 THEN 2 ELSE 1 END,
+        CASE WHEN i % 50 = 0 THEN NULL ELSE i % 100 END,
+        i % 200 = 0,
+        CASE WHEN i % 500 = 0 THEN ARRAY[:rare_genre] ELSE ARRAY[:common_genre] END,
+        CASE WHEN i % 500 = 0 THEN ARRAY[:rare_mood] ELSE ARRAY[:common_mood] END,
+        timestamptz '2025-01-01' + i * interval '1 second',
+        timestamptz '2025-01-01' + i * interval '1 second'
+    FROM generate_series(1, :size) AS i
+""")
+
+
+class TestTrackSQLRepositoryQueryPlans:
+    """Check that the common track queries are served by the indexes on a large library."""
+
+    @pytest.fixture
+    async def library(self, async_session_db: AsyncSession, user: User) -> None:
+        other_users = await UserModelFactory.create_batch_async(size=1)
+
+        for user_id in [user.id, *(other_user.id for other_user in other_users)]:
+            await async_session_db.execute(
+                SEED_LIBRARY_SQL,
+                {
+                    "user_id": user_id,
+                    "size": LIBRARY_SIZE,
+                    "rare_genre": GenreTag.JAZZ.value,
+                    "common_genre": GenreTag.ROCK.value,
+                    "rare_mood": MoodTag.MELANCHOLIC.value,
+                    "common_mood": MoodTag.ENERGETIC.value,
+                },
+            )
+        await async_session_db.execute(text("ANALYZE museflow_track"))
+        # Like autovacuum would, merge the rows just inserted into the trigram index (pending while fastupdate is on).
+        await async_session_db.execute(text("SELECT gin_clean_pending_list('ix_museflow_track_fingerprint_trgm')"))
+
+    @pytest.fixture
+    async def statements(self, async_session_db: AsyncSession) -> AsyncGenerator[list[tuple[str, Any]]]:
+        statements: list[tuple[str, Any]] = []
+
+        def capture(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+            statements.append((statement, parameters))
+
+        conn = await async_session_db.connection()
+        event.listen(conn.sync_connection, "before_cursor_execute", capture)
+        yield statements
+        event.remove(conn.sync_connection, "before_cursor_execute", capture)
+
+    @staticmethod
+    def _index_names(plan: dict[str, Any]) -> Iterator[str]:
+        if "Index Name" in plan:
+            yield plan["Index Name"]
+        for subplan in plan.get("Plans", []):
+            yield from TestTrackSQLRepositoryQueryPlans._index_names(subplan)
+
+    async def _explain(self, async_session_db: AsyncSession, statement: str, parameters: Any) -> set[str]:
+        conn = await async_session_db.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()[0]["Plan"]
+        return set(self._index_names(plan))
+
+    @pytest.mark.parametrize(
+        ("params", "index_name"),
+        [
+            pytest.param(
+                {"track_filter": TrackFilter(min_score=95), "limit": 20},
+                "ix_museflow_track_user_score",
+                id="min_score",
+            ),
+            pytest.param(
+                {"order": [(TrackOrderBy.PLAYED_COUNT, SortOrder.DESC)], "limit": 50},
+                "ix_museflow_track_user_played_count",
+                id="top_played",
+            ),
+            pytest.param(
+                {
+                    "track_filter": TrackFilter(source=TrackSource.HISTORY, unrated_only=True, exclude_skipped=True),
+                    "order": [(TrackOrderBy.PLAYED_COUNT, SortOrder.DESC)],
+                    "limit": 20,
+                },
+                "ix_museflow_track_user_rating_queue",
+                id="rating_queue",
+            ),
+            pytest.param(
+                {"track_filter": TrackFilter(genres=[GenreTag.JAZZ])},
+                "ix_museflow_track_genres",
+                id="genres",
+            ),
+            pytest.param(
+                {"track_filter": TrackFilter(moods=[MoodTag.MELANCHOLIC])},
+                "ix_museflow_track_moods",
+                id="moods",
+            ),
+            pytest.param(
+                {"track_filter": TrackFilter(artist_name="ARTIST 42")},
+                "ix_museflow_track_user_primary_artist",
+                id="artist_name",
+            ),
+            pytest.param(
+                {"track_filter": TrackFilter(played_first_min=date(2016, 3, 1), played_first_max=date(2016, 3, 7))},
+                "ix_museflow_track_user_played_at_first",
+                id="played_first",
+            ),
+            pytest.param(
+                {"track_filter": TrackFilter(played_last_min=date(2020, 6, 1), played_last_max=date(2020, 6, 7))},
+                "ix_museflow_track_user_played_at_last",
+                id="played_last",
+            ),
+            pytest.param(
+                {"limit": 100},
+                "ix_museflow_track_user_created_at",
+                id="default_order",
+            ),
+        ],
+    )
+    async def test__get_list__index(
+        self,
+        async_session_db: AsyncSession,
+        track_repository: TrackSQLRepository,
+        library: None,
+        statements: list[tuple[str, Any]],
+        user: User,
+        params: dict[str, Any],
+        index_name: str,
+    ) -> None:
+        await track_repository.get_list(user_id=user.id, **params)
+
+        statement, parameters = statements[-1]
+        assert index_name in await self._explain(async_session_db, statement, parameters)
+
+    async def test__get_list__random_sample__index(
+        self,
+        async_session_db: AsyncSession,
+        track_repository: TrackSQLRepository,
+        library: None,
+        statements: list[tuple[str, Any]],
+        user: User,
+    ) -> None:
+        await track_repository.get_list(user_id=user.id, order=[(TrackOrderBy.RANDOM, SortOrder.ASC)], limit=20)
+
+        statement, parameters = statements[0]  # The random probes, before the rows are read by id.
+        assert "ix_museflow_track_user_random_key" in await self._explain(async_session_db, statement, parameters)
+
+    async def test__iter_rows__index(
+        self,
+        async_session_db: AsyncSession,
+        track_repository: TrackSQLRepository,
+        library: None,
+        statements: list[tuple[str, Any]],
+        user: User,
+    ) -> None:
+        chunks = track_repository.iter_rows(fields=[TrackField.ID], user_id=user.id, chunk_size=500)
+        await anext(chunks)
+        await anext(chunks)  # The second chunk starts after the keyset of the first one.
+        await chunks.aclose()
+
+        statement, parameters = statements[-1]
+        assert "ix_museflow_track_user_created_at" in await self._explain(async_session_db, statement, parameters)
+
+    async def test__search_catalog__index(
+        self,
+        async_session_db: AsyncSession,
+        track_repository: TrackSQLRepository,
+        library: None,
+        statements: list[tuple[str, Any]],
+        user: User,
+    ) -> None:
+        await track_repository.search_catalog(
+            user_id=user.id,
+            fingerprints=[
+                f"{md5(b'track 42').hexdigest()}|{md5(b'artist 42').hexdigest()}",
+                f"{md5(b'track 1234').hexdigest()[1:]}|{md5(b'artist 1234').hexdigest()}",  # Typo
+            ],
+            provider=MusicProvider.SPOTIFY,
+            limit=10,
+        )
+
+        statement, parameters = statements[-1]
+        assert "ix_museflow_track_fingerprint_trgm" in await self._explain(async_session_db, statement, parameters)
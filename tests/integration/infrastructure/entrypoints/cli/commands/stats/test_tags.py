@@ -0,0 +1,33 @@
+from museflow.domain.entities.user import User
+from museflow.domain.enums import EnrichField
+from museflow.infrastructure.entrypoints.cli.commands.stats.tags import tags_logic
+from museflow.infrastructure.entrypoints.cli.types import SourceFilter
+from museflow.infrastructure.entrypoints.cli.types import TagSortBy
+
+from tests.integration.factories.models.track import TrackModelFactory
+
+
+class TestStatsTagsLogic:
+    async def test__nominal(self, user: User) -> None:
+        await TrackModelFactory.create_async(user_id=user.id, genres=["rock", "indie-rock"], score=8, played_count=2)
+        await TrackModelFactory.create_async(user_id=user.id, genres=["rock"], score=None, played_count=3)
+        await TrackModelFactory.create_async(user_id=user.id, genres=[], score=10, played_count=1)
+
+        result = await tags_logic(
+            email=user.email,
+            field=EnrichField.GENRE,
+            limit=20,
+            source=SourceFilter.ALL,
+            score_min=None,
+            score_max=None,
+            sort=TagSortBy.TRACK_COUNT,
+        )
+
+        assert len(result) == 2
+        assert result[0].tag == "rock"
+        assert result[0].track_count == 2
+        assert result[0].plays_count == 5
+        assert result[0].rated_count == 1
+        assert result[0].rate_avg == 8.0
+        assert result[1].tag == "indie-rock"
+        assert result[1].track_count == 1
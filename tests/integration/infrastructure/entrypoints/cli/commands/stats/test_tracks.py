@@ -15,9 +15,9 @@ class TestStatsTracksLogic:
 
         assert len(result) == 3
         # Tracks ordered by score DESC
-        assert result[0].id == track_c.id
-        assert result[1].id == track_a.id
-        assert result[2].id == track_b.id
+        assert result[0]["id"] == track_c.id
+        assert result[1]["id"] == track_a.id
+        assert result[2]["id"] == track_b.id
 
     async def test__sorted_by_played_count(self, user: User) -> None:
         track_a = await TrackModelFactory.create_async(user_id=user.id, artists=["Artist A"], score=8, played_count=1)
@@ -30,6 +30,6 @@ class TestStatsTracksLogic:
 
         assert len(result) == 3
         # Tracks ordered by played_count DESC
-        assert result[0].id == track_b.id
-        assert result[1].id == track_c.id
-        assert result[2].id == track_a.id
+        assert result[0]["id"] == track_b.id
+        assert result[1]["id"] == track_c.id
+        assert result[2]["id"] == track_a.id
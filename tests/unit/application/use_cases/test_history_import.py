@@ -5,20 +5,32 @@ from unittest import mock
 
 import pytest
 
+from museflow.application.inputs.history import StreamingHistoryEntry
 from museflow.application.inputs.history import StreamingHistoryFileStats
 from museflow.application.inputs.history import StreamingHistoryImportConfigInput
+from museflow.application.inputs.history import StreamingHistoryTrackAggregate
 from museflow.application.use_cases.history_import import ImportStreamingHistoryReport
 from museflow.application.use_cases.history_import import ImportStreamingHistoryUseCase
+from museflow.application.utils.history import StreamingHistoryAggregator
+from museflow.domain.entities.history import HistoryManifestEntry
 from museflow.domain.entities.track import Track
 from museflow.domain.entities.user import User
 from museflow.domain.enums import MusicProvider
 from museflow.domain.exceptions import StreamingHistoryDirectoryNotFound
+from museflow.domain.exceptions import StreamingHistoryInvalidFormat
 from museflow.domain.utils.text import generate_fingerprint
 from museflow.domain.value_objects.track import TrackKnowIdentifiers
 
 from tests.unit.factories.inputs.history import StreamingHistoryEntryFactory
 
 
+def aggregate(entries: list[StreamingHistoryEntry]) -> dict[str, StreamingHistoryTrackAggregate]:
+    aggregator = StreamingHistoryAggregator()
+    for entry in entries:
+        aggregator.add(entry)
+    return aggregator.aggregates
+
+
 class TestImportStreamingHistorySpotifyUseCase:
     @pytest.fixture
     def history_dir(self, tmp_path: Path) -> Path:
@@ -29,10 +41,12 @@ class TestImportStreamingHistorySpotifyUseCase:
     def use_case(
         self,
         mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
         mock_streaming_history: mock.AsyncMock,
     ) -> ImportStreamingHistoryUseCase:
         return ImportStreamingHistoryUseCase(
             track_repository=mock_track_repository,
+            history_manifest_repository=mock_history_manifest_repository,
             streaming_history=mock_streaming_history,
         )
 
@@ -45,12 +59,14 @@ class TestImportStreamingHistorySpotifyUseCase:
         mock_streaming_history: mock.AsyncMock,
     ) -> None:
         entries = StreamingHistoryEntryFactory.batch(2)
-        mock_streaming_history.parse_file.return_value = (
-            entries,
-            StreamingHistoryFileStats(items_read=5, items_skipped_short_play=1, items_skipped_no_track_id=2),
-        )
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (
+                aggregate(entries),
+                StreamingHistoryFileStats(items_read=5, items_skipped_short_play=1, items_skipped_no_track_id=2),
+            )
+        ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
-        mock_track_repository.bulk_upsert.return_value = ([], 2)
+        mock_track_repository.bulk_ingest.return_value = ({}, 2)
 
         report = await use_case.import_history(
             user=user,
@@ -58,6 +74,8 @@ class TestImportStreamingHistorySpotifyUseCase:
         )
 
         assert report == ImportStreamingHistoryReport(
+            files_read=1,
+            files_skipped_unchanged=0,
             items_read=5,
             items_skipped_no_timestamp=0,
             items_skipped_short_play=1,
@@ -85,16 +103,18 @@ class TestImportStreamingHistorySpotifyUseCase:
             ),
             StreamingHistoryEntryFactory.build(provider_id="track2"),
         ]
-        mock_streaming_history.parse_file.return_value = (entries, StreamingHistoryFileStats())
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate(entries), StreamingHistoryFileStats())
+        ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
-        mock_track_repository.bulk_upsert.return_value = ([], 2)
+        mock_track_repository.bulk_ingest.return_value = ({}, 2)
 
         await use_case.import_history(
             user=user,
             config=StreamingHistoryImportConfigInput(directory=history_dir),
         )
 
-        upserted: list[Track] = mock_track_repository.bulk_upsert.call_args.kwargs["tracks"]
+        upserted: list[Track] = mock_track_repository.bulk_ingest.call_args.kwargs["tracks"]
         assert len(upserted) == 2
         upserted_by_id = {t.get_provider_id(MusicProvider.SPOTIFY): t for t in upserted}
 
@@ -120,11 +140,13 @@ class TestImportStreamingHistorySpotifyUseCase:
         fp1 = generate_fingerprint(name="Song One", artist_names=["Artist One"])
         fp2 = generate_fingerprint(name="Song Two", artist_names=["Artist Two"])
 
-        mock_streaming_history.parse_file.return_value = (entries, StreamingHistoryFileStats())
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate(entries), StreamingHistoryFileStats())
+        ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(
             fingerprints=frozenset([fp1, fp2])
         )
-        mock_track_repository.bulk_upsert.return_value = ([], 0)
+        mock_track_repository.bulk_ingest.return_value = ({}, 0)
 
         report = await use_case.import_history(
             user=user,
@@ -143,6 +165,7 @@ class TestImportStreamingHistorySpotifyUseCase:
         history_dir: Path,
         use_case: ImportStreamingHistoryUseCase,
         mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
     ) -> None:
         mock_track_repository.purge.return_value = 5
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
@@ -153,6 +176,7 @@ class TestImportStreamingHistorySpotifyUseCase:
         )
 
         mock_track_repository.purge.assert_called_once()
+        mock_history_manifest_repository.purge.assert_called_once_with(user_id=user.id, provider=MusicProvider.SPOTIFY)
         assert report.tracks_purged == 5
 
     async def test__no_tracks_parsed__skips_known_ids_lookup(
@@ -203,12 +227,11 @@ class TestImportStreamingHistorySpotifyUseCase:
         mock_track_repository: mock.AsyncMock,
         mock_streaming_history: mock.AsyncMock,
     ) -> None:
-        mock_streaming_history.parse_file.return_value = (
-            StreamingHistoryEntryFactory.batch(3),
-            StreamingHistoryFileStats(),
-        )
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate(StreamingHistoryEntryFactory.batch(3)), StreamingHistoryFileStats())
+        ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
-        mock_track_repository.bulk_upsert.side_effect = [([], 1), ([], 1), ([], 1)]
+        mock_track_repository.bulk_ingest.side_effect = [({}, 1), ({}, 1), ({}, 1)]
 
         report = await use_case.import_history(
             user=user,
@@ -216,7 +239,7 @@ class TestImportStreamingHistorySpotifyUseCase:
         )
 
         assert report.tracks_created == 3
-        assert mock_track_repository.bulk_upsert.call_count == 3
+        assert mock_track_repository.bulk_ingest.call_count == 3
 
     async def test__merge_across_files__keeps_latest_played_at(
         self,
@@ -229,64 +252,73 @@ class TestImportStreamingHistorySpotifyUseCase:
         (tmp_path / "file1.json").write_text("[]")
         (tmp_path / "file2.json").write_text("[]")
 
-        mock_streaming_history.parse_file.side_effect = [
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
             (
-                [
-                    StreamingHistoryEntryFactory.build(
-                        provider_id="track_1",
-                        name="Song 1",
-                        artist="Artist",
-                        played_at=datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC),
-                    ),
-                    StreamingHistoryEntryFactory.build(
-                        provider_id="track_2",
-                        name="Song 2",
-                        artist="Artist",
-                        played_at=datetime(2023, 1, 5, 10, 0, 0, tzinfo=UTC),
-                    ),
-                    StreamingHistoryEntryFactory.build(
-                        provider_id="track_4",
-                        name="Song 4",
-                        artist="Artist",
-                        played_at=datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC),
-                    ),
-                ],
+                aggregate(
+                    [
+                        StreamingHistoryEntryFactory.build(
+                            provider_id="track_1",
+                            name="Song 1",
+                            artist="Artist",
+                            played_at=datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC),
+                        ),
+                        StreamingHistoryEntryFactory.build(
+                            provider_id="track_2",
+                            name="Song 2",
+                            artist="Artist",
+                            played_at=datetime(2023, 1, 5, 10, 0, 0, tzinfo=UTC),
+                        ),
+                        StreamingHistoryEntryFactory.build(
+                            provider_id="track_4",
+                            name="Song 4",
+                            artist="Artist",
+                            played_at=datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC),
+                        ),
+                    ]
+                ),
                 StreamingHistoryFileStats(),
             ),
             (
-                [
-                    StreamingHistoryEntryFactory.build(
-                        provider_id="track_1",
-                        name="Song 1",
-                        artist="Artist",
-                        played_at=datetime(2023, 1, 3, 10, 0, 0, tzinfo=UTC),
-                    ),
-                    StreamingHistoryEntryFactory.build(
-                        provider_id="track_2",
-                        name="Song 2",
-                        artist="Artist",
-                        played_at=datetime(2023, 1, 4, 10, 0, 0, tzinfo=UTC),
-                    ),
-                    StreamingHistoryEntryFactory.build(
-                        provider_id="track_3",
-                        name="Song 3",
-                        artist="Artist",
-                        played_at=datetime(2023, 1, 2, 10, 0, 0, tzinfo=UTC),
-                    ),
-                ],
+                aggregate(
+                    [
+                        StreamingHistoryEntryFactory.build(
+                            provider_id="track_1",
+                            name="Song 1",
+                            artist="Artist",
+                            played_at=datetime(2023, 1, 3, 10, 0, 0, tzinfo=UTC),
+                        ),
+                        StreamingHistoryEntryFactory.build(
+                            provider_id="track_2",
+                            name="Song 2",
+                            artist="Artist",
+                            played_at=datetime(2023, 1, 4, 10, 0, 0, tzinfo=UTC),
+                        ),
+                        StreamingHistoryEntryFactory.build(
+                            provider_id="track_3",
+                            name="Song 3",
+                            artist="Artist",
+                            played_at=datetime(2023, 1, 2, 10, 0, 0, tzinfo=UTC),
+                        ),
+                    ]
+                ),
                 StreamingHistoryFileStats(),
             ),
         ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
-        mock_track_repository.bulk_upsert.return_value = ([], 4)
+        mock_track_repository.bulk_ingest.return_value = ({}, 4)
 
         await use_case.import_history(
             user=user,
             config=StreamingHistoryImportConfigInput(directory=tmp_path),
         )
 
-        upserted: list[Track] = mock_track_repository.bulk_upsert.call_args.kwargs["tracks"]
-        upserted_by_id = {t.get_provider_id(MusicProvider.SPOTIFY): t for t in upserted}
+        # Each file is written on its own: the last write of a track holds its final values.
+        assert mock_track_repository.bulk_ingest.call_count == 2
+        upserted_by_id = {
+            t.get_provider_id(MusicProvider.SPOTIFY): t
+            for call in mock_track_repository.bulk_ingest.call_args_list
+            for t in call.kwargs["tracks"]
+        }
 
         assert upserted_by_id["track_1"].played_at_last == datetime(2023, 1, 3, 10, 0, 0, tzinfo=UTC)
         assert upserted_by_id["track_2"].played_at_last == datetime(2023, 1, 5, 10, 0, 0, tzinfo=UTC)
@@ -316,9 +348,11 @@ class TestImportStreamingHistorySpotifyUseCase:
                 played_at=datetime(2023, 2, 1, 10, 0, 0, tzinfo=UTC),
             ),
         ]
-        mock_streaming_history.parse_file.return_value = (entries, StreamingHistoryFileStats())
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate(entries), StreamingHistoryFileStats())
+        ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
-        mock_track_repository.bulk_upsert.return_value = ([], 1)
+        mock_track_repository.bulk_ingest.return_value = ({}, 1)
 
         report = await use_case.import_history(
             user=user,
@@ -328,7 +362,7 @@ class TestImportStreamingHistorySpotifyUseCase:
         assert report.unique_track_ids == 1
         assert report.plays_total == 2
 
-        upserted: list[Track] = mock_track_repository.bulk_upsert.call_args.kwargs["tracks"]
+        upserted: list[Track] = mock_track_repository.bulk_ingest.call_args.kwargs["tracks"]
         assert len(upserted) == 1
         assert upserted[0].played_count == 2
         assert upserted[0].played_at_first == datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
@@ -359,11 +393,13 @@ class TestImportStreamingHistorySpotifyUseCase:
         fp1 = generate_fingerprint(name="Song One", artist_names=["Artist One"])
         fp2 = generate_fingerprint(name="Song Two", artist_names=["Artist Two"])
 
-        mock_streaming_history.parse_file.return_value = (entries, StreamingHistoryFileStats())
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate(entries), StreamingHistoryFileStats())
+        ]
         mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(
             fingerprints=frozenset([fp1, fp2])
         )
-        mock_track_repository.bulk_upsert.return_value = ([], 0)
+        mock_track_repository.bulk_ingest.return_value = ({}, 0)
 
         report = await use_case.import_history(
             user=user,
@@ -373,7 +409,250 @@ class TestImportStreamingHistorySpotifyUseCase:
         assert report.tracks_played_at_updated == 2
         assert report.tracks_created == 0
 
-        upserted: list[Track] = mock_track_repository.bulk_upsert.call_args.kwargs["tracks"]
+        upserted: list[Track] = mock_track_repository.bulk_ingest.call_args.kwargs["tracks"]
         upserted_by_id = {t.get_provider_id(MusicProvider.SPOTIFY): t for t in upserted}
         assert upserted_by_id["track1"].played_at_last == datetime(2024, 3, 1, 10, 0, 0, tzinfo=UTC)
         assert upserted_by_id["track2"].played_at_last == datetime(2024, 3, 2, 12, 0, 0, tzinfo=UTC)
+
+    async def test__manifest__unchanged_file_skipped(
+        self,
+        user: User,
+        tmp_path: Path,
+        use_case: ImportStreamingHistoryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
+        mock_streaming_history: mock.AsyncMock,
+    ) -> None:
+        (tmp_path / "old.json").write_text("[]")
+        (tmp_path / "new.json").write_text("[]")
+        mock_history_manifest_repository.get_list.return_value = [
+            HistoryManifestEntry(
+                user_id=user.id,
+                provider=MusicProvider.SPOTIFY,
+                file_name="old.json",
+                content_hash="hash-old.json",
+                size=0,
+                modified_at=datetime(2024, 1, 1, tzinfo=UTC),
+                played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+                played_at_last=datetime(2023, 12, 31, tzinfo=UTC),
+            ),
+        ]
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (
+                aggregate(StreamingHistoryEntryFactory.batch(1)),
+                StreamingHistoryFileStats(items_read=3, items_skipped_already_imported=2),
+            )
+        ]
+        mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
+        mock_track_repository.bulk_ingest.return_value = ({}, 1)
+
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=tmp_path),
+        )
+
+        assert report.files_read == 1
+        assert report.files_skipped_unchanged == 1
+        assert report.items_skipped_already_imported == 2
+
+        aggregate_call = mock_streaming_history.aggregate_files.call_args
+        assert aggregate_call.kwargs["paths"] == [tmp_path / "new.json"]
+        assert aggregate_call.kwargs["imported_ranges"] == [
+            (datetime(2023, 1, 1, tzinfo=UTC), datetime(2023, 12, 31, tzinfo=UTC))
+        ]
+        assert mock_track_repository.bulk_ingest.call_args.kwargs["increment_played_count"] is True
+
+    async def test__manifest__all_files_unchanged(
+        self,
+        user: User,
+        history_dir: Path,
+        use_case: ImportStreamingHistoryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
+        mock_streaming_history: mock.AsyncMock,
+    ) -> None:
+        mock_history_manifest_repository.get_list.return_value = [
+            HistoryManifestEntry(
+                user_id=user.id,
+                provider=MusicProvider.SPOTIFY,
+                file_name="history.json",
+                content_hash="hash-history.json",
+                size=0,
+                modified_at=datetime(2024, 1, 1, tzinfo=UTC),
+            ),
+        ]
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = []
+
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=history_dir),
+        )
+
+        assert report.files_read == 0
+        assert report.files_skipped_unchanged == 1
+        assert report.unique_track_ids == 0
+        mock_track_repository.bulk_ingest.assert_not_called()
+        mock_history_manifest_repository.bulk_upsert.assert_not_called()
+
+    async def test__manifest__changed_file_range_extended(
+        self,
+        user: User,
+        history_dir: Path,
+        use_case: ImportStreamingHistoryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
+        mock_streaming_history: mock.AsyncMock,
+    ) -> None:
+        mock_history_manifest_repository.get_list.return_value = [
+            HistoryManifestEntry(
+                user_id=user.id,
+                provider=MusicProvider.SPOTIFY,
+                file_name="history.json",
+                content_hash="outdated",
+                size=0,
+                modified_at=datetime(2024, 1, 1, tzinfo=UTC),
+                played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+                played_at_last=datetime(2023, 6, 30, tzinfo=UTC),
+            ),
+        ]
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (
+                {},
+                StreamingHistoryFileStats(
+                    played_at_first=datetime(2023, 3, 1, tzinfo=UTC),
+                    played_at_last=datetime(2023, 12, 31, tzinfo=UTC),
+                ),
+            )
+        ]
+
+        await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=history_dir),
+        )
+
+        [entry] = mock_history_manifest_repository.bulk_upsert.call_args.args[0]
+        assert entry.user_id == user.id
+        assert entry.file_name == "history.json"
+        assert entry.content_hash == "hash-history.json"
+        assert entry.played_at_first == datetime(2023, 1, 1, tzinfo=UTC)
+        assert entry.played_at_last == datetime(2023, 12, 31, tzinfo=UTC)
+
+    async def test__pipeline__known_lookup_per_new_fingerprint(
+        self,
+        user: User,
+        tmp_path: Path,
+        use_case: ImportStreamingHistoryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
+        mock_streaming_history: mock.AsyncMock,
+    ) -> None:
+        (tmp_path / "file1.json").write_text("[]")
+        (tmp_path / "file2.json").write_text("[]")
+        (tmp_path / "file3.json").write_text("[]")
+        mock_history_manifest_repository.get_list.return_value = [
+            HistoryManifestEntry(
+                user_id=user.id,
+                provider=MusicProvider.SPOTIFY,
+                file_name="file3.json",
+                content_hash="outdated",
+                size=0,
+                modified_at=datetime(2024, 1, 1, tzinfo=UTC),
+            ),
+        ]
+        song_1 = StreamingHistoryEntryFactory.build(provider_id="track_1", name="Song 1", artist="Artist")
+        song_2 = StreamingHistoryEntryFactory.build(provider_id="track_2", name="Song 2", artist="Artist")
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate([song_1, song_1]), StreamingHistoryFileStats()),
+            (aggregate([song_1, song_2]), StreamingHistoryFileStats()),
+            ({}, StreamingHistoryFileStats()),
+        ]
+        mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
+        mock_track_repository.bulk_ingest.return_value = ({}, 1)
+
+        report = await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=tmp_path),
+        )
+
+        assert report.files_read == 3
+        assert report.unique_track_ids == 2
+        assert report.plays_total == 4
+        assert report.tracks_created == 2
+
+        lookups = [call.kwargs["fingerprints"] for call in mock_track_repository.get_known_identifiers.call_args_list]
+        assert lookups == [
+            [generate_fingerprint(name="Song 1", artist_names=["Artist"])],
+            [generate_fingerprint(name="Song 2", artist_names=["Artist"])],
+        ]
+
+        # In incremental mode, each file only adds its own plays.
+        played_counts = [
+            {t.get_provider_id(MusicProvider.SPOTIFY): t.played_count for t in call.kwargs["tracks"]}
+            for call in mock_track_repository.bulk_ingest.call_args_list
+        ]
+        assert played_counts == [{"track_1": 2}, {"track_1": 1, "track_2": 1}]
+        assert [call.args[0][0].file_name for call in mock_history_manifest_repository.bulk_upsert.call_args_list] == [
+            "file1.json",
+            "file2.json",
+            "file3.json",
+        ]
+
+    async def test__pipeline__manifest_committed_with_file_plays(
+        self,
+        user: User,
+        tmp_path: Path,
+        use_case: ImportStreamingHistoryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
+        mock_streaming_history: mock.AsyncMock,
+    ) -> None:
+        (tmp_path / "file1.json").write_text("[]")
+        (tmp_path / "file2.json").write_text("[]")
+        song_1 = StreamingHistoryEntryFactory.build(provider_id="track_1", name="Song 1", artist="Artist")
+        song_2 = StreamingHistoryEntryFactory.build(provider_id="track_2", name="Song 2", artist="Artist")
+        mock_streaming_history.aggregate_files.return_value.__aiter__.return_value = [
+            (aggregate([song_1, song_2]), StreamingHistoryFileStats()),
+            (aggregate([song_2]), StreamingHistoryFileStats()),
+        ]
+        mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
+        mock_track_repository.bulk_ingest.return_value = ({}, 1)
+
+        writes = mock.Mock()
+        writes.attach_mock(mock_track_repository.bulk_ingest, "bulk_ingest")
+        writes.attach_mock(mock_history_manifest_repository.bulk_upsert, "bulk_upsert")
+
+        await use_case.import_history(
+            user=user,
+            config=StreamingHistoryImportConfigInput(directory=tmp_path, batch_size=1),
+        )
+
+        # The plays of a file are left uncommitted until its manifest entry is written.
+        assert [(name, kwargs.get("commit")) for name, _, kwargs in writes.mock_calls] == [
+            ("bulk_ingest", False),
+            ("bulk_ingest", False),
+            ("bulk_upsert", None),
+            ("bulk_ingest", False),
+            ("bulk_upsert", None),
+        ]
+
+    async def test__pipeline__parse_error__raised(
+        self,
+        user: User,
+        history_dir: Path,
+        use_case: ImportStreamingHistoryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_history_manifest_repository: mock.AsyncMock,
+        mock_streaming_history: mock.AsyncMock,
+    ) -> None:
+        mock_streaming_history.aggregate_files.return_value.__aiter__.side_effect = StreamingHistoryInvalidFormat(
+            "Invalid JSON"
+        )
+
+        with pytest.raises(StreamingHistoryInvalidFormat, match="Invalid JSON"):
+            await use_case.import_history(
+                user=user,
+                config=StreamingHistoryImportConfigInput(directory=history_dir),
+            )
+
+        mock_track_repository.bulk_ingest.assert_not_called()
+        mock_history_manifest_repository.bulk_upsert.assert_not_called()
@@ -1,5 +1,4 @@
 import re
-import uuid
 from datetime import date
 from unittest import mock
 
@@ -25,8 +24,6 @@ class TestPlaylistHistoryUseCase:
         mock_provider_library: mock.AsyncMock,
     ) -> None:
         user = UserFactory.build()
-        excluded_id = uuid.uuid4()
-        mock_playlist_repository.get_track_ids.return_value = frozenset({excluded_id})
         mock_track_repository.get_list.return_value = []
 
         with pytest.raises(PlaylistNoTracksError):
@@ -38,8 +35,10 @@ class TestPlaylistHistoryUseCase:
                 provider_library=mock_provider_library,
             )
 
-        mock_playlist_repository.get_track_ids.assert_awaited_once_with(user.id, type=PlaylistType.HISTORY)
-        assert mock_track_repository.get_list.call_args.kwargs["exclude_ids"] == [excluded_id]
+        assert (
+            mock_track_repository.get_list.call_args.kwargs["track_filter"].exclude_in_playlist_type
+            == PlaylistType.HISTORY
+        )
         mock_provider_library.create_playlist.assert_not_awaited()
 
     async def test__no_tracks_found__duplicates_allowed__skips_dedup_lookup(
@@ -60,8 +59,7 @@ class TestPlaylistHistoryUseCase:
                 provider_library=mock_provider_library,
             )
 
-        mock_playlist_repository.get_track_ids.assert_not_awaited()
-        assert mock_track_repository.get_list.call_args.kwargs["exclude_ids"] is None
+        assert mock_track_repository.get_list.call_args.kwargs["track_filter"].exclude_in_playlist_type is None
 
     async def test__dry_run__skips_playlist_creation(
         self,
@@ -141,6 +139,33 @@ class TestPlaylistHistoryUseCase:
         call_tracks = mock_provider_library.create_playlist.call_args.kwargs["tracks"]
         assert call_tracks == [track_b1, track_a1, track_a2, track_c1]
 
+    async def test__group_by_artists__random(
+        self,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_repository: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+    ) -> None:
+        user = UserFactory.build()
+        # Artist groups keep the random order of their first track.
+        track_a1 = TrackFactory.build(artists=["Artist A"], played_count=1)
+        track_b1 = TrackFactory.build(artists=["Artist B"], played_count=9)
+        track_a2 = TrackFactory.build(artists=["Artist A"], played_count=5)
+        mock_track_repository.get_list.return_value = [track_a1, track_b1, track_a2]
+        playlist = mock_provider_library.create_playlist.return_value
+        mock_playlist_repository.save.return_value = playlist
+
+        await playlist_history(
+            user=user,
+            config=PlaylistHistoryConfigInput(sort_by=PlaylistHistoryOrderBy.RANDOM, group_by_artists=True),
+            track_repository=mock_track_repository,
+            playlist_repository=mock_playlist_repository,
+            provider_library=mock_provider_library,
+        )
+
+        assert mock_track_repository.get_list.call_args.kwargs["order"] == [(TrackOrderBy.RANDOM, SortOrder.DESC)]
+        call_tracks = mock_provider_library.create_playlist.call_args.kwargs["tracks"]
+        assert call_tracks == [track_a1, track_a2, track_b1]
+
     async def test__playlist_name__custom(
         self,
         mock_track_repository: mock.AsyncMock,
@@ -208,11 +233,11 @@ class TestPlaylistHistoryUseCase:
                 provider_library=mock_provider_library,
             )
 
-        kwargs = mock_track_repository.get_list.call_args.kwargs
-        assert kwargs["played_first_min"] == date(2025, 1, 1)
-        assert kwargs["played_first_max"] == date(2025, 12, 31)
-        assert kwargs["played_last_min"] == date(2026, 1, 1)
-        assert kwargs["played_last_max"] == date(2026, 12, 31)
+        track_filter = mock_track_repository.get_list.call_args.kwargs["track_filter"]
+        assert track_filter.played_first_min == date(2025, 1, 1)
+        assert track_filter.played_first_max == date(2025, 12, 31)
+        assert track_filter.played_last_min == date(2026, 1, 1)
+        assert track_filter.played_last_max == date(2026, 12, 31)
 
     async def test__sort_by_score__flat(
         self,
@@ -1,4 +1,6 @@
+import asyncio
 import uuid
+from datetime import timedelta
 from unittest import mock
 
 import pytest
@@ -14,8 +16,10 @@ from museflow.domain.enums import TrackSource
 from museflow.domain.exceptions import DiscoveryTrackNoNew
 from museflow.domain.exceptions import TasteProfileNotFoundException
 from museflow.domain.exceptions import TasteProfileStatusNotReadyException
+from museflow.domain.utils.text import generate_fingerprint
 from museflow.domain.value_objects.blacklist import UserBlacklist
 from museflow.domain.value_objects.taste import DiscoveryTasteStrategy
+from museflow.domain.value_objects.track import TrackResolution
 
 from tests.unit.factories.entities.blacklist import BlacklistedArtistFactory
 from tests.unit.factories.entities.blacklist import BlacklistedTrackFactory
@@ -28,43 +32,37 @@ from tests.unit.factories.value_objects.discovery import DiscoveryTasteStrategyF
 
 class TestDiscoverTasteUseCase:
     @pytest.fixture
-    def track_roundtrip(self, mock_track_repository: mock.AsyncMock) -> None:
-        """Simulates the bulk_upsert → get_list roundtrip using local state instead of call_args inspection."""
-        upserted: list[Track] = []
-
-        async def _bulk_upsert(tracks: list[Track], *, batch_size: int = 100) -> tuple[list[uuid.UUID], int]:
-            upserted.extend(tracks)
-            return ([], 0)
-
-        async def _get_list(
-            *_: object,
-            provider_ids: list[str] | None = None,
-            **__: object,
-        ) -> list[Track]:
-            if provider_ids is None:
-                return list(upserted)
-            return [t for t in upserted if t.get_provider_id(MusicProvider.SPOTIFY) in provider_ids]
-
-        mock_track_repository.bulk_upsert.side_effect = _bulk_upsert
-        mock_track_repository.get_list.side_effect = _get_list
+    def track_roundtrip(self, mock_track_repository: mock.AsyncMock) -> dict[str, uuid.UUID]:
+        """Simulates the bulk_ingest roundtrip: each ingested fingerprint gets a DB UUID, recorded locally."""
+        track_ids: dict[str, uuid.UUID] = {}
+
+        async def _bulk_ingest(tracks: list[Track]) -> tuple[dict[str, uuid.UUID], int]:
+            ingested = {t.fingerprint: track_ids.setdefault(t.fingerprint, uuid.uuid4()) for t in tracks}
+            return ingested, len(ingested)
+
+        mock_track_repository.bulk_ingest.side_effect = _bulk_ingest
+        mock_track_repository.get_list.return_value = []
+        return track_ids
 
     @pytest.fixture
     def use_case(
         self,
         mock_track_repository: mock.AsyncMock,
+        mock_track_resolution_repository: mock.AsyncMock,
         mock_taste_profile_repository: mock.AsyncMock,
         mock_blacklist_repository: mock.AsyncMock,
         mock_playlist_repository: mock.AsyncMock,
         mock_provider_library: mock.AsyncMock,
         mock_advisor: mock.AsyncMock,
         mock_reconciler: mock.Mock,
-        track_roundtrip: None,
+        track_roundtrip: dict[str, uuid.UUID],
     ) -> DiscoverTasteUseCase:
         mock_blacklist_repository.get_all.return_value = UserBlacklist()
         mock_playlist_repository.save.side_effect = lambda p: p
 
         return DiscoverTasteUseCase(
             track_repository=mock_track_repository,
+            track_resolution_repository=mock_track_resolution_repository,
             taste_profile_repository=mock_taste_profile_repository,
             blacklist_repository=mock_blacklist_repository,
             playlist_repository=mock_playlist_repository,
@@ -113,6 +111,246 @@ class TestDiscoverTasteUseCase:
         assert len(result.tracks) == 1
         assert len(result.reports) == 1
 
+    async def test__reconcile__local_catalog(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        suggested_known = TrackSuggestedFactory.build(score=0.9)
+        suggested_unknown = TrackSuggestedFactory.build(score=0.8)
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=[suggested_known, suggested_unknown],
+            search_queries=[],
+        )
+
+        catalog_track = TrackFactory.build()
+        provider_track = TrackFactory.build()
+        mock_track_repository.search_catalog.side_effect = None
+        mock_track_repository.search_catalog.return_value = [[catalog_track], []]
+        mock_provider_library.search_tracks.return_value = [provider_track]
+        mock_reconciler.reconcile.side_effect = lambda track_suggested, candidates: (candidates[0], 0.9)
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        result = await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(playlist_limit=2, advisor_limit=2, dry_run=True),
+        )
+
+        assert [track.fingerprint for track in result.tracks] == [
+            catalog_track.fingerprint,
+            provider_track.fingerprint,
+        ]
+        mock_track_repository.search_catalog.assert_called_once_with(
+            user_id=user.id,
+            fingerprints=[
+                generate_fingerprint(name=suggested.name, artist_names=suggested.artists)
+                for suggested in [suggested_known, suggested_unknown]
+            ],
+            provider=MusicProvider.SPOTIFY,
+            limit=10,
+        )
+        # Only the suggestion missing from the local catalog is searched on the provider.
+        mock_provider_library.search_tracks.assert_called_once_with(
+            track=suggested_unknown.name,
+            artists=suggested_unknown.artists,
+            page_size=10,
+            log_enabled=False,
+        )
+
+    async def test__reconcile__local_catalog_not_reconciled(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        suggested = TrackSuggestedFactory.build()
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=[suggested],
+            search_queries=[],
+        )
+
+        catalog_track = TrackFactory.build()
+        provider_track = TrackFactory.build()
+        mock_track_repository.search_catalog.side_effect = None
+        mock_track_repository.search_catalog.return_value = [[catalog_track]]
+        mock_provider_library.search_tracks.return_value = [provider_track]
+        # The catalog candidates are too far from the suggestion: it falls back to the provider search.
+        mock_reconciler.reconcile.side_effect = lambda track_suggested, candidates: (
+            (provider_track, 0.9) if candidates == [provider_track] else None
+        )
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        result = await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(playlist_limit=1, advisor_limit=1, dry_run=True),
+        )
+
+        assert [track.fingerprint for track in result.tracks] == [provider_track.fingerprint]
+        mock_provider_library.search_tracks.assert_called_once()
+
+    async def test__reconcile__resolution_cached(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_track_resolution_repository: mock.AsyncMock,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        suggested_resolved = TrackSuggestedFactory.build(score=0.9)
+        suggested_unresolved = TrackSuggestedFactory.build(score=0.8)
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=[suggested_resolved, suggested_unresolved],
+            search_queries=[],
+        )
+
+        fingerprint_resolved = generate_fingerprint(
+            name=suggested_resolved.name, artist_names=suggested_resolved.artists
+        )
+        fingerprint_unresolved = generate_fingerprint(
+            name=suggested_unresolved.name, artist_names=suggested_unresolved.artists
+        )
+        resolved_track = TrackFactory.build()
+        mock_track_resolution_repository.get_many.return_value = {
+            fingerprint_resolved: TrackResolution(key=fingerprint_resolved, match=(resolved_track, 0.95)),
+            # Resolved without match by a previous session.
+            fingerprint_unresolved: TrackResolution(key=fingerprint_unresolved),
+        }
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        result = await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(
+                playlist_limit=1,
+                advisor_limit=2,
+                dry_run=True,
+                resolution_ttl=timedelta(days=7),
+                resolution_negative_ttl=timedelta(hours=12),
+            ),
+        )
+
+        assert [track.fingerprint for track in result.tracks] == [resolved_track.fingerprint]
+        mock_track_resolution_repository.get_many.assert_called_once_with(
+            user_id=user.id,
+            keys=[fingerprint_resolved, fingerprint_unresolved],
+            provider=MusicProvider.SPOTIFY,
+            ttl=timedelta(days=7),
+            negative_ttl=timedelta(hours=12),
+        )
+        mock_track_repository.search_catalog.assert_not_called()
+        mock_provider_library.search_tracks.assert_not_called()
+        mock_reconciler.reconcile.assert_not_called()
+        mock_track_resolution_repository.bulk_upsert.assert_not_called()
+
+    async def test__reconcile__resolution_recorded(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_track_resolution_repository: mock.AsyncMock,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        suggested_matched = TrackSuggestedFactory.build(score=0.9)
+        suggested_unmatched = TrackSuggestedFactory.build(score=0.8)
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=[suggested_matched, suggested_unmatched],
+            search_queries=[],
+        )
+
+        provider_track = TrackFactory.build()
+        mock_provider_library.search_tracks.return_value = [provider_track]
+        mock_reconciler.reconcile.side_effect = lambda track_suggested, candidates: (
+            (provider_track, 0.9) if track_suggested == suggested_matched else None
+        )
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(playlist_limit=1, advisor_limit=2, dry_run=True),
+        )
+
+        mock_track_resolution_repository.bulk_upsert.assert_called_once_with(
+            resolutions=[
+                TrackResolution(
+                    key=generate_fingerprint(name=suggested_matched.name, artist_names=suggested_matched.artists),
+                    match=(provider_track, 0.9),
+                ),
+                TrackResolution(
+                    key=generate_fingerprint(name=suggested_unmatched.name, artist_names=suggested_unmatched.artists),
+                ),
+            ],
+            provider=MusicProvider.SPOTIFY,
+        )
+
+    async def test__reconcile__concurrent_searches(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        tracks_suggested = TrackSuggestedFactory.batch(size=6)
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=tracks_suggested,
+            search_queries=[],
+        )
+
+        provider_tracks = {track_suggested.name: TrackFactory.build() for track_suggested in tracks_suggested}
+        in_flight: list[int] = [0, 0]  # current, max
+
+        async def _search_tracks(track: str, **kwargs: object) -> list[Track]:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            # The first suggestions are the slowest to be searched.
+            await asyncio.sleep(0.01 / (list(provider_tracks).index(track) + 1))
+            in_flight[0] -= 1
+            return [provider_tracks[track]]
+
+        mock_provider_library.search_tracks.side_effect = _search_tracks
+        mock_reconciler.reconcile.side_effect = lambda track_suggested, candidates: (candidates[0], 0.9)
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        result = await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(
+                playlist_limit=6,
+                advisor_limit=6,
+                reconciler_concurrency=2,
+                dry_run=True,
+            ),
+        )
+
+        assert in_flight == [0, 2]
+        assert mock_provider_library.search_tracks.call_count == len(tracks_suggested)
+        # Whatever order the searches complete in, each suggestion is reconciled with its own candidates.
+        assert [call.kwargs for call in mock_reconciler.reconcile.call_args_list] == [
+            {"track_suggested": track_suggested, "candidates": [provider_tracks[track_suggested.name]]}
+            for track_suggested in tracks_suggested
+        ]
+        assert len(result.tracks) == len(tracks_suggested)
+
     async def test__profile_loaded_by_name(
         self,
         user: User,
@@ -292,6 +530,139 @@ class TestDiscoverTasteUseCase:
 
         assert len(result.tracks) == 1
 
+    async def test__search_queries_concurrent_with_reconciliation(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+
+        track_suggested = TrackSuggestedFactory.build(score=0.9)
+        search_queries = ["post-rock instrumental", "ambient drone", "math rock"]
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=[track_suggested],
+            search_queries=search_queries,
+        )
+
+        provider_tracks = {query: TrackFactory.build() for query in [track_suggested.name, *search_queries]}
+        in_flight: list[int] = [0, 0]  # current, max
+
+        async def _search_tracks(track: str, **kwargs: object) -> list[Track]:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            # The first queries are the slowest to be searched.
+            await asyncio.sleep(0.01 / (list(provider_tracks).index(track) + 1))
+            in_flight[0] -= 1
+            return [provider_tracks[track]]
+
+        mock_provider_library.search_tracks.side_effect = _search_tracks
+        mock_reconciler.reconcile.side_effect = lambda track_suggested, candidates: (candidates[0], 1.0)
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        result = await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(playlist_limit=4, advisor_limit=1, dry_run=True),
+        )
+
+        # The reconciliation search and the query searches are all in flight at once.
+        assert in_flight == [0, 4]
+        # Sorted by advisor score: the reconciled track first, then the query tracks in the order of the queries.
+        assert [track.fingerprint for track in result.tracks] == [
+            track.fingerprint for track in provider_tracks.values()
+        ]
+
+    async def test__search_queries_token_refresh(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+        mock_track_resolution_repository: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+    ) -> None:
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=TrackSuggestedFactory.batch(size=2),
+            search_queries=["post-rock instrumental", "ambient drone"],
+        )
+
+        # The repositories and the provider token refresh share the same database session: its calls must never
+        # overlap, whatever the provider searches in flight.
+        session_calls: list[int] = [0, 0]  # current, max
+
+        async def _session_call(result: object) -> object:
+            session_calls[0] += 1
+            session_calls[1] = max(session_calls)
+            await asyncio.sleep(0.001)
+            session_calls[0] -= 1
+            return result
+
+        refreshed = False
+
+        async def _search_tracks(track: str, **kwargs: object) -> list[Track]:
+            nonlocal refreshed
+            if not refreshed:
+                # The token of the first search has expired: it is refreshed through the database session.
+                refreshed = True
+                await _session_call(None)
+            await asyncio.sleep(0.001)
+            return [TrackFactory.build()]
+
+        async def _search_catalog(fingerprints: list[str], **kwargs: object) -> object:
+            return await _session_call([[] for _ in fingerprints])
+
+        async def _get_many(**kwargs: object) -> object:
+            return await _session_call({})
+
+        async def _bulk_upsert(**kwargs: object) -> object:
+            return await _session_call(None)
+
+        mock_track_resolution_repository.get_many.side_effect = _get_many
+        mock_track_resolution_repository.bulk_upsert.side_effect = _bulk_upsert
+        mock_track_repository.search_catalog.side_effect = _search_catalog
+        mock_provider_library.search_tracks.side_effect = _search_tracks
+        mock_reconciler.reconcile.side_effect = lambda track_suggested, candidates: (candidates[0], 1.0)
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+
+        result = await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(playlist_limit=4, advisor_limit=2, dry_run=True),
+        )
+
+        assert refreshed
+        assert session_calls == [0, 1]
+        assert mock_provider_library.search_tracks.call_count == 4
+        assert len(result.tracks) == 4
+
+    async def test__search_queries_error(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+    ) -> None:
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = DiscoveryTasteStrategyFactory.build(
+            recommended_tracks=TrackSuggestedFactory.batch(size=2),
+            search_queries=["post-rock instrumental"],
+        )
+        mock_provider_library.search_tracks.side_effect = ValueError("Boom")
+
+        # The search error is raised as is, not wrapped into an exception group.
+        with pytest.raises(ValueError, match="Boom"):
+            await use_case.create_suggestions_playlist(
+                user=user,
+                config=DiscoverTasteConfigInput(playlist_limit=1, advisor_limit=2, dry_run=True),
+            )
+
     async def test__dedup_removes_duplicate_fingerprint(
         self,
         user: User,
@@ -731,8 +1102,41 @@ class TestDiscoverTasteUseCase:
             config=DiscoverTasteConfigInput(playlist_limit=1, advisor_limit=5, dry_run=False),
         )
 
-        mock_track_repository.bulk_upsert.assert_awaited_once()
-        upserted_tracks = mock_track_repository.bulk_upsert.call_args[0][0]
+        mock_track_repository.bulk_ingest.assert_awaited_once()
+        upserted_tracks = mock_track_repository.bulk_ingest.call_args[0][0]
         assert len(upserted_tracks) == 1
         assert upserted_tracks[0].source == TrackSource.DISCOVERY
         assert upserted_tracks[0].played_count == 0
+
+    async def test__discovery_tracks_saved_with_db_ids(
+        self,
+        user: User,
+        use_case: DiscoverTasteUseCase,
+        track_roundtrip: dict[str, uuid.UUID],
+        mock_taste_profile_repository: mock.AsyncMock,
+        mock_advisor: mock.AsyncMock,
+        mock_provider_library: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_repository: mock.AsyncMock,
+        mock_reconciler: mock.Mock,
+        discovery_taste_strategy: DiscoveryTasteStrategy,
+    ) -> None:
+        """The playlist tracks carry the UUIDs returned by the ingest, without fetching the tracks back."""
+        mock_taste_profile_repository.get_latest.return_value = TasteProfileFactory.build(user_id=user.id)
+        mock_advisor.get_discovery_strategy.return_value = discovery_taste_strategy
+
+        reconciled_track = TrackFactory.build()
+        mock_provider_library.search_tracks.return_value = [reconciled_track]
+        mock_reconciler.reconcile.return_value = (reconciled_track, 0.9)
+        mock_track_repository.get_known_identifiers.return_value = mock.Mock(is_known=mock.Mock(return_value=False))
+        mock_provider_library.create_playlist.return_value = PlaylistFactory.build()
+
+        await use_case.create_suggestions_playlist(
+            user=user,
+            config=DiscoverTasteConfigInput(playlist_limit=1, advisor_limit=5, dry_run=False),
+        )
+
+        saved_playlist = mock_playlist_repository.save.call_args[0][0]
+        assert [t.id for t in saved_playlist.tracks] == [track_roundtrip[reconciled_track.fingerprint]]
+        assert saved_playlist.tracks[0].id != reconciled_track.id
+        mock_track_repository.get_list.assert_awaited_once()  # liked tracks only
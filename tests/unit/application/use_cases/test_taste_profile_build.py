@@ -8,6 +8,7 @@ import pytest
 from pytest_httpx import HTTPXMock
 
 from museflow.application.inputs.taste import BuildTasteProfileConfigInput
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.use_cases.taste_profile_build import BuildTasteProfileUseCase
 from museflow.domain.entities.taste import TasteProfileData
 from museflow.domain.entities.track import Track
@@ -260,9 +261,9 @@ class TestBuildTasteProfileUseCase:
 
         mock_track_repository.get_list.assert_called_once_with(
             user_id=user.id,
+            track_filter=TrackFilter(min_score=0),
             order=mock.ANY,
             limit=10,
-            min_score=0,
         )
 
     @pytest.mark.parametrize("tracks", [7], indirect=True)
@@ -1,10 +1,12 @@
 from unittest import mock
 
 from museflow.application.inputs.enrich import EnrichTracksConfigInput
+from museflow.application.inputs.track import TrackFilter
 from museflow.application.use_cases.tracks_enrich import EnrichTracksReport
 from museflow.application.use_cases.tracks_enrich import tracks_enrich
 from museflow.domain.enums import EnrichField
 from museflow.domain.enums import GenreTag
+from museflow.domain.enums import TrackField
 
 from tests.unit.factories.entities.track import TrackFactory
 from tests.unit.factories.entities.user import UserFactory
@@ -49,9 +51,10 @@ class TestTracksEnrichUseCase:
         )
 
         assert result == EnrichTracksReport(enriched_count=3, error_count=0)
-        mock_track_repository.bulk_update.assert_awaited_once()
+        mock_track_repository.bulk_patch.assert_awaited_once()
+        assert mock_track_repository.bulk_patch.call_args.kwargs["user_id"] == user.id
         mock_track_repository.get_list.assert_awaited_once_with(
-            user_id=user.id, missing_fields=frozenset(EnrichField), limit=None
+            user_id=user.id, track_filter=TrackFilter(missing_fields=frozenset(EnrichField)), limit=None
         )
 
     async def test__force__disables_unenriched_only_filter(
@@ -69,7 +72,9 @@ class TestTracksEnrichUseCase:
             mock_enricher,
         )
 
-        mock_track_repository.get_list.assert_awaited_once_with(user_id=user.id, missing_fields=None, limit=None)
+        mock_track_repository.get_list.assert_awaited_once_with(
+            user_id=user.id, track_filter=TrackFilter(), limit=None
+        )
 
     async def test__limit__forwarded_to_repository(
         self,
@@ -87,7 +92,7 @@ class TestTracksEnrichUseCase:
         )
 
         mock_track_repository.get_list.assert_awaited_once_with(
-            user_id=user.id, missing_fields=frozenset(EnrichField), limit=50
+            user_id=user.id, track_filter=TrackFilter(missing_fields=frozenset(EnrichField)), limit=50
         )
 
     async def test__batch_splitting__calls_enricher_once_per_batch(
@@ -157,15 +162,15 @@ class TestTracksEnrichUseCase:
             mock_enricher,
         )
 
-        call_args = mock_track_repository.bulk_update.call_args
-        tracks_arg = call_args[0][0]
-        fields_arg = call_args.kwargs["fields"]
-        assert fields_arg == frozenset(EnrichField)
-        assert len(tracks_arg) == 1
-        assert tracks_arg[0].genres == [GenreTag.HIP_HOP, GenreTag.RAP, GenreTag.AFRO_RAP]
-        assert tracks_arg[0].locale == "fr"
+        call_args = mock_track_repository.bulk_patch.call_args
+        rows_arg = call_args.kwargs["rows"]
+        assert call_args.kwargs["fields"] == frozenset([TrackField.GENRES, TrackField.MOODS, TrackField.LOCALE])
+        assert len(rows_arg) == 1
+        assert rows_arg[0][TrackField.ID] == track.id
+        assert rows_arg[0][TrackField.GENRES] == [GenreTag.HIP_HOP, GenreTag.RAP, GenreTag.AFRO_RAP]
+        assert rows_arg[0][TrackField.LOCALE] == "fr"
 
-    async def test__locale_only__only_locale_written_and_existing_genres_preserved(
+    async def test__locale_only__only_locale_written(
         self,
         mock_track_repository: mock.AsyncMock,
         mock_enricher: mock.AsyncMock,
@@ -182,12 +187,9 @@ class TestTracksEnrichUseCase:
             mock_enricher,
         )
 
-        call_args = mock_track_repository.bulk_update.call_args
-        tracks_arg = call_args[0][0]
-        fields_arg = call_args.kwargs["fields"]
-        assert fields_arg == frozenset({EnrichField.LOCALE})
-        assert tracks_arg[0].genres == [GenreTag.HIP_HOP]
-        assert tracks_arg[0].locale == "fr"
+        call_args = mock_track_repository.bulk_patch.call_args
+        assert call_args.kwargs["fields"] == frozenset({TrackField.LOCALE})
+        assert call_args.kwargs["rows"][0][TrackField.LOCALE] == "fr"
 
     async def test__locale_only__missing_fields_filter_uses_only_locale(
         self,
@@ -205,7 +207,7 @@ class TestTracksEnrichUseCase:
         )
 
         mock_track_repository.get_list.assert_awaited_once_with(
-            user_id=user.id, missing_fields=frozenset({EnrichField.LOCALE}), limit=None
+            user_id=user.id, track_filter=TrackFilter(missing_fields=frozenset({EnrichField.LOCALE})), limit=None
         )
 
     async def test__genre_only__locale_field_not_written(
@@ -227,9 +229,6 @@ class TestTracksEnrichUseCase:
             mock_enricher,
         )
 
-        call_args = mock_track_repository.bulk_update.call_args
-        tracks_arg = call_args[0][0]
-        fields_arg = call_args.kwargs["fields"]
-        assert fields_arg == frozenset({EnrichField.GENRE})
-        assert tracks_arg[0].genres == [GenreTag.HIP_HOP]
-        assert tracks_arg[0].locale == "en"  # unchanged
+        call_args = mock_track_repository.bulk_patch.call_args
+        assert call_args.kwargs["fields"] == frozenset({TrackField.GENRES})  # locale left unchanged
+        assert call_args.kwargs["rows"][0][TrackField.GENRES] == [GenreTag.HIP_HOP]
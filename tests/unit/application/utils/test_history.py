@@ -0,0 +1,135 @@
+from collections.abc import Generator
+from datetime import UTC
+from datetime import datetime
+
+from museflow.application.inputs.history import StreamingHistoryEntry
+from museflow.application.inputs.history import StreamingHistoryFileStats
+from museflow.application.inputs.history import StreamingHistoryTrackAggregate
+from museflow.application.utils.history import StreamingHistoryAggregator
+
+from tests.unit.factories.inputs.history import StreamingHistoryEntryFactory
+
+
+class TestStreamingHistoryAggregator:
+    def test__add(self) -> None:
+        aggregator = StreamingHistoryAggregator()
+        entries = [
+            StreamingHistoryEntryFactory.build(
+                provider_id="first",
+                name="Song",
+                artist="Artist",
+                album_name="Album",
+                played_at=datetime(2023, 1, 2, tzinfo=UTC),
+            ),
+            StreamingHistoryEntryFactory.build(
+                provider_id="second", name="Song", artist="Artist", played_at=datetime(2023, 1, 3, tzinfo=UTC)
+            ),
+            StreamingHistoryEntryFactory.build(
+                provider_id="third", name="Song", artist="Artist", played_at=datetime(2023, 1, 1, tzinfo=UTC)
+            ),
+            StreamingHistoryEntryFactory.build(
+                provider_id="fourth", name="Song", artist="Artist", played_at=datetime(2023, 1, 2, 12, tzinfo=UTC)
+            ),
+        ]
+
+        for entry in entries:
+            aggregator.add(entry)
+
+        assert aggregator.aggregates == {
+            "song|artist": StreamingHistoryTrackAggregate(
+                name="Song",
+                artist="Artist",
+                album_name="Album",
+                provider_id="first",
+                played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+                played_at_last=datetime(2023, 1, 3, tzinfo=UTC),
+                played_count=4,
+            )
+        }
+        assert aggregator.plays_total == 4
+
+    def test__consume__returns_stats(self) -> None:
+        def entries() -> Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats]:
+            yield StreamingHistoryEntryFactory.build(
+                name="Song A", artist="Artist", played_at=datetime(2023, 1, 2, tzinfo=UTC)
+            )
+            yield StreamingHistoryEntryFactory.build(
+                name="Song B", artist="Artist", played_at=datetime(2023, 1, 1, tzinfo=UTC)
+            )
+            return StreamingHistoryFileStats(items_read=3, items_skipped_short_play=1)
+
+        aggregator = StreamingHistoryAggregator()
+
+        stats = aggregator.consume(entries())
+
+        assert stats == StreamingHistoryFileStats(
+            items_read=3,
+            items_skipped_short_play=1,
+            played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+            played_at_last=datetime(2023, 1, 2, tzinfo=UTC),
+        )
+        assert set(aggregator.aggregates) == {"song a|artist", "song b|artist"}
+
+    def test__consume__empty(self) -> None:
+        def entries() -> Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats]:
+            yield from ()
+            return StreamingHistoryFileStats(items_read=1, items_skipped_no_timestamp=1)
+
+        stats = StreamingHistoryAggregator().consume(entries())
+
+        assert stats == StreamingHistoryFileStats(items_read=1, items_skipped_no_timestamp=1)
+
+    def test__consume__imported_ranges__skipped(self) -> None:
+        def entries() -> Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats]:
+            for day in (1, 5, 10, 15, 20):
+                yield StreamingHistoryEntryFactory.build(
+                    name=f"Song {day}", artist="Artist", played_at=datetime(2023, 1, day, tzinfo=UTC)
+                )
+            return StreamingHistoryFileStats(items_read=5)
+
+        aggregator = StreamingHistoryAggregator(
+            imported_ranges=[
+                (datetime(2023, 1, 14, tzinfo=UTC), datetime(2023, 1, 16, tzinfo=UTC)),
+                (datetime(2023, 1, 4, tzinfo=UTC), datetime(2023, 1, 6, tzinfo=UTC)),
+                (datetime(2023, 1, 5, tzinfo=UTC), datetime(2023, 1, 10, tzinfo=UTC)),
+            ]
+        )
+
+        stats = aggregator.consume(entries())
+
+        assert stats == StreamingHistoryFileStats(
+            items_read=5,
+            items_skipped_already_imported=3,
+            played_at_first=datetime(2023, 1, 1, tzinfo=UTC),
+            played_at_last=datetime(2023, 1, 20, tzinfo=UTC),
+        )
+        assert set(aggregator.aggregates) == {"song 1|artist", "song 20|artist"}
+
+    def test__merge(self) -> None:
+        aggregator = StreamingHistoryAggregator()
+        aggregator.add(
+            StreamingHistoryEntryFactory.build(
+                provider_id="a", name="Song A", artist="Artist", played_at=datetime(2023, 1, 2, tzinfo=UTC)
+            )
+        )
+        other = StreamingHistoryAggregator()
+        other.add(
+            StreamingHistoryEntryFactory.build(
+                provider_id="a2", name="Song A", artist="Artist", played_at=datetime(2023, 1, 1, tzinfo=UTC)
+            )
+        )
+        other.add(
+            StreamingHistoryEntryFactory.build(
+                provider_id="b", name="Song B", artist="Artist", played_at=datetime(2023, 1, 5, tzinfo=UTC)
+            )
+        )
+
+        aggregator.merge(other.aggregates)
+
+        assert set(aggregator.aggregates) == {"song a|artist", "song b|artist"}
+        assert aggregator.aggregates["song a|artist"].provider_id == "a"
+        assert aggregator.aggregates["song a|artist"].played_count == 2
+        assert aggregator.aggregates["song a|artist"].played_at_first == datetime(2023, 1, 1, tzinfo=UTC)
+        assert aggregator.aggregates["song a|artist"].played_at_last == datetime(2023, 1, 2, tzinfo=UTC)
+        assert aggregator.aggregates["song b|artist"] is other.aggregates["song b|artist"]
+        assert aggregator.plays_total == 3
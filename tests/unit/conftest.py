@@ -1,10 +1,13 @@
 from collections.abc import AsyncGenerator
+from datetime import UTC
+from datetime import datetime
 from unittest import mock
 
 from pydantic import HttpUrl
 
 import pytest
 
+from museflow.application.inputs.history import StreamingHistoryFileInfo
 from museflow.application.inputs.history import StreamingHistoryFileStats
 from museflow.application.ports.advisors.agent import AdvisorPort
 from museflow.application.ports.enrichers.track import TrackEnricherPort
@@ -13,7 +16,9 @@ from museflow.application.ports.providers.library import ProviderLibraryPort
 from museflow.application.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.application.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.application.ports.repositories.blacklist import BlacklistRepository
+from museflow.application.ports.repositories.history import HistoryManifestRepository
 from museflow.application.ports.repositories.playlist import PlaylistRepository
+from museflow.application.ports.repositories.resolution import TrackResolutionRepository
 from museflow.application.ports.repositories.taste import TasteProfileRepository
 from museflow.application.ports.repositories.track import TrackRepository
 from museflow.application.ports.repositories.users import UserRepository
@@ -80,7 +85,10 @@ def mock_auth_token_repository() -> mock.AsyncMock:
 
 @pytest.fixture
 def mock_track_repository() -> mock.AsyncMock:
-    return mock.AsyncMock(spec=TrackRepository)
+    repository = mock.AsyncMock(spec=TrackRepository)
+    # An empty local catalog, so that the suggestions are reconciled from the provider searches.
+    repository.search_catalog.side_effect = lambda user_id, fingerprints, provider, limit: [[] for _ in fingerprints]
+    return repository
 
 
 @pytest.fixture
@@ -98,6 +106,20 @@ def mock_playlist_repository() -> mock.AsyncMock:
     return mock.AsyncMock(spec=PlaylistRepository)
 
 
+@pytest.fixture
+def mock_history_manifest_repository() -> mock.AsyncMock:
+    repository = mock.AsyncMock(spec=HistoryManifestRepository)
+    repository.get_list.return_value = []
+    return repository
+
+
+@pytest.fixture
+def mock_track_resolution_repository() -> mock.AsyncMock:
+    repository = mock.AsyncMock(spec=TrackResolutionRepository)
+    repository.get_many.return_value = {}
+    return repository
+
+
 # --- Entity Mocks ---
 
 
@@ -162,7 +184,18 @@ def mock_provider_library() -> mock.AsyncMock:
 @pytest.fixture
 def mock_streaming_history() -> mock.AsyncMock:
     port = mock.AsyncMock(spec=StreamingHistoryPort)
-    port.parse_file.return_value = ([], StreamingHistoryFileStats())
+    port.aggregate_files.return_value.__aiter__.return_value = [({}, StreamingHistoryFileStats())]
+    port.aggregate_files.return_value.aclose = mock.AsyncMock()
+    port.list_files.side_effect = lambda path: sorted(path.glob("*.json"))
+    port.describe_files.side_effect = lambda paths: [
+        StreamingHistoryFileInfo(
+            name=path.name,
+            size=0,
+            modified_at=datetime(2024, 1, 1, tzinfo=UTC),
+            content_hash=f"hash-{path.name}",
+        )
+        for path in paths
+    ]
     return port
 
 
@@ -176,7 +209,13 @@ def mock_advisor() -> mock.AsyncMock:
 
 @pytest.fixture
 def mock_reconciler() -> mock.Mock:
-    return mock.Mock(spec=Reconciler)
+    reconciler = mock.Mock(spec=Reconciler)
+    # The batch mode answers suggestion by suggestion, as configured on the reconcile mock.
+    reconciler.reconcile_many.side_effect = lambda suggestions, candidates_by_suggestion: [
+        reconciler.reconcile(track_suggested=track_suggested, candidates=candidates)
+        for track_suggested, candidates in zip(suggestions, candidates_by_suggestion, strict=True)
+    ]
+    return reconciler
 
 
 @pytest.fixture
@@ -0,0 +1,48 @@
+from museflow.domain.services.fingerprint import FingerprintCacheInfo
+from museflow.domain.services.fingerprint import FingerprintService
+from museflow.domain.utils.text import generate_fingerprint
+
+
+class TestFingerprintService:
+    def test__generate_fingerprint__same_as_uncached(self) -> None:
+        service = FingerprintService()
+
+        fingerprint = service.generate_fingerprint(name="Señorita (feat. X) ", primary_artist="Beyoncé")
+
+        assert fingerprint == generate_fingerprint(name="Señorita (feat. X) ", artist_names=["Beyoncé"])
+        assert fingerprint == "senorita|beyonce"
+
+    def test__generate_fingerprint__no_artist(self) -> None:
+        service = FingerprintService()
+
+        assert service.generate_fingerprint(name="Song", primary_artist=None) == "song|unknown"
+        # An empty artist name is not a missing artist.
+        assert service.generate_fingerprint(name="Song", primary_artist="") == "song|"
+
+    def test__generate_fingerprint__memoized(self) -> None:
+        service = FingerprintService()
+
+        for _ in range(3):
+            service.generate_fingerprint(name="Song", primary_artist="Artist")
+
+        cache_info = service.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    def test__generate_fingerprint__bounded(self) -> None:
+        service = FingerprintService(maxsize=2)
+
+        for i in range(5):
+            service.generate_fingerprint(name=f"Song {i}", primary_artist="Artist")
+
+        assert service.cache_info() == FingerprintCacheInfo(hits=0, misses=5, currsize=2, maxsize=2)
+
+    def test__generate_fingerprints(self) -> None:
+        service = FingerprintService()
+
+        fingerprints = service.generate_fingerprints(
+            [("Song A", "Artist"), ("Song B", None), ("Song A", "Artist")],
+        )
+
+        assert fingerprints == ["song a|artist", "song b|unknown", "song a|artist"]
+        assert service.cache_info().misses == 2
@@ -1,10 +1,27 @@
 import pytest
+from hypothesis import HealthCheck
+from hypothesis import given
+from hypothesis import settings
+from hypothesis import strategies as st
 
+from museflow.domain.services import reconciler as reconciler_module
 from museflow.domain.services.reconciler import Reconciler
+from museflow.domain.utils.text import normalize_text
 
 from tests.unit.factories.entities.track import TrackFactory
 from tests.unit.factories.entities.track import TrackSuggestedFactory
 
+NAMES = [
+    "Bohemian Rhapsody",
+    "Bohemian Rhapsody - Remastered 2011",
+    "Bohemian Rhapsody (Live Aid)",
+    "Rhapsody in Blue",
+    "Strobe",
+    "Strobe - Radio Edit",
+    "Under Pressure",
+]
+ARTISTS = ["Queen", "QUEEN", "Queen & David Bowie", "David Bowie", "deadmau5", "Deadmau5 feat. Someone", "Someone"]
+
 
 @pytest.mark.parametrize("reconciler", [{"match_threshold": 80.0, "score_minimum": 60.0}], indirect=True)
 class TestReconciler:
@@ -59,3 +76,65 @@ class TestReconciler:
         track_reconciled, score = result
         assert track_reconciled is close_match
         assert 0.0 < score <= 1.0
+
+    def test__reconcile_many(self, reconciler: Reconciler) -> None:
+        suggestions = [
+            TrackSuggestedFactory.build(name="Bohemian Rhapsody", artists=["Queen"]),
+            TrackSuggestedFactory.build(name="Strobe", artists=["deadmau5"]),
+            TrackSuggestedFactory.build(name="Teardrop", artists=["Massive Attack"]),
+        ]
+        queen_match = TrackFactory.build(name="Bohemian Rhapsody - Remastered 2011", artists=["Queen"])
+        deadmau5_match = TrackFactory.build(name="Strobe - Radio Edit", artists=["deadmau5", "Someone"])
+        candidates_by_suggestion = [
+            [TrackFactory.build(name="Under Pressure", artists=["Queen", "David Bowie"]), queen_match],
+            [deadmau5_match],
+            [],
+        ]
+
+        results = reconciler.reconcile_many(suggestions, candidates_by_suggestion)
+
+        assert [result[0] if result else None for result in results] == [queen_match, deadmau5_match, None]
+        assert results == [
+            reconciler.reconcile(track_suggested=track_suggested, candidates=candidates)
+            for track_suggested, candidates in zip(suggestions, candidates_by_suggestion, strict=True)
+        ]
+
+    def test__reconcile_many__numpy_missing(self, reconciler: Reconciler, monkeypatch: pytest.MonkeyPatch) -> None:
+        suggestions = [TrackSuggestedFactory.build(name="Bohemian Rhapsody", artists=["Queen"])]
+        candidates_by_suggestion = [
+            [
+                TrackFactory.build(name="Bohemian Rhapsody (Karaoke Version)", artists=["Unknown Artist"]),
+                TrackFactory.build(name="Bohemian Rhapsody", artists=["Queen"]),
+            ]
+        ]
+        expected = reconciler.reconcile_many(suggestions, candidates_by_suggestion)
+
+        monkeypatch.setattr(reconciler_module, "np", None)
+        assert reconciler.reconcile_many(suggestions, candidates_by_suggestion) == expected
+
+    @settings(deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @given(
+        name=st.sampled_from(NAMES),
+        artists=st.lists(st.sampled_from(ARTISTS), min_size=1, max_size=3),
+        candidates=st.lists(
+            st.tuples(st.sampled_from(NAMES), st.lists(st.sampled_from(ARTISTS), min_size=1, max_size=3)),
+            max_size=6,
+        ),
+    )
+    def test__score_batch__same_as_pair_by_pair(
+        self,
+        reconciler: Reconciler,
+        name: str,
+        artists: list[str],
+        candidates: list[tuple[str, list[str]]],
+    ) -> None:
+        pytest.importorskip("numpy")
+        track_suggested = TrackSuggestedFactory.build(name=name, artists=artists)
+        tracks = [
+            TrackFactory.build(name=candidate_name, artists=candidate_artists)
+            for candidate_name, candidate_artists in candidates
+        ]
+
+        assert reconciler._score_batch([track_suggested], [tracks], normalize_text) == [
+            reconciler._score_candidates(track_suggested, tracks, normalize_text)
+        ]
@@ -1,8 +1,64 @@
 import pytest
+from hypothesis import example
+from hypothesis import given
+from hypothesis import strategies as st
 
 from museflow.domain.utils.text import normalize_text
 from museflow.domain.utils.text import unidecode_lower_text
 
+from tests.unit.utils.text import reference_normalize_text
+
+# Fragments of real-life names, so the generated texts often hit the noise patterns and their edge cases.
+NAME_FRAGMENTS = st.sampled_from(
+    [
+        "Song",
+        " ",
+        "  ",
+        "\t",
+        "\n",
+        "\x1c",
+        "-",
+        " - ",
+        "(",
+        ")",
+        "[",
+        "]",
+        ".",
+        "'",
+        "_",
+        "&",
+        "!",
+        "feat",
+        "feat.",
+        "Feat.",
+        "ft",
+        "ft.",
+        "remaster",
+        "Remastered 2025",
+        "live",
+        "LIVE",
+        "edit",
+        "Radio Edit",
+        "version",
+        "mono",
+        "stereo",
+        "é",
+        "ß",
+        "ñ",
+        "Æ",
+        "ø",
+        "ł",
+        "日本",
+        "Ωμέγα",
+        "😀",
+        "½",
+        "²",
+        "\u00a0",
+        "\u2013",
+    ]
+)
+NAMES = st.lists(NAME_FRAGMENTS | st.text(max_size=3), max_size=12).map("".join)
+
 
 class TestUnidecodeLower:
     @pytest.mark.parametrize(
@@ -41,3 +97,25 @@ class TestNormalizeText:
     )
     def test__nominal(self, text: str, expected_str: str) -> None:
         assert normalize_text(text) == expected_str
+
+
+class TestNormalizeTextEquivalence:
+    """The stored fingerprints stay valid only if the output is the exact same as the reference implementation."""
+
+    @given(text=NAMES)
+    @example(text="Song (a) b (feat. X) - c [Live]")
+    @example(text="Song - (feat. X")
+    @example(text="Song\x1c-\x1cLive")
+    def test__names(self, text: str) -> None:
+        assert normalize_text(text) == reference_normalize_text(text)
+
+    @given(text=st.text())
+    def test__any_text(self, text: str) -> None:
+        assert normalize_text(text) == reference_normalize_text(text)
+
+    def test__every_character_of_latin_and_symbol_blocks(self) -> None:
+        characters = [chr(code) for code in range(0x3000)]
+
+        assert [normalize_text(f"a{char}b") for char in characters] == [
+            reference_normalize_text(f"a{char}b") for char in characters
+        ]
@@ -2,6 +2,8 @@ from polyfactory import Use
 from polyfactory.factories.dataclass_factory import DataclassFactory
 
 from museflow.domain.enums import GenreTag
+from museflow.domain.value_objects.track import ArtistAggregate
+from museflow.domain.value_objects.track import TagAggregate
 from museflow.domain.value_objects.track import TrackEnrichment
 
 
@@ -12,3 +14,13 @@ class TrackEnrichmentFactory(DataclassFactory[TrackEnrichment]):
     genres = Use(lambda: [GenreTag.FOLK, GenreTag.INDIE_FOLK])
     moods = Use(lambda: ["chill"])
     locale = None
+
+
+class ArtistAggregateFactory(DataclassFactory[ArtistAggregate]):
+    __model__ = ArtistAggregate
+    __set_as_default_factory_for_type__ = True
+
+
+class TagAggregateFactory(DataclassFactory[TagAggregate]):
+    __model__ = TagAggregate
+    __set_as_default_factory_for_type__ = True
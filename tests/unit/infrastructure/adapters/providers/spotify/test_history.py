@@ -1,3 +1,10 @@
+import hashlib
+import inspect
+import time
+import zipfile
+from collections.abc import Generator
+from collections.abc import Iterator
+from contextlib import aclosing
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
@@ -5,7 +12,12 @@ from typing import Final
 
 import pytest
 
+from museflow.application.inputs.history import StreamingHistoryEntry
+from museflow.application.inputs.history import StreamingHistoryFileStats
+from museflow.domain.exceptions import StreamingHistoryDirectoryNotFound
 from museflow.domain.exceptions import StreamingHistoryInvalidFormat
+from museflow.infrastructure.adapters.providers.spotify import history as history_module
+from museflow.infrastructure.adapters.providers.spotify.history import HistoryJsonBackend
 from museflow.infrastructure.adapters.providers.spotify.history import SpotifyStreamingHistoryAdapter
 
 from tests import ASSETS_DIR
@@ -13,14 +25,59 @@ from tests import ASSETS_DIR
 HISTORY_SCENARIOS: Final[Path] = ASSETS_DIR / "history" / "spotify" / "scenarios"
 
 
+def drain(
+    entries: Generator[StreamingHistoryEntry, None, StreamingHistoryFileStats],
+) -> tuple[list[StreamingHistoryEntry], StreamingHistoryFileStats]:
+    items: list[StreamingHistoryEntry] = []
+    while True:
+        try:
+            items.append(next(entries))
+        except StopIteration as stop:
+            return items, stop.value
+
+
 class TestSpotifyStreamingHistoryAdapter:
+    @pytest.fixture(params=list(HistoryJsonBackend), ids=str)
+    def adapter(self, request: pytest.FixtureRequest) -> SpotifyStreamingHistoryAdapter:
+        """Every backend must parse the files exactly the same way."""
+        if request.param == HistoryJsonBackend.ORJSON:
+            pytest.importorskip("orjson")
+        return SpotifyStreamingHistoryAdapter(json_backend=request.param)
+
     @pytest.fixture
-    def adapter(self) -> SpotifyStreamingHistoryAdapter:
-        return SpotifyStreamingHistoryAdapter()
+    def archive_path(self, tmp_path: Path) -> Path:
+        """Mimics the layout of the Spotify export archive."""
+        path = tmp_path / "my_spotify_data.zip"
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.mkdir("Spotify Extended Streaming History")
+            for name in ["duplicate_track_ids.json", "valid_single_track.json"]:
+                archive.write(HISTORY_SCENARIOS / name, f"Spotify Extended Streaming History/{name}")
+            archive.writestr("Spotify Extended Streaming History/ReadMeFirst.pdf", b"")
+        return path
+
+    async def test__list_files__directory(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+        (tmp_path / "b.json").write_text("[]")
+        (tmp_path / "a.json").write_text("[]")
+        (tmp_path / "notes.txt").write_text("")
+
+        assert await adapter.list_files(tmp_path) == [tmp_path / "a.json", tmp_path / "b.json"]
 
-    async def test__parse_file__nominal(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
-        entries, stats = await adapter.parse_file(
-            path=HISTORY_SCENARIOS / "valid_single_track.json", min_ms_played=30_000
+    async def test__list_files__archive(self, adapter: SpotifyStreamingHistoryAdapter, archive_path: Path) -> None:
+        assert await adapter.list_files(archive_path) == [
+            archive_path / "Spotify Extended Streaming History" / "duplicate_track_ids.json",
+            archive_path / "Spotify Extended Streaming History" / "valid_single_track.json",
+        ]
+
+    async def test__list_files__not_an_archive(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+        path = tmp_path / "history.json"
+        path.write_text("[]")
+
+        with pytest.raises(StreamingHistoryDirectoryNotFound, match="Neither a directory nor a ZIP archive"):
+            await adapter.list_files(path)
+
+    def test__iter_entries__nominal(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "valid_single_track.json", min_ms_played=30_000)
         )
 
         assert len(entries) == 1
@@ -33,38 +90,46 @@ class TestSpotifyStreamingHistoryAdapter:
         assert stats.items_skipped_short_play == 0
         assert stats.items_skipped_no_track_id == 0
 
-    async def test__parse_file__filter__no_timestamp(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
-        entries, stats = await adapter.parse_file(path=HISTORY_SCENARIOS / "skips_no_timestamp.json", min_ms_played=0)
+    def test__iter_entries__filter__no_timestamp(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "skips_no_timestamp.json", min_ms_played=0)
+        )
 
         assert len(entries) == 1
         assert stats.items_read == 3
         assert stats.items_skipped_no_timestamp == 2
 
-    async def test__parse_file__filter__short_play(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
-        entries, stats = await adapter.parse_file(
-            path=HISTORY_SCENARIOS / "skips_short_play.json", min_ms_played=30_000
+    def test__iter_entries__filter__short_play(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "skips_short_play.json", min_ms_played=30_000)
         )
 
         assert len(entries) == 1
         assert stats.items_read == 3
         assert stats.items_skipped_short_play == 2
 
-    async def test__parse_file__filter__no_track_id(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
-        entries, stats = await adapter.parse_file(path=HISTORY_SCENARIOS / "skips_no_track_id.json", min_ms_played=0)
+    def test__iter_entries__filter__no_track_id(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "skips_no_track_id.json", min_ms_played=0)
+        )
 
         assert len(entries) == 1
         assert stats.items_read == 3
         assert stats.items_skipped_no_track_id == 2
 
-    async def test__parse_file__filter__non_track_uri(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
-        entries, stats = await adapter.parse_file(path=HISTORY_SCENARIOS / "skips_invalid_uri.json", min_ms_played=0)
+    def test__iter_entries__filter__non_track_uri(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "skips_invalid_uri.json", min_ms_played=0)
+        )
 
         assert len(entries) == 1
         assert entries[0].provider_id == "real_track_id"
         assert stats.items_skipped_no_track_id == 2
 
-    async def test__parse_file__duplicate_tracks_all_kept(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
-        entries, stats = await adapter.parse_file(path=HISTORY_SCENARIOS / "duplicate_track_ids.json", min_ms_played=0)
+    def test__iter_entries__duplicate_tracks_all_kept(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "duplicate_track_ids.json", min_ms_played=0)
+        )
 
         assert len(entries) == 3
         assert all(entry.provider_id == "dup1" for entry in entries)
@@ -75,9 +140,223 @@ class TestSpotifyStreamingHistoryAdapter:
         }
         assert stats.items_read == 3
 
-    async def test__parse_file__invalid_json(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+    def test__iter_entries__archive_member(
+        self,
+        adapter: SpotifyStreamingHistoryAdapter,
+        archive_path: Path,
+    ) -> None:
+        path = archive_path / "Spotify Extended Streaming History" / "duplicate_track_ids.json"
+
+        entries, stats = drain(adapter.iter_entries(path=path, min_ms_played=0))
+
+        assert (
+            entries
+            == drain(adapter.iter_entries(path=HISTORY_SCENARIOS / "duplicate_track_ids.json", min_ms_played=0))[0]
+        )
+        assert stats.items_read == 3
+
+    def test__iter_entries__empty_file(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+        path = tmp_path / "history.json"
+        path.write_text("")
+
+        with pytest.raises(StreamingHistoryInvalidFormat):
+            drain(adapter.iter_entries(path=path, min_ms_played=0))
+
+    def test__iter_entries__not_an_array(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+        path = tmp_path / "history.json"
+        path.write_text('{"plays": [{"ts": "2023-01-01T10:00:00Z"}]}')
+
+        entries, stats = drain(adapter.iter_entries(path=path, min_ms_played=0))
+
+        assert entries == []
+        assert stats.items_read == 0
+
+    def test__iter_entries__lazy(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        entries = adapter.iter_entries(path=HISTORY_SCENARIOS / "duplicate_track_ids.json", min_ms_played=0)
+
+        first_entry = next(entries)
+
+        assert inspect.isgenerator(entries)
+        assert first_entry.played_at == datetime(2023, 1, 2, 10, 0, 0, tzinfo=UTC)
+
+    def test__iter_entries__invalid_json(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+        path = tmp_path / "history.json"
+        path.write_text("{invalid json")
+
+        with pytest.raises(StreamingHistoryInvalidFormat):
+            drain(adapter.iter_entries(path=path, min_ms_played=0))
+
+    async def test__aggregate_files__nominal(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        results = [
+            result
+            async for result in adapter.aggregate_files(
+                paths=[HISTORY_SCENARIOS / "duplicate_track_ids.json", HISTORY_SCENARIOS / "valid_single_track.json"],
+                min_ms_played=0,
+            )
+        ]
+
+        assert len(results) == 2
+
+        aggregates, stats = results[0]
+        assert stats.items_read == 3
+        assert len(aggregates) == 1
+        aggregate = next(iter(aggregates.values()))
+        assert aggregate.provider_id == "dup1"
+        assert aggregate.played_count == 3
+        assert aggregate.played_at_first == datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
+        assert aggregate.played_at_last == datetime(2023, 1, 3, 10, 0, 0, tzinfo=UTC)
+
+        aggregates, stats = results[1]
+        assert stats.items_read == 1
+        assert list(aggregates) == ["song name|artist name"]
+
+    async def test__aggregate_files__imported_ranges(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        imported_ranges = [(datetime(2023, 1, 2, tzinfo=UTC), datetime(2023, 1, 3, 10, 0, 0, tzinfo=UTC))]
+
+        [(aggregates, stats)] = [
+            result
+            async for result in adapter.aggregate_files(
+                paths=[HISTORY_SCENARIOS / "duplicate_track_ids.json"],
+                min_ms_played=0,
+                imported_ranges=imported_ranges,
+            )
+        ]
+
+        assert stats.items_skipped_already_imported == 2
+        assert stats.played_at_first == datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
+        assert stats.played_at_last == datetime(2023, 1, 3, 10, 0, 0, tzinfo=UTC)
+        assert next(iter(aggregates.values())).played_count == 1
+
+    async def test__aggregate_files__jobs__process_pool(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        paths = [HISTORY_SCENARIOS / "duplicate_track_ids.json", HISTORY_SCENARIOS / "valid_single_track.json"]
+
+        results = [result async for result in adapter.aggregate_files(paths=paths, min_ms_played=0, jobs=2)]
+
+        assert results == [result async for result in adapter.aggregate_files(paths=paths, min_ms_played=0, jobs=1)]
+
+    async def test__aggregate_files__jobs__archive(
+        self,
+        adapter: SpotifyStreamingHistoryAdapter,
+        archive_path: Path,
+    ) -> None:
+        paths = await adapter.list_files(archive_path)
+
+        results = [result async for result in adapter.aggregate_files(paths=paths, min_ms_played=0, jobs=2)]
+
+        assert results == [
+            result
+            async for result in adapter.aggregate_files(
+                paths=[HISTORY_SCENARIOS / "duplicate_track_ids.json", HISTORY_SCENARIOS / "valid_single_track.json"],
+                min_ms_played=0,
+            )
+        ]
+
+    async def test__aggregate_files__jobs__closed_early(self, adapter: SpotifyStreamingHistoryAdapter) -> None:
+        paths = [
+            HISTORY_SCENARIOS / "duplicate_track_ids.json",
+            HISTORY_SCENARIOS / "valid_single_track.json",
+            HISTORY_SCENARIOS / "valid_single_track.json",
+        ]
+
+        async with aclosing(adapter.aggregate_files(paths=paths, min_ms_played=0, jobs=2)) as results:
+            aggregates, stats = await anext(results)
+
+        assert stats.items_read == 3
+        assert len(aggregates) == 1
+
+    async def test__aggregate_files__jobs__invalid_json(
+        self,
+        adapter: SpotifyStreamingHistoryAdapter,
+        tmp_path: Path,
+    ) -> None:
         path = tmp_path / "history.json"
         path.write_text("{invalid json")
 
         with pytest.raises(StreamingHistoryInvalidFormat):
-            await adapter.parse_file(path=path, min_ms_played=0)
+            async for _ in adapter.aggregate_files(
+                paths=[HISTORY_SCENARIOS / "valid_single_track.json", path], min_ms_played=0, jobs=2
+            ):
+                pass
+
+    async def test__describe_files(self, adapter: SpotifyStreamingHistoryAdapter, tmp_path: Path) -> None:
+        path = tmp_path / "history.json"
+        path.write_text("[]")
+
+        [info] = await adapter.describe_files([path])
+
+        assert info.name == "history.json"
+        assert info.size == 2
+        assert info.modified_at.tzinfo == UTC
+        assert info.content_hash == hashlib.sha256(b"[]").hexdigest()
+
+    async def test__describe_files__archive_member(
+        self,
+        adapter: SpotifyStreamingHistoryAdapter,
+        archive_path: Path,
+    ) -> None:
+        path = HISTORY_SCENARIOS / "valid_single_track.json"
+
+        [info] = await adapter.describe_files([archive_path / "Spotify Extended Streaming History" / path.name])
+
+        assert info.name == "Spotify Extended Streaming History/valid_single_track.json"
+        assert info.size == path.stat().st_size
+        assert info.modified_at.tzinfo == UTC
+        # Same hash as the extracted file.
+        assert info.content_hash == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    @pytest.fixture
+    def local_timezone(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    async def test__describe_files__archive_members_same_name(
+        self,
+        adapter: SpotifyStreamingHistoryAdapter,
+        tmp_path: Path,
+        local_timezone: None,
+    ) -> None:
+        archive_path = tmp_path / "my_spotify_data.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr(zipfile.ZipInfo("2023/history.json", date_time=(2023, 6, 1, 12, 30, 0)), b"[]")
+            archive.writestr(zipfile.ZipInfo("2024/history.json", date_time=(2024, 6, 1, 12, 30, 0)), b"[ ]")
+
+        infos = await adapter.describe_files([archive_path / "2023/history.json", archive_path / "2024/history.json"])
+
+        assert [info.name for info in infos] == ["2023/history.json", "2024/history.json"]
+        # The ZIP timestamps are local times (EDT here).
+        assert [info.modified_at for info in infos] == [
+            datetime(2023, 6, 1, 16, 30, tzinfo=UTC),
+            datetime(2024, 6, 1, 16, 30, tzinfo=UTC),
+        ]
+
+
+class TestSpotifyStreamingHistoryAdapterJsonBackend:
+    def test__default__orjson(self) -> None:
+        pytest.importorskip("orjson")
+        assert SpotifyStreamingHistoryAdapter._select_json_backend(size=1024) == HistoryJsonBackend.ORJSON
+
+    def test__default__oversized__ijson(self) -> None:
+        size = SpotifyStreamingHistoryAdapter.FULL_LOAD_MAX_SIZE + 1
+        assert SpotifyStreamingHistoryAdapter._select_json_backend(size=size) == HistoryJsonBackend.IJSON
+
+    def test__default__orjson_missing__ijson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(history_module, "orjson", None)
+        assert SpotifyStreamingHistoryAdapter._select_json_backend(size=1024) == HistoryJsonBackend.IJSON
+
+    def test__forced__orjson_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(history_module, "orjson", None)
+        with pytest.raises(ValueError, match="orjson"):
+            SpotifyStreamingHistoryAdapter(json_backend=HistoryJsonBackend.ORJSON)
+
+    def test__default__iter_entries(self) -> None:
+        adapter = SpotifyStreamingHistoryAdapter()
+
+        entries, stats = drain(
+            adapter.iter_entries(path=HISTORY_SCENARIOS / "duplicate_track_ids.json", min_ms_played=0)
+        )
+
+        assert len(entries) == 3
+        assert stats.items_read == 3
@@ -1,7 +1,12 @@
+import uuid
+
 import pytest
 
+from museflow.domain.enums import MusicProvider
 from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_token_payload
+from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_tracks
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyToken
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrack
 
 
 class TestToDomainTokenPayload:
@@ -15,3 +20,36 @@ class TestToDomainTokenPayload:
 
         with pytest.raises(ValueError, match="Refresh token is missing from both response and existing state."):
             to_domain_token_payload(spotify_token)
+
+
+class TestToDomainTracks:
+    @staticmethod
+    def build_spotify_track(id: str, name: str, artists: list[str]) -> SpotifyTrack:
+        return SpotifyTrack.model_validate(
+            {
+                "id": id,
+                "name": name,
+                "href": f"https://api.spotify.com/v1/tracks/{id}",
+                "is_local": False,
+                "artists": [{"name": artist} for artist in artists],
+            }
+        )
+
+    def test__nominal(self) -> None:
+        user_id = uuid.uuid4()
+        spotify_tracks = [
+            self.build_spotify_track(id="1", name="Song (feat. B)", artists=["Artist A", "Artist B"]),
+            self.build_spotify_track(id="2", name="Other Song", artists=["Artist C"]),
+        ]
+
+        tracks = to_domain_tracks(spotify_tracks, user_id=user_id)
+
+        assert [track.fingerprint for track in tracks] == ["song|artist a", "other song|artist c"]
+        assert [track.get_provider_id(MusicProvider.SPOTIFY) for track in tracks] == ["1", "2"]
+        assert all(track.user_id == user_id for track in tracks)
+
+    def test__no_artist(self) -> None:
+        spotify_track = self.build_spotify_track(id="1", name="Song", artists=[])
+
+        with pytest.raises(ValueError, match="Track must have at least one artist"):
+            to_domain_tracks([spotify_track], user_id=uuid.uuid4())
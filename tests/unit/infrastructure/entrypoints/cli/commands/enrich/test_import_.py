@@ -6,15 +6,15 @@ from unittest import mock
 import pytest
 from typer.testing import CliRunner
 
-from museflow.domain.enums import EnrichField
 from museflow.domain.enums import GenreTag
 from museflow.domain.enums import MoodTag
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
+from museflow.domain.value_objects.track import TrackPatchResult
 from museflow.infrastructure.entrypoints.cli.commands.enrich.import_ import EnrichImportResult
 from museflow.infrastructure.entrypoints.cli.commands.enrich.import_ import import_logic
 from museflow.infrastructure.entrypoints.cli.main import app
 
-from tests.unit.factories.entities.track import TrackFactory
 from tests.unit.factories.entities.user import UserFactory
 from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
 
@@ -180,9 +180,9 @@ class TestEnrichImportLogic:
         user = UserFactory.build()
         fingerprint = "test-fingerprint-xyz"
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [
-            TrackFactory.build(user_id=user.id, fingerprint=fingerprint, genres=[], moods=[])
-        ]
+        mock_track_repository.bulk_patch.return_value = TrackPatchResult(
+            matched_keys=frozenset([fingerprint]), unmatched_keys=frozenset()
+        )
 
         result = await import_logic(
             email="test@example.com",
@@ -190,9 +190,9 @@ class TestEnrichImportLogic:
         )
 
         assert result.imported_count == 1
-        updated_track = mock_track_repository.bulk_update.call_args.args[0][0]
-        assert updated_track.genres == [GenreTag.ROCK]
-        assert updated_track.moods == []
+        row = mock_track_repository.bulk_patch.call_args.kwargs["rows"][0]
+        assert row[TrackField.GENRES] == [GenreTag.ROCK]
+        assert row[TrackField.MOODS] == []
 
     async def test__non_list_genres_and_moods__silently_dropped(
         self,
@@ -202,9 +202,9 @@ class TestEnrichImportLogic:
         user = UserFactory.build()
         fingerprint = "test-fingerprint-xyz"
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [
-            TrackFactory.build(user_id=user.id, fingerprint=fingerprint, genres=[], moods=[])
-        ]
+        mock_track_repository.bulk_patch.return_value = TrackPatchResult(
+            matched_keys=frozenset([fingerprint]), unmatched_keys=frozenset()
+        )
 
         result = await import_logic(
             email="test@example.com",
@@ -212,9 +212,9 @@ class TestEnrichImportLogic:
         )
 
         assert result.imported_count == 1
-        updated_track = mock_track_repository.bulk_update.call_args.args[0][0]
-        assert updated_track.genres == []
-        assert updated_track.moods == []
+        row = mock_track_repository.bulk_patch.call_args.kwargs["rows"][0]
+        assert row[TrackField.GENRES] == []
+        assert row[TrackField.MOODS] == []
 
     async def test__fingerprint_not_found(
         self,
@@ -222,7 +222,9 @@ class TestEnrichImportLogic:
         mock_track_repository: mock.AsyncMock,
     ) -> None:
         mock_user_repository.get_by_email.return_value = UserFactory.build()
-        mock_track_repository.get_list.return_value = []
+        mock_track_repository.bulk_patch.return_value = TrackPatchResult(
+            matched_keys=frozenset(), unmatched_keys=frozenset(["unknown-fp"])
+        )
 
         result = await import_logic(
             email="test@example.com",
@@ -231,7 +233,6 @@ class TestEnrichImportLogic:
 
         assert result.imported_count == 0
         assert result.not_found_count == 1
-        mock_track_repository.bulk_update.assert_not_awaited()
 
     async def test__nominal(
         self,
@@ -241,9 +242,9 @@ class TestEnrichImportLogic:
         user = UserFactory.build()
         fingerprint = "test-fingerprint-abc"
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [
-            TrackFactory.build(user_id=user.id, fingerprint=fingerprint, genres=[], moods=[])
-        ]
+        mock_track_repository.bulk_patch.return_value = TrackPatchResult(
+            matched_keys=frozenset([fingerprint]), unmatched_keys=frozenset()
+        )
 
         result = await import_logic(
             email="test@example.com",
@@ -253,9 +254,12 @@ class TestEnrichImportLogic:
         assert result.imported_count == 1
         assert result.not_found_count == 0
 
-        mock_track_repository.bulk_update.assert_awaited_once()
-        call_args = mock_track_repository.bulk_update.call_args
-        assert call_args.kwargs["fields"] == frozenset(EnrichField)
-        updated_track = call_args.args[0][0]
-        assert updated_track.genres == [GenreTag.ROCK, GenreTag.INDIE_ROCK]
-        assert updated_track.moods == [MoodTag.ENERGETIC]
+        mock_track_repository.bulk_patch.assert_awaited_once()
+        call_args = mock_track_repository.bulk_patch.call_args
+        assert call_args.kwargs["user_id"] == user.id
+        assert call_args.kwargs["key"] == TrackField.FINGERPRINT
+        assert call_args.kwargs["fields"] == frozenset([TrackField.GENRES, TrackField.MOODS, TrackField.LOCALE])
+        row = call_args.kwargs["rows"][0]
+        assert row[TrackField.FINGERPRINT] == fingerprint
+        assert row[TrackField.GENRES] == [GenreTag.ROCK, GenreTag.INDIE_ROCK]
+        assert row[TrackField.MOODS] == [MoodTag.ENERGETIC]
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 from typer.testing import CliRunner
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.enums import EnrichField
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.enrich.tracks import EnrichTracksReport
@@ -124,7 +125,7 @@ class TestEnrichTracksLogic:
 
         mock_track_repository.get_list.assert_awaited_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
-            missing_fields=None,
+            track_filter=TrackFilter(),
             limit=100,
         )
 
@@ -142,7 +143,7 @@ class TestEnrichTracksLogic:
 
         mock_track_repository.get_list.assert_awaited_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
-            missing_fields=frozenset({EnrichField.LOCALE}),
+            track_filter=TrackFilter(missing_fields=frozenset({EnrichField.LOCALE})),
             limit=None,
         )
 
@@ -157,6 +158,6 @@ class TestEnrichTracksLogic:
 
         mock_track_repository.get_list.assert_awaited_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
-            missing_fields=frozenset(EnrichField),
+            track_filter=TrackFilter(missing_fields=frozenset(EnrichField)),
             limit=None,
         )
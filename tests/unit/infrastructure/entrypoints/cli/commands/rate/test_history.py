@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 from typer.testing import CliRunner
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.entities.track import Track
 from museflow.domain.entities.user import User
 from museflow.domain.enums import MusicProvider
@@ -380,12 +381,14 @@ class TestRateHistoryLogic:
 
         mock_track_repository.get_list.assert_awaited_once_with(
             user_id=user.id,
-            source=TrackSource.HISTORY,
-            unrated_only=True,
-            exclude_skipped=True,
+            track_filter=TrackFilter(
+                source=TrackSource.HISTORY,
+                unrated_only=True,
+                exclude_skipped=True,
+                artist_name="Radiohead",
+            ),
             order=mock.ANY,
             limit=10,
-            artist_name="Radiohead",
         )
 
     async def test__play__no_active_device__retry_fails__stops_loop(
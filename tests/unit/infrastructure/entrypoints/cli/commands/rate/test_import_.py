@@ -8,12 +8,14 @@ from pydantic import ValidationError
 import pytest
 from typer.testing import CliRunner
 
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
+from museflow.domain.value_objects.track import TrackKnowIdentifiers
+from museflow.domain.value_objects.track import TrackPatchResult
 from museflow.infrastructure.entrypoints.cli.commands.rate.import_ import RateImportResult
 from museflow.infrastructure.entrypoints.cli.commands.rate.import_ import import_logic
 from museflow.infrastructure.entrypoints.cli.main import app
 
-from tests.unit.factories.entities.track import TrackFactory
 from tests.unit.factories.entities.user import UserFactory
 from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
 
@@ -172,7 +174,10 @@ class TestRateImportLogic:
     ) -> None:
         user = UserFactory.build()
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = []
+        mock_track_repository.bulk_patch.side_effect = [
+            TrackPatchResult(matched_keys=frozenset(), unmatched_keys=frozenset()),
+            TrackPatchResult(matched_keys=frozenset(), unmatched_keys=frozenset(["unknown-fp"])),
+        ]
 
         result = await import_logic(
             email="test@example.com",
@@ -181,7 +186,6 @@ class TestRateImportLogic:
 
         assert result.imported_count == 0
         assert result.not_found_count == 1
-        mock_track_repository.rate.assert_not_awaited()
 
     async def test__invalid_data(
         self,
@@ -201,27 +205,45 @@ class TestRateImportLogic:
         with pytest.raises(UserNotFound):
             await import_logic(email="test@example.com", data=[])
 
-    async def test__score_skipped_entry__calls_skip(
+    async def test__nominal(
         self,
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
         user = UserFactory.build()
-        fingerprint = "test-fingerprint-abc"
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [
-            TrackFactory.build(user_id=user.id, fingerprint=fingerprint, score_skipped=False)
+        mock_track_repository.bulk_patch.side_effect = [
+            TrackPatchResult(matched_keys=frozenset(["fp-skipped"]), unmatched_keys=frozenset()),
+            TrackPatchResult(matched_keys=frozenset(["fp-rated"]), unmatched_keys=frozenset(["fp-unknown"])),
         ]
 
         result = await import_logic(
             email="test@example.com",
-            data=[{"fingerprint": fingerprint, "score_skipped": True}],
+            data=[
+                {"fingerprint": "fp-rated", "score": 7},
+                {"fingerprint": "fp-skipped", "score": 3, "score_skipped": True},
+                {"fingerprint": "fp-unknown", "score": 5},
+            ],
         )
 
-        mock_track_repository.skip.assert_awaited_once()
-        mock_track_repository.rate.assert_not_awaited()
-        assert result.skipped_count == 1
-        assert result.imported_count == 0
+        assert result == RateImportResult(imported_count=1, skipped_count=1, not_found_count=1)
+        assert mock_track_repository.bulk_patch.await_args_list == [
+            mock.call(
+                user_id=user.id,
+                rows=[{TrackField.FINGERPRINT: "fp-skipped", TrackField.SCORE_SKIPPED: True}],
+                fields=frozenset([TrackField.SCORE_SKIPPED]),
+                key=TrackField.FINGERPRINT,
+            ),
+            mock.call(
+                user_id=user.id,
+                rows=[
+                    {TrackField.FINGERPRINT: "fp-rated", TrackField.SCORE: 7},
+                    {TrackField.FINGERPRINT: "fp-unknown", TrackField.SCORE: 5},
+                ],
+                fields=frozenset([TrackField.SCORE]),
+                key=TrackField.FINGERPRINT,
+            ),
+        ]
 
     async def test__entry_with_no_score_and_not_skipped__is_ignored(
         self,
@@ -231,17 +253,40 @@ class TestRateImportLogic:
         user = UserFactory.build()
         fingerprint = "test-fingerprint-noop"
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [
-            TrackFactory.build(user_id=user.id, fingerprint=fingerprint, score_skipped=False)
-        ]
+        mock_track_repository.bulk_patch.return_value = TrackPatchResult(
+            matched_keys=frozenset(), unmatched_keys=frozenset()
+        )
+        mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(
+            fingerprints=frozenset([fingerprint])
+        )
 
         result = await import_logic(
             email="test@example.com",
             data=[{"fingerprint": fingerprint}],
         )
 
-        mock_track_repository.skip.assert_not_awaited()
-        mock_track_repository.rate.assert_not_awaited()
-        assert result.skipped_count == 0
-        assert result.imported_count == 0
-        assert result.not_found_count == 0
+        for call in mock_track_repository.bulk_patch.await_args_list:
+            assert call.kwargs["rows"] == []
+        mock_track_repository.get_known_identifiers.assert_awaited_once_with(
+            user_id=user.id, fingerprints=[fingerprint]
+        )
+        assert result == RateImportResult(imported_count=0, skipped_count=0, not_found_count=0)
+
+    async def test__entry_with_no_score_and_not_skipped__not_found(
+        self,
+        mock_user_repository: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+    ) -> None:
+        mock_user_repository.get_by_email.return_value = UserFactory.build()
+        mock_track_repository.bulk_patch.return_value = TrackPatchResult(
+            matched_keys=frozenset(), unmatched_keys=frozenset()
+        )
+        mock_track_repository.get_known_identifiers.return_value = TrackKnowIdentifiers(fingerprints=frozenset())
+
+        result = await import_logic(
+            email="test@example.com",
+            data=[{"fingerprint": "unknown-fp"}],
+        )
+
+        # Every entry is counted, even the ones with nothing to write.
+        assert result == RateImportResult(imported_count=0, skipped_count=0, not_found_count=1)
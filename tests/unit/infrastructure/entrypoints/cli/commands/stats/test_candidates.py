@@ -6,13 +6,15 @@ import pytest
 from typer.testing import CliRunner
 
 from museflow.domain.entities.user import User
+from museflow.domain.enums import ArtistOrderBy
+from museflow.domain.enums import TrackSource
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.entrypoints.cli.commands.stats import SourceFilter
 from museflow.infrastructure.entrypoints.cli.commands.stats.candidates import CandidateRow
 from museflow.infrastructure.entrypoints.cli.commands.stats.candidates import candidates_logic
 from museflow.infrastructure.entrypoints.cli.main import app
 
-from tests.unit.factories.entities.track import TrackFactory
+from tests.unit.factories.value_objects.track import ArtistAggregateFactory
 from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
 
 TARGET_PATH: Final[str] = "museflow.infrastructure.entrypoints.cli.commands.stats.candidates"
@@ -96,19 +98,13 @@ class TestStatsCandidatesLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        candidate_track = TrackFactory.build(artists=["Hidden Gem"], score=9)
-        popular_tracks = [TrackFactory.build(artists=["Big Name"], score=9) for _ in range(6)]
-        low_score_track = TrackFactory.build(artists=["Mediocre"], score=4)
+        aggregate = ArtistAggregateFactory.build(artist="Hidden Gem", rate_avg=9.0, rated_count=1, track_count=1)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [candidate_track] + popular_tracks + [low_score_track]
+        mock_track_repository.aggregate_by_artist.return_value = [aggregate]
 
         result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
 
-        assert len(result) == 1
-        assert result[0].artist == "Hidden Gem"
-        assert result[0].avg_score == 9.0
-        assert result[0].rated_count == 1
-        assert result[0].total_count == 1
+        assert result == [CandidateRow(artist="Hidden Gem", avg_score=9.0, rated_count=1, total_count=1)]
 
     async def test__user_not_found(self, mock_user_repository: mock.AsyncMock) -> None:
         mock_user_repository.get_by_email.return_value = None
@@ -121,42 +117,14 @@ class TestStatsCandidatesLogic:
                 min_avg=7.0,
             )
 
-    async def test__no_tracks(
+    async def test__no_artists(
         self,
         user: User,
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = []
-
-        result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
-
-        assert result == []
-
-    async def test__artist_with_too_many_tracks_excluded(
-        self,
-        user: User,
-        mock_user_repository: mock.AsyncMock,
-        mock_track_repository: mock.AsyncMock,
-    ) -> None:
-        tracks = [TrackFactory.build(artists=["Popular Artist"], score=9) for _ in range(6)]
-        mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = tracks
-
-        result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
-
-        assert result == []
-
-    async def test__artist_with_low_avg_excluded(
-        self,
-        user: User,
-        mock_user_repository: mock.AsyncMock,
-        mock_track_repository: mock.AsyncMock,
-    ) -> None:
-        track = TrackFactory.build(artists=["Mediocre Artist"], score=5)
-        mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track]
+        mock_track_repository.aggregate_by_artist.return_value = []
 
         result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
 
@@ -168,56 +136,30 @@ class TestStatsCandidatesLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        unrated = TrackFactory.build(artists=["Unknown Artist"], score=None)
+        aggregate = ArtistAggregateFactory.build(rate_avg=None, quality_score=None, rated_count=0)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [unrated]
+        mock_track_repository.aggregate_by_artist.return_value = [aggregate]
 
         result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
 
         assert result == []
 
-    async def test__sorted_by_avg_score_desc(
+    async def test__aggregation_delegated_to_repository(
         self,
         user: User,
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        track_a = TrackFactory.build(artists=["Artist A"], score=8)
-        track_b = TrackFactory.build(artists=["Artist B"], score=10)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_a, track_b]
-
-        result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
-
-        assert result[0].artist == "Artist B"
-        assert result[1].artist == "Artist A"
-
-    async def test__tiebreaker_by_artist_name(
-        self,
-        user: User,
-        mock_user_repository: mock.AsyncMock,
-        mock_track_repository: mock.AsyncMock,
-    ) -> None:
-        track_z = TrackFactory.build(artists=["Zara"], score=9)
-        track_a = TrackFactory.build(artists=["Aaron"], score=9)
-        mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_z, track_a]
-
-        result = await candidates_logic(email=user.email, limit=20, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
-
-        assert result[0].artist == "Aaron"
-        assert result[1].artist == "Zara"
-
-    async def test__limit_applied(
-        self,
-        user: User,
-        mock_user_repository: mock.AsyncMock,
-        mock_track_repository: mock.AsyncMock,
-    ) -> None:
-        tracks = [TrackFactory.build(artists=[f"Artist {i}"], score=9) for i in range(5)]
-        mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = tracks
-
-        result = await candidates_logic(email=user.email, limit=3, source=SourceFilter.ALL, max_tracks=5, min_avg=7.0)
-
-        assert len(result) == 3
+        mock_track_repository.aggregate_by_artist.return_value = []
+
+        await candidates_logic(email=user.email, limit=3, source=SourceFilter.HISTORY, max_tracks=5, min_avg=7.0)
+
+        mock_track_repository.aggregate_by_artist.assert_called_once_with(
+            user_id=user.id,
+            source=TrackSource.HISTORY,
+            max_tracks=5,
+            min_rate_avg=7.0,
+            order_by=ArtistOrderBy.RATE_AVG,
+            limit=3,
+        )
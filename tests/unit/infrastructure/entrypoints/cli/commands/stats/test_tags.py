@@ -0,0 +1,180 @@
+from collections.abc import Iterable
+from typing import Final
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from museflow.domain.entities.user import User
+from museflow.domain.enums import EnrichField
+from museflow.domain.enums import TagOrderBy
+from museflow.domain.enums import TrackSource
+from museflow.domain.exceptions import UserNotFound
+from museflow.infrastructure.entrypoints.cli.commands.stats.tags import TagRow
+from museflow.infrastructure.entrypoints.cli.commands.stats.tags import tags_logic
+from museflow.infrastructure.entrypoints.cli.main import app
+from museflow.infrastructure.entrypoints.cli.types import SourceFilter
+from museflow.infrastructure.entrypoints.cli.types import TagSortBy
+
+from tests.unit.factories.value_objects.track import TagAggregateFactory
+from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
+
+TARGET_PATH: Final[str] = "museflow.infrastructure.entrypoints.cli.commands.stats.tags"
+
+
+class TestStatsTagsParserCommand:
+    @pytest.fixture(autouse=True)
+    def mock_tags_logic(self) -> Iterable[mock.AsyncMock]:
+        with mock.patch(f"{TARGET_PATH}.tags_logic", new_callable=mock.AsyncMock) as patched:
+            patched.return_value = []
+            yield patched
+
+    def test__email__invalid(self, runner: CliRunner, clean_typer_text: TextCleaner) -> None:
+        result = runner.invoke(app, ["stats", "tags", "--email", "notanemail"])
+        assert result.exit_code != 0
+        output = clean_typer_text(result.output)
+        assert "Invalid value for '--email'" in output
+
+    def test__field__invalid(self, runner: CliRunner) -> None:
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com", "--field", "invalid"])
+        assert result.exit_code != 0
+
+    def test__source__invalid(self, runner: CliRunner) -> None:
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com", "--source", "invalid"])
+        assert result.exit_code != 0
+
+    def test__sort__invalid(self, runner: CliRunner) -> None:
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com", "--sort", "bad_value"])
+        assert result.exit_code != 0
+
+
+class TestStatsTagsCommand:
+    @pytest.fixture(autouse=True)
+    def mock_tags_logic(self) -> Iterable[mock.AsyncMock]:
+        with mock.patch(f"{TARGET_PATH}.tags_logic", new_callable=mock.AsyncMock) as patched:
+            yield patched
+
+    def test__no_tags(self, mock_tags_logic: mock.AsyncMock, runner: CliRunner) -> None:
+        mock_tags_logic.return_value = []
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com", "--field", "mood"])
+        assert result.exit_code == 0
+        assert "No mood stats found." in result.output
+
+    def test__with_tags_table(self, mock_tags_logic: mock.AsyncMock, runner: CliRunner) -> None:
+        rows = [
+            TagRow(tag="rock", rate_avg=7.5, rated_count=2, track_count=3, plays_count=12),
+            TagRow(tag="jazz", rate_avg=None, rated_count=0, track_count=1, plays_count=1),
+        ]
+        mock_tags_logic.return_value = rows
+
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com"])
+
+        assert result.exit_code == 0
+        assert "Top Genres" in result.output
+        assert "rock" in result.output
+        assert "7.5" in result.output
+        assert "jazz" in result.output
+        assert "—" in result.output
+        assert "Rated" in result.output
+        assert "Tracks" in result.output
+        assert "Played" in result.output
+
+    def test__user_not_found(
+        self,
+        mock_tags_logic: mock.AsyncMock,
+        runner: CliRunner,
+        clean_typer_text: TextCleaner,
+    ) -> None:
+        mock_tags_logic.side_effect = UserNotFound()
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com"])
+        assert result.exit_code != 0
+        output = clean_typer_text(result.output)
+        assert "User not found with email: test@example.com" in output
+
+    def test__generic_exception(
+        self,
+        mock_tags_logic: mock.AsyncMock,
+        runner: CliRunner,
+        clean_typer_text: TextCleaner,
+    ) -> None:
+        mock_tags_logic.side_effect = Exception("Boom")
+        result = runner.invoke(app, ["stats", "tags", "--email", "test@example.com"])
+        assert result.exit_code != 0
+        output = clean_typer_text(result.stderr)
+        assert "Error: Boom" in output
+
+
+@pytest.mark.usefixtures("mock_get_db", "mock_user_repository", "mock_track_repository")
+class TestStatsTagsLogic:
+    async def test__user_not_found(self, mock_user_repository: mock.AsyncMock) -> None:
+        mock_user_repository.get_by_email.return_value = None
+        with pytest.raises(UserNotFound):
+            await tags_logic(
+                email="test@example.com",
+                field=EnrichField.GENRE,
+                limit=20,
+                source=SourceFilter.ALL,
+                score_min=None,
+                score_max=None,
+                sort=TagSortBy.TRACK_COUNT,
+            )
+
+    async def test__nominal(
+        self,
+        user: User,
+        mock_user_repository: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+    ) -> None:
+        aggregates = [TagAggregateFactory.build(tag="rock"), TagAggregateFactory.build(tag="jazz", rate_avg=None)]
+        mock_user_repository.get_by_email.return_value = user
+        mock_track_repository.aggregate_by_tag.return_value = aggregates
+
+        result = await tags_logic(
+            email=user.email,
+            field=EnrichField.GENRE,
+            limit=20,
+            source=SourceFilter.ALL,
+            score_min=None,
+            score_max=None,
+            sort=TagSortBy.TRACK_COUNT,
+        )
+
+        assert result == [
+            TagRow(
+                tag=aggregate.tag,
+                rate_avg=aggregate.rate_avg,
+                rated_count=aggregate.rated_count,
+                track_count=aggregate.track_count,
+                plays_count=aggregate.plays_count,
+            )
+            for aggregate in aggregates
+        ]
+
+    async def test__aggregation_delegated_to_repository(
+        self,
+        user: User,
+        mock_user_repository: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+    ) -> None:
+        mock_user_repository.get_by_email.return_value = user
+        mock_track_repository.aggregate_by_tag.return_value = []
+
+        await tags_logic(
+            email=user.email,
+            field=EnrichField.LOCALE,
+            limit=10,
+            source=SourceFilter.HISTORY,
+            score_min=3,
+            score_max=8,
+            sort=TagSortBy.RATE_AVG,
+        )
+
+        mock_track_repository.aggregate_by_tag.assert_called_once_with(
+            user_id=user.id,
+            field=EnrichField.LOCALE,
+            source=TrackSource.HISTORY,
+            min_score=3,
+            max_score=8,
+            order_by=TagOrderBy.RATE_AVG,
+            limit=10,
+        )
@@ -1,12 +1,16 @@
 from collections.abc import Iterable
+from typing import Any
 from typing import Final
 from unittest import mock
 
 import pytest
 from typer.testing import CliRunner
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.entities.user import User
+from museflow.domain.enums import TrackField
 from museflow.domain.exceptions import UserNotFound
+from museflow.domain.types import TrackRow
 from museflow.infrastructure.entrypoints.cli.commands.stats.tracks import tracks_logic
 from museflow.infrastructure.entrypoints.cli.main import app
 from museflow.infrastructure.entrypoints.cli.types import TrackSortBy
@@ -17,6 +21,17 @@ from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
 TARGET_PATH: Final[str] = "museflow.infrastructure.entrypoints.cli.commands.stats.tracks"
 
 
+def _track_row(**kwargs: Any) -> TrackRow:
+    track = TrackFactory.build(**kwargs)
+    return TrackRow(
+        id=track.id,
+        name=track.name,
+        artists=track.artists,
+        score=track.score,
+        played_count=track.played_count,
+    )
+
+
 class TestStatsTracksParserCommand:
     @pytest.fixture(autouse=True)
     def mock_tracks_logic(self) -> Iterable[mock.AsyncMock]:
@@ -50,7 +65,7 @@ class TestStatsTracksCommand:
         assert "No rated tracks found." in result.output
 
     def test__with_tracks_table(self, mock_tracks_logic: mock.AsyncMock, runner: CliRunner) -> None:
-        track = TrackFactory.build(name="Song A", artists=["Artist X"], score=9, played_count=42)
+        track = _track_row(name="Song A", artists=["Artist X"], score=9, played_count=42)
         mock_tracks_logic.return_value = [track]
 
         result = runner.invoke(app, ["stats", "tracks", "--email", "test@example.com"])
@@ -106,7 +121,7 @@ class TestStatsTracksLogic:
         mock_track_repository: mock.AsyncMock,
     ) -> None:
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = []
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = []
 
         result = await tracks_logic(email=user.email, limit=20, score_min=None, score_max=None, sort=TrackSortBy.SCORE)
 
@@ -118,15 +133,15 @@ class TestStatsTracksLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        track_low = TrackFactory.build(artists=["Artist A"], score=5)
-        track_high = TrackFactory.build(artists=["Artist B"], score=9)
+        track_low = _track_row(artists=["Artist A"], score=5)
+        track_high = _track_row(artists=["Artist B"], score=9)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_low, track_high]
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = [[track_low, track_high]]
 
         result = await tracks_logic(email=user.email, limit=20, score_min=None, score_max=None, sort=TrackSortBy.SCORE)
 
-        assert result[0].score == 9
-        assert result[1].score == 5
+        assert result[0]["score"] == 9
+        assert result[1]["score"] == 5
 
     async def test__tiebreaker_by_artist(
         self,
@@ -134,15 +149,15 @@ class TestStatsTracksLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        track_z = TrackFactory.build(artists=["Zara"], score=8)
-        track_a = TrackFactory.build(artists=["Aaron"], score=8)
+        track_z = _track_row(artists=["Zara"], score=8)
+        track_a = _track_row(artists=["Aaron"], score=8)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_z, track_a]
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = [[track_z, track_a]]
 
         result = await tracks_logic(email=user.email, limit=20, score_min=None, score_max=None, sort=TrackSortBy.SCORE)
 
-        assert result[0].artists[0] == "Aaron"
-        assert result[1].artists[0] == "Zara"
+        assert result[0]["artists"][0] == "Aaron"
+        assert result[1]["artists"][0] == "Zara"
 
     async def test__returns_tracks_sorted_by_played_count_desc(
         self,
@@ -150,17 +165,17 @@ class TestStatsTracksLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        track_low = TrackFactory.build(artists=["Artist A"], played_count=2)
-        track_high = TrackFactory.build(artists=["Artist B"], played_count=9)
+        track_low = _track_row(artists=["Artist A"], played_count=2)
+        track_high = _track_row(artists=["Artist B"], played_count=9)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_low, track_high]
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = [[track_low, track_high]]
 
         result = await tracks_logic(
             email=user.email, limit=20, score_min=None, score_max=None, sort=TrackSortBy.PLAYED_COUNT
         )
 
-        assert result[0].played_count == 9
-        assert result[1].played_count == 2
+        assert result[0]["played_count"] == 9
+        assert result[1]["played_count"] == 2
 
     async def test__tiebreaker_by_artist_when_sorted_by_played_count(
         self,
@@ -168,17 +183,17 @@ class TestStatsTracksLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        track_z = TrackFactory.build(artists=["Zara"], played_count=4)
-        track_a = TrackFactory.build(artists=["Aaron"], played_count=4)
+        track_z = _track_row(artists=["Zara"], played_count=4)
+        track_a = _track_row(artists=["Aaron"], played_count=4)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_z, track_a]
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = [[track_z, track_a]]
 
         result = await tracks_logic(
             email=user.email, limit=20, score_min=None, score_max=None, sort=TrackSortBy.PLAYED_COUNT
         )
 
-        assert result[0].artists[0] == "Aaron"
-        assert result[1].artists[0] == "Zara"
+        assert result[0]["artists"][0] == "Aaron"
+        assert result[1]["artists"][0] == "Zara"
 
     async def test__limit_applied_after_sorting(
         self,
@@ -186,15 +201,29 @@ class TestStatsTracksLogic:
         mock_user_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
     ) -> None:
-        track_low = TrackFactory.build(artists=["Artist A"], score=5)
-        track_high = TrackFactory.build(artists=["Artist B"], score=9)
+        track_low = _track_row(artists=["Artist A"], score=5)
+        track_high = _track_row(artists=["Artist B"], score=9)
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = [track_low, track_high]
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = [[track_low, track_high]]
 
         result = await tracks_logic(email=user.email, limit=1, score_min=None, score_max=None, sort=TrackSortBy.SCORE)
 
         assert result == [track_high]
 
+    async def test__limit_applied_across_chunks(
+        self,
+        user: User,
+        mock_user_repository: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+    ) -> None:
+        tracks = [_track_row(artists=["Artist A"], score=score) for score in (3, 8, 5, 9, 1, 7)]
+        mock_user_repository.get_by_email.return_value = user
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = [tracks[:2], tracks[2:4], tracks[4:]]
+
+        result = await tracks_logic(email=user.email, limit=3, score_min=None, score_max=None, sort=TrackSortBy.SCORE)
+
+        assert [t["score"] for t in result] == [9, 8, 7]
+
     async def test__score_min_passed_to_repository(
         self,
         user: User,
@@ -202,12 +231,14 @@ class TestStatsTracksLogic:
         mock_track_repository: mock.AsyncMock,
     ) -> None:
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = []
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = []
 
         await tracks_logic(email=user.email, limit=20, score_min=7, score_max=None, sort=TrackSortBy.SCORE)
 
-        mock_track_repository.get_list.assert_awaited_once_with(
-            user_id=user.id, min_score=7, max_score=None, limit=None
+        mock_track_repository.iter_rows.assert_called_once_with(
+            fields=[TrackField.ID, TrackField.NAME, TrackField.ARTISTS, TrackField.SCORE, TrackField.PLAYED_COUNT],
+            user_id=user.id,
+            track_filter=TrackFilter(min_score=7),
         )
 
     async def test__score_min_defaults_to_zero_when_none(
@@ -217,10 +248,12 @@ class TestStatsTracksLogic:
         mock_track_repository: mock.AsyncMock,
     ) -> None:
         mock_user_repository.get_by_email.return_value = user
-        mock_track_repository.get_list.return_value = []
+        mock_track_repository.iter_rows.return_value.__aiter__.return_value = []
 
         await tracks_logic(email=user.email, limit=20, score_min=None, score_max=None, sort=TrackSortBy.SCORE)
 
-        mock_track_repository.get_list.assert_awaited_once_with(
-            user_id=user.id, min_score=0, max_score=None, limit=None
+        mock_track_repository.iter_rows.assert_called_once_with(
+            fields=[TrackField.ID, TrackField.NAME, TrackField.ARTISTS, TrackField.SCORE, TrackField.PLAYED_COUNT],
+            user_id=user.id,
+            track_filter=TrackFilter(min_score=0),
         )
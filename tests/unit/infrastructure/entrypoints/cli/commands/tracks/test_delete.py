@@ -6,6 +6,7 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
+from museflow.application.inputs.track import TrackFilter
 from museflow.domain.entities.track import Track
 from museflow.domain.enums import MusicProvider
 from museflow.domain.enums import TrackSource
@@ -271,9 +272,7 @@ class TestDeleteLogic:
 
         mock_track_repository.get_list.assert_called_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
-            artist_name="Radiohead",
-            source=TrackSource.HISTORY,
-            provider=None,
+            track_filter=TrackFilter(artist_name="Radiohead", source=TrackSource.HISTORY, provider=None),
         )
         mock_track_repository.delete.assert_called_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
@@ -303,9 +302,7 @@ class TestDeleteLogic:
 
         mock_track_repository.get_list.assert_called_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
-            artist_name=None,
-            source=None,
-            provider=MusicProvider.SPOTIFY,
+            track_filter=TrackFilter(provider=MusicProvider.SPOTIFY),
         )
         mock_track_repository.delete.assert_called_once_with(
             user_id=mock_user_repository.get_by_email.return_value.id,
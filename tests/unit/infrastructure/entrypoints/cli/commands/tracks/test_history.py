@@ -36,6 +36,7 @@ class TestHistoryParserCommand:
                 "--directory", str(tmp_path),
                 "--min-duration-played", "10",
                 "--batch-size", "50",
+                "--jobs", "4",
                 "--purge",
             ],
         )
@@ -103,7 +104,7 @@ class TestHistoryParserCommand:
         [
             pytest.param(0, "Invalid value for '--batch-size': 0 is not in the range", id="zero"),
             pytest.param(-15, "Invalid value for '--batch-size': -15 is not in the range", id="min_exceed"),
-            pytest.param(1000, "Invalid value for '--batch-size': 1000 is not in the range", id="max_exceed"),
+            pytest.param(100_000, "Invalid value for '--batch-size': 100000 is not in the range", id="max_exceed"),
             pytest.param("foo", "Invalid value for '--batch-size': 'foo' is not a valid integer", id="string"),
         ],
     )
@@ -130,6 +131,36 @@ class TestHistoryParserCommand:
         output = clean_typer_text(result.output)
         assert expected_msg in output
 
+    @pytest.mark.parametrize(
+        ("jobs", "expected_msg"),
+        [
+            pytest.param(0, "Invalid value for '--jobs': 0 is not in the range", id="zero"),
+            pytest.param(-2, "Invalid value for '--jobs': -2 is not in the range", id="min_exceed"),
+        ],
+    )
+    def test__jobs__invalid(
+        self,
+        runner: CliRunner,
+        jobs: Any,
+        expected_msg: str,
+        clean_typer_text: TextCleaner,
+    ) -> None:
+        # fmt: off
+        result = runner.invoke(
+            app,
+            [
+                "tracks", "history",
+                "--email", "test@example.com",
+                "--directory", "/tmp",
+                "--jobs", jobs,
+            ],
+        )
+        # fmt: on
+        assert result.exit_code != 0
+
+        output = clean_typer_text(result.output)
+        assert expected_msg in output
+
 
 class TestHistoryCommand:
     @pytest.fixture(autouse=True)
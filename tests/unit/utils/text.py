@@ -0,0 +1,16 @@
+import re
+
+from museflow.domain.utils.text import unidecode_lower_text
+
+
+def reference_normalize_text(text: str) -> str:
+    """
+    The original multi-pass implementation of `normalize_text`, frozen as is.
+
+    The stored fingerprints were computed with it: the optimized implementation must return the exact same output.
+    """
+    text = unidecode_lower_text(text)
+    text = re.sub(r"[\(\[].*?(feat\.?|ft\.?|remaster|live|edit|version).*?[\)\]]", "", text)
+    text = re.sub(r"\s*-\s*.*?(feat\.?|ft\.?|remaster|live|edit|version|mono|stereo).*", "", text)
+    text = re.sub(r"[^\w\s]", "", text)
+    return " ".join(text.split())